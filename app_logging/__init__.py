@@ -1,8 +1,9 @@
 """アプリケーション向けのロギング補助機能パッケージ。"""
 
-from .handlers import attach_gui_handler, log_user_action
+from .handlers import attach_gui_handler, log_user_action, start_queue_handler
 
 __all__ = [
     "attach_gui_handler",
     "log_user_action",
+    "start_queue_handler",
 ]
@@ -2,20 +2,97 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Mapping, Optional
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from types import ModuleType
+from typing import Any, Callable, Mapping, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 任意依存
+    _orjson: Optional[ModuleType] = None
+else:
+    _orjson = orjson
+
+# detail無しの操作ログで共通となるJSON末尾。
+_EMPTY_DETAIL_SUFFIX = '","detail":{}}'
+# シリアライズ専用の共有空辞書。変更してはならない。
+_EMPTY_DETAIL: Mapping[str, Any] = {}
+
+# 操作ログ用ロガーは初回利用時に一度だけ構成する。
+_USER_ACTION_LOGGER: Optional[logging.Logger] = None
+_USER_ACTION_LOGGER_LOCK = threading.Lock()
 
 
 class _StatusBarHandler(logging.Handler):
     """Qtのステータスバーへログメッセージを転送するハンドラ。"""
 
+    # 連続したログを1回の再描画へまとめる間隔(ミリ秒)。
+    _FLUSH_INTERVAL_MS = 16
+
     def __init__(self, status_bar: Any, timeout_ms: int = 5000) -> None:
         super().__init__(level=logging.INFO)
         self._status_bar = status_bar
         self._timeout_ms = timeout_ms
+        self._pending = ""
+        self._flush_scheduled = False
+        self._pending_lock = threading.Lock()
+        # GUIスレッドで生成したタイマー経由で表示を間引く。Qtが使えない場合は直接表示する。
+        self._schedule_flush = self._create_flush_scheduler(status_bar)
 
     def emit(self, record: logging.LogRecord) -> None:
         """ログレコードを受け取りステータスバーへ表示する。"""
-        message = self.format(record)
+        # 書式は固定のため、Formatterを経由せずに直接組み立てる。
+        message = f"{record.levelname}: {record.getMessage()}"
+        if self._schedule_flush is None:
+            self._show_message(message)
+            return
+
+        # 最新のメッセージのみ保持し、未予約の場合だけGUIスレッドへ反映を予約する。
+        with self._pending_lock:
+            self._pending = message
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+
+        try:
+            self._schedule_flush()
+        except Exception:  # noqa: BLE001
+            logging.getLogger("my_editor").debug(
+                "ステータスバー更新の予約に失敗しました。", exc_info=True
+            )
+
+    def _create_flush_scheduler(self, status_bar: Any) -> Optional[Callable[[], None]]:
+        """ステータスバーと同じスレッドで動作する単発タイマーの起動関数を生成する。"""
+        try:
+            from PySide6.QtCore import QMetaObject, QObject, Qt, QTimer
+        except ImportError:
+            return None
+
+        if not isinstance(status_bar, QObject):
+            return None
+
+        timer = QTimer(status_bar)
+        timer.setSingleShot(True)
+        timer.setInterval(self._FLUSH_INTERVAL_MS)
+        timer.timeout.connect(self._flush_pending)
+
+        def _schedule() -> None:
+            # 発行元スレッドに依らず、タイマーの開始はキュー接続でGUIスレッドへ委ねる。
+            QMetaObject.invokeMethod(timer, "start", Qt.ConnectionType.QueuedConnection)
+
+        return _schedule
+
+    def _flush_pending(self) -> None:
+        """保留中の最新メッセージをステータスバーへ反映する。"""
+        with self._pending_lock:
+            message = self._pending
+            self._flush_scheduled = False
+        self._show_message(message)
+
+    def _show_message(self, message: str) -> None:
+        """ステータスバーへメッセージを表示する。"""
         try:
             self._status_bar.showMessage(message, self._timeout_ms)
         except Exception:  # noqa: BLE001
@@ -24,6 +101,52 @@ class _StatusBarHandler(logging.Handler):
             )
 
 
+class _ListenerQueueHandler(QueueHandler):
+    """バックグラウンドのQueueListenerと寿命を共有するQueueHandler。"""
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord], listener: QueueListener) -> None:
+        super().__init__(log_queue)
+        self._log_queue = log_queue
+        self._listener: Optional[QueueListener] = listener
+
+    def flush(self) -> None:
+        """キューに滞留しているレコードを出力し終えるまで待機する。"""
+        if self._listener is None:
+            return
+        # リスナーはレコードごとにtask_doneを呼ぶため、joinでスレッドを止めずに処理済みを待てる。
+        self._log_queue.join()
+
+    def close(self) -> None:
+        """リスナーを停止して滞留中のレコードを処理し、配下のハンドラもクローズする。"""
+        self.acquire()
+        try:
+            listener, self._listener = self._listener, None
+        finally:
+            self.release()
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        super().close()
+
+
+def start_queue_handler(*handlers: logging.Handler) -> QueueHandler:
+    """指定ハンドラを別スレッドで処理するQueueHandlerを生成する。
+
+    Args:
+        *handlers (logging.Handler): バックグラウンドで出力を担当するハンドラ。
+
+    Returns:
+        QueueHandler: ロガーへ追加するハンドラ。クローズ時にリスナーと配下のハンドラも停止する。
+    """
+    # 呼び出し側はキューへの投入のみを行い、整形とI/OはQueueListenerへ委ねる。
+    # flushでjoinにより滞留分の処理完了を待てるよう、task_doneを持つQueueを使う。
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return _ListenerQueueHandler(log_queue, listener)
+
+
 def attach_gui_handler(window: Any, *, timeout_ms: int = 5000) -> logging.Handler:
     """GUIウィンドウにログ表示ハンドラをアタッチする。"""
     if window is None:
@@ -37,9 +160,11 @@ def attach_gui_handler(window: Any, *, timeout_ms: int = 5000) -> logging.Handle
     if status_bar is None:
         raise ValueError("statusBar() が None を返しました。")
 
-    handler = _StatusBarHandler(status_bar=status_bar, timeout_ms=timeout_ms)
+    status_handler = _StatusBarHandler(status_bar=status_bar, timeout_ms=timeout_ms)
+    status_handler.setLevel(logging.INFO)
+
+    handler = start_queue_handler(status_handler)
     handler.setLevel(logging.INFO)
-    handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
 
     logger = logging.getLogger("my_editor")
     if logger.level > logging.INFO or logger.level == logging.NOTSET:
@@ -48,23 +173,93 @@ def attach_gui_handler(window: Any, *, timeout_ms: int = 5000) -> logging.Handle
     return handler
 
 
-def log_user_action(action: str, detail: Optional[Mapping[str, Any]] = None) -> None:
-    """ユーザー操作をJSON形式でロギングする。"""
+def log_user_action(
+    action: str,
+    detail: Optional[Mapping[str, Any]] = None,
+    *,
+    fmt: str = "json",
+) -> None:
+    """ユーザー操作をロギングする。
+
+    Args:
+        action: 操作名。
+        detail: 操作の付加情報。
+        fmt: 出力形式。``"json"`` (既定) または ``"text"`` (``key=value`` 形式)。
+    """
     if not action:
         raise ValueError("action を指定してください。")
 
+    if fmt == "json":
+        message = _format_action_json(action, detail)
+    elif fmt == "text":
+        message = _format_action_text(action, detail)
+    else:
+        raise ValueError(f"未対応の出力形式です: {fmt}")
+
+    _get_user_action_logger().info(message)
+
+
+def _format_action_json(action: str, detail: Optional[Mapping[str, Any]]) -> str:
+    """操作ログをJSON文字列へ変換する。"""
+    # エスケープ不要なactionのみでdetailが無い場合はエンコーダを経由せず組み立てる。
+    if detail is None and action.isascii() and action.isprintable() and '"' not in action and "\\" not in action:
+        return '{"action":"' + action + _EMPTY_DETAIL_SUFFIX
+
+    # エンコーダは入力を変更しないため、dictはコピーせずそのまま渡す。
+    if isinstance(detail, dict):
+        payload_detail: Mapping[str, Any] = detail
+    elif detail is not None:
+        payload_detail = dict(detail)
+    else:
+        payload_detail = _EMPTY_DETAIL
     payload = {
         "action": action,
-        "detail": dict(detail) if detail is not None else {},
+        "detail": payload_detail,
     }
-    message = json.dumps(payload, ensure_ascii=False, sort_keys=True)
 
-    logger = logging.getLogger("my_editor.user_action")
-    logger.setLevel(logging.INFO)
-    if not logger.handlers:
-        stream_handler = logging.StreamHandler()
-        stream_handler.setFormatter(logging.Formatter("%(message)s"))
-        logger.addHandler(stream_handler)
-        logger.propagate = False
+    # orjsonが利用可能な場合はC実装でシリアライズし、無ければ標準ライブラリへフォールバックする。
+    if _orjson is not None:
+        encoded: bytes = _orjson.dumps(payload, option=_orjson.OPT_SORT_KEYS | _orjson.OPT_NON_STR_KEYS)
+        return encoded.decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+
+def _format_action_text(action: str, detail: Optional[Mapping[str, Any]]) -> str:
+    """操作ログを ``action=foo key=value`` 形式の文字列へ変換する。"""
+    parts = ["action=", _format_text_value(action)]
+    if detail:
+        for key, value in detail.items():
+            parts.append(" ")
+            parts.append(str(key))
+            parts.append("=")
+            parts.append(_format_text_value(value))
+    return "".join(parts)
+
+
+def _format_text_value(value: Any) -> str:
+    """空白や引用符を含まない文字列はそのまま、それ以外はJSONとして出力する。"""
+    if isinstance(value, str) and value and '"' not in value and not any(ch.isspace() for ch in value):
+        return value
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _get_user_action_logger() -> logging.Logger:
+    """操作ログ用ロガーを取得し、未構成の場合は一度だけ初期化する。"""
+    global _USER_ACTION_LOGGER
+
+    logger = _USER_ACTION_LOGGER
+    if logger is not None:
+        return logger
 
-    logger.info(message)
+    with _USER_ACTION_LOGGER_LOCK:
+        if _USER_ACTION_LOGGER is None:
+            logger = logging.getLogger("my_editor.user_action")
+            logger.setLevel(logging.INFO)
+            # 外部でハンドラが構成済みの場合はそれを尊重する。
+            if not logger.handlers:
+                stream_handler = logging.StreamHandler()
+                stream_handler.setFormatter(logging.Formatter("%(message)s"))
+                logger.addHandler(start_queue_handler(stream_handler))
+                logger.propagate = False
+            _USER_ACTION_LOGGER = logger
+        return _USER_ACTION_LOGGER
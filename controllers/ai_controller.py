@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
 from typing import Any, Iterable, Iterator, Optional, Protocol
 
 from exceptions import AIIntegrationError
@@ -14,7 +16,7 @@ class AIClientProtocol(Protocol):
         """単一応答を同期的に生成する。"""
 
     def stream(self, model: str, prompt: str) -> Iterable[str]:
-        """ストリーム形式で応答を生成する。"""
+        """ストリーム形式で応答を生成する。空文字列のチャンクは返さない。"""
 
 
 class AIController:
@@ -37,55 +39,62 @@ class AIController:
 
     def generate_code(self, prompt: str) -> str:
         """コード生成リクエストを実行し、結果文字列を返す。"""
-        prompt = prompt.strip()
-        if not prompt:
-            raise ValueError("プロンプトが空です。")
+        prompt = _normalize_prompt(prompt)
 
-        self._logger.info("コード生成リクエストを送信します。")
+        # ログレベルはリクエスト単位で1回だけ判定する。ワーカースレッドからも呼ばれるため局所変数に保持する。
+        info_enabled = self._logger.isEnabledFor(logging.INFO)
+        if info_enabled:
+            self._logger.info("コード生成リクエストを送信します。")
         try:
             result = self._get_client().generate(self._model, prompt)
         except Exception as exc:  # pylint: disable=broad-except
             self._logger.error("コード生成に失敗しました。", exc_info=exc)
             raise AIIntegrationError("コード生成に失敗しました。") from exc
 
-        self._logger.info("コード生成が完了しました。")
+        if info_enabled:
+            self._logger.info("コード生成が完了しました。")
         return result
 
     def stream_chat(self, prompt: str) -> Iterator[str]:
         """チャット応答をストリームで取得する。"""
-        prompt = prompt.strip()
-        if not prompt:
-            raise ValueError("プロンプトが空です。")
+        prompt = _normalize_prompt(prompt)
 
-        self._logger.info("チャットストリームを開始します。")
+        # ストリーム中は書式化コストを避けるため、開始・終了ログはDEBUGで1回だけ判定する。
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            self._logger.debug("チャットストリームを開始します。")
         try:
-            for chunk in self._get_client().stream(self._model, prompt):
-                if chunk:
-                    yield chunk
+            # クライアントは空文字列を返さない契約のため、そのまま委譲する。
+            yield from self._get_client().stream(self._model, prompt)
         except Exception as exc:  # pylint: disable=broad-except
             self._logger.error("チャットストリームに失敗しました。", exc_info=exc)
             raise AIIntegrationError("チャットストリームに失敗しました。") from exc
 
-        self._logger.info("チャットストリームが終了しました。")
+        if debug_enabled:
+            self._logger.debug("チャットストリームが終了しました。")
 
     def handle_chat_submit(self, message: str) -> str:
         """チャットメッセージを送信して応答を取得する。"""
-        normalized = message.strip()
-        if not normalized:
-            raise ValueError("メッセージが空です。")
+        normalized = _normalize_prompt(message, "メッセージが空です。")
 
-        self._logger.info("チャット補完リクエストを送信します。")
+        info_enabled = self._logger.isEnabledFor(logging.INFO)
+        if info_enabled:
+            self._logger.info("チャット補完リクエストを送信します。")
         try:
             response = self._get_client().generate(self._model, normalized)
         except Exception as exc:  # pylint: disable=broad-except
             self._logger.error("チャット応答の生成に失敗しました。", exc_info=exc)
             raise AIIntegrationError("チャット応答の生成に失敗しました。") from exc
 
-        self._logger.info("チャット応答を受信しました。")
+        if info_enabled:
+            self._logger.info("チャット応答を受信しました。")
         return response
 
     def reset_client(self) -> None:
-        """内部で保持しているクライアントを再生成できるようリセットする。"""
+        """内部で保持しているクライアントを再生成できるようリセットする。
+
+        共有しているOpenAIクライアントはここでは破棄せず、次回生成時にAPIキーが変わっていれば置き換える。
+        """
         if self._client_provided:
             self._logger.debug("外部提供のクライアントはリセット対象外です。")
             return
@@ -98,30 +107,88 @@ class AIController:
         return self._client
 
     def _build_default_client(self) -> AIClientProtocol:
-        """設定モデルからAPIキーを読み取りクライアントを生成する。"""
-        if self._settings_model is None:
-            raise AIIntegrationError("設定モデルが提供されていません。")
-
-        try:
-            api_key = self._settings_model.get_api_key()
-        except Exception as exc:  # noqa: BLE001
-            self._logger.error("APIキーの取得に失敗しました。", exc_info=exc)
-            raise AIIntegrationError("APIキーの取得に失敗しました。") from exc
-
-        if not api_key:
+        """設定モデルからAPIキーを読み取りクライアントを生成する。
+
+        設定モデルが無い場合は環境変数 ``OPENAI_API_KEY`` の値をSDKに委ねる。
+        APIキーが無い場合のみ未設定のエラーとし、それ以外の生成失敗は初期化エラーとして通知する。
+        """
+        api_key: Optional[str] = None
+        if self._settings_model is not None:
+            try:
+                api_key = self._settings_model.get_api_key()
+            except Exception as exc:  # noqa: BLE001
+                self._logger.error("APIキーの取得に失敗しました。", exc_info=exc)
+                raise AIIntegrationError("APIキーの取得に失敗しました。") from exc
+
+            if not api_key:
+                raise AIIntegrationError("OpenAI APIキーが設定されていません。")
+        elif not os.environ.get(_API_KEY_ENV):
             raise AIIntegrationError("OpenAI APIキーが設定されていません。")
 
         try:
-            from openai import OpenAI
+            client = _get_shared_openai_client(api_key)
         except ImportError as exc:  # pragma: no cover - 実運用依存
             raise AIIntegrationError("openaiパッケージがインストールされていません。") from exc
+        except Exception as exc:  # noqa: BLE001
+            self._logger.error("OpenAIクライアントの生成に失敗しました。", exc_info=exc)
+            raise AIIntegrationError("OpenAIクライアントの初期化に失敗しました。") from exc
+
+        return _OpenAIClientAdapter(client)
+
+
+def _normalize_prompt(prompt: str, empty_message: str = "プロンプトが空です。") -> str:
+    """前後の空白を除去し、空であれば ``ValueError`` を送出する。"""
+    normalized = prompt.strip()
+    if not normalized:
+        raise ValueError(empty_message)
+    return normalized
+
+
+# 設定モデルが無い場合にSDKが参照するAPIキーの環境変数名。
+_API_KEY_ENV = "OPENAI_API_KEY"
+
+# openaiパッケージは読み込みが重いため、初回利用時に一度だけインポートして保持する。
+_OPENAI_CLS: Optional[Any] = None
+
+# 接続プールを使い回すため、現在のAPIキーに対応するOpenAIクライアントを1つだけ共有する。
+# 要素は(APIキー, クライアント)で、APIキーのNoneは環境変数由来を表す。
+_shared_client: Optional[tuple[Optional[str], Any]] = None
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+
+def _load_openai_cls() -> Any:
+    """OpenAIクライアントクラスを遅延インポートして返す。"""
+    global _OPENAI_CLS
+
+    if _OPENAI_CLS is None:
+        from openai import OpenAI
+
+        _OPENAI_CLS = OpenAI
+    return _OPENAI_CLS
 
-        return _OpenAIClientAdapter(OpenAI(api_key=api_key))
+
+def _get_shared_openai_client(api_key: Optional[str]) -> Any:
+    """APIキーに対応する共有OpenAIクライアントを取得し、キーが変わった場合は生成し直す。
+
+    以前のキーのクライアントは参照を手放すのみとし、実行中のリクエストが終わった後に破棄させる。
+    """
+    global _shared_client
+
+    with _SHARED_CLIENT_LOCK:
+        if _shared_client is not None and _shared_client[0] == api_key:
+            return _shared_client[1]
+
+        openai_cls = _load_openai_cls()
+        client = openai_cls() if api_key is None else openai_cls(api_key=api_key)
+        _shared_client = (api_key, client)
+        return client
 
 
 class _OpenAIClientAdapter:
     """OpenAI公式クライアントをAIClientProtocolに適合させる。"""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: Any) -> None:
         self._client: Any = client
 
@@ -130,16 +197,12 @@ class _OpenAIClientAdapter:
         return _extract_text(response)
 
     def stream(self, model: str, prompt: str) -> Iterable[str]:
-        stream = self._client.responses.stream(model=model, input=prompt)
-        try:
+        # コンテキストマネージャで受け取り、消費側が途中で止めた場合も接続を確実に解放する。
+        with self._client.responses.stream(model=model, input=prompt) as stream:
             for event in stream:
                 text = _extract_stream_text(event)
                 if text:
                     yield text
-        finally:
-            close = getattr(stream, "close", None)
-            if callable(close):
-                close()
 
 
 def _extract_text(response: object) -> str:
@@ -147,51 +210,47 @@ def _extract_text(response: object) -> str:
     if isinstance(response, str):
         return response
 
-    if isinstance(response, dict):
-        return _extract_text_from_content(response)
-
-    output = getattr(response, "output", None) or getattr(response, "outputs", None)
-    if isinstance(output, list):
-        return "".join(_extract_text_from_content(item) for item in output)
-
-    text = getattr(response, "text", None)
-    if isinstance(text, str):
-        return text
-
-    content = getattr(response, "content", None) or getattr(response, "contents", None)
-    if isinstance(content, list):
-        return "".join(_extract_text_from_content(item) for item in content)
-
-    return str(response)
-
-
-def _extract_text_from_content(data: object) -> str:
-    """辞書もしくはオブジェクトからテキストを抽出する。"""
-    if isinstance(data, str):
-        return data
-
-    if isinstance(data, dict):
-        segments: list[str] = []
-        text = data.get("text")
-        if isinstance(text, str):
-            segments.append(text)
-        content = data.get("content") or data.get("contents")
-        if isinstance(content, list):
-            for entry in content:
-                extracted = _extract_text_from_content(entry)
-                if extracted:
-                    segments.append(extracted)
-        return "".join(segments)
-
-    text_attr = getattr(data, "text", None)
-    if isinstance(text_attr, str):
-        return text_attr
-
-    content_attr = getattr(data, "content", None) or getattr(data, "contents", None)
-    if isinstance(content_attr, list):
-        return "".join(_extract_text_from_content(entry) for entry in content_attr)
-
-    return str(data)
+    # 最上位オブジェクトはoutput配列を優先し、無ければtext属性を直接返す。
+    stack: list[object] = [response]
+    if not isinstance(response, dict):
+        output = getattr(response, "output", None) or getattr(response, "outputs", None)
+        if isinstance(output, list):
+            stack = output[::-1]
+        else:
+            text = getattr(response, "text", None)
+            if isinstance(text, str):
+                return text
+
+    # 再帰の代わりに明示的なスタックで走査し、単一のリストへ断片を集約する。
+    segments: list[str] = []
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            segments.append(item)
+            continue
+
+        if isinstance(item, dict):
+            text = item.get("text")
+            if isinstance(text, str):
+                segments.append(text)
+            content = item.get("content") or item.get("contents")
+            if isinstance(content, list):
+                stack.extend(reversed(content))
+            continue
+
+        text_attr = getattr(item, "text", None)
+        if isinstance(text_attr, str):
+            segments.append(text_attr)
+            continue
+
+        content_attr = getattr(item, "content", None) or getattr(item, "contents", None)
+        if isinstance(content_attr, list):
+            stack.extend(reversed(content_attr))
+            continue
+
+        segments.append(str(item))
+
+    return "".join(segments)
 
 
 def _extract_stream_text(event: object) -> str:
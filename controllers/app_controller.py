@@ -1,34 +1,173 @@
 from __future__ import annotations
 
+import io
 import logging
+import os
 import re
+import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterable, NamedTuple, Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThreadPool, QTimer
 from PySide6.QtWidgets import QApplication, QFileDialog
 
-from controllers.ai_controller import AIController
+from controllers.background import BackgroundRunner
 from controllers.event_bus import EventBus, Payload
-from controllers.file_controller import FileController
-from controllers.folder_controller import FolderController
-from controllers.settings_controller import SettingsController
-from controllers.tab_controller import TabController
-from models.file_model import FileModel
-from models.folder_model import FolderModel
-from models.tab_model import TabState
-from views.folder_tree import FolderTree
 from views.main_window import MainWindow
 from exceptions import FileOperationError, AIIntegrationError
 
+if TYPE_CHECKING:
+    # 具象クラスはDIで渡されない場合にのみ_initialize_controllers内で読み込む。
+    from controllers.ai_controller import AIController
+    from controllers.file_controller import FileController
+    from controllers.folder_controller import FolderController
+    from controllers.settings_controller import SettingsController
+    from controllers.tab_controller import TabController
+    from models.tab_model import TabState
+    from views.folder_tree import FolderTree
+
+
+# メインウィンドウの属性名、接続するシグナル名、ハンドラ名の対応表。
+# シグナル名がNoneの項目は属性そのものがシグナルであることを表す。
+_WINDOW_WIRING: tuple[tuple[str, Optional[str], str], ...] = (
+    ("action_open_file", "triggered", "_handle_open_file_action"),
+    ("action_new_file", "triggered", "_handle_new_file_action"),
+    ("action_open_folder", "triggered", "_handle_open_folder_action"),
+    ("action_save_file", "triggered", "_emit_save_requested"),
+    ("action_close_tab", "triggered", "_handle_close_tab_action"),
+    ("action_open_settings", "triggered", "_handle_open_settings_action"),
+    ("chat_submitted", None, "_handle_chat_submitted"),
+    ("chat_edit_requested", None, "_handle_chat_edit_requested"),
+    ("chat_attachment_requested", None, "_handle_chat_attachment_request"),
+)
+
+
+def _resolve_nothing() -> Optional[Path]:
+    """選択パスを取得できないビュー向けの解決処理。"""
+    return None
+
+
+def _path_from_item(current_item: Any, user_role: Any) -> Optional[Path]:
+    """ツリー項目のUserRoleデータ、またはテキストから正規化済みのパスを取得する。"""
+    if current_item is None:
+        return None
+
+    # UserRoleデータが設定されていれば優先する。正規化はキャッシュ付きの_resolve_pathに任せる。
+    data = current_item.data(user_role)
+    if isinstance(data, Path):
+        return _resolve_path(str(data))
+    if isinstance(data, str):
+        return _resolve_path(data)
+
+    text_getter = getattr(current_item, "text", None)
+    if callable(text_getter):
+        text = text_getter()
+        if text:
+            return _resolve_path(text)
+    return None
+
+
+def _build_resolver(
+    current_path: Any,
+    current_item: Any,
+    user_role: Any,
+    logger: logging.Logger,
+) -> Callable[[], Optional[Path]]:
+    """フォルダビューが提供するメソッドに応じた選択パス解決処理を生成する。
+
+    Args:
+        current_path (Any): ビューの``current_path``メソッド。存在しない場合はNone。
+        current_item (Any): ビューの``currentItem``メソッド。存在しない場合はNone。
+        user_role (Any): 項目データ取得に使うロール。
+        logger (logging.Logger): 取得失敗時のログ出力先。
+
+    Returns:
+        Callable[[], Optional[Path]]: 選択中のパスを返す関数。
+    """
+    item_getter = current_item if callable(current_item) else None
+
+    if not callable(current_path):
+        if item_getter is None:
+            return _resolve_nothing
+
+        def resolve_from_item() -> Optional[Path]:
+            return _path_from_item(item_getter(), user_role)
+
+        return resolve_from_item
+
+    def resolve_from_view() -> Optional[Path]:
+        # FolderTreeの場合は専用ヘルパーを利用し、取得できなければ項目から解決する。
+        try:
+            resolved = current_path()
+            if isinstance(resolved, Path):
+                return resolved
+        except Exception:  # noqa: BLE001
+            logger.debug("フォルダパス取得中にエラーが発生しました。", exc_info=True)
+
+        if item_getter is None:
+            return None
+        return _path_from_item(item_getter(), user_role)
+
+    return resolve_from_view
+
+
+class TabChangedPayload(NamedTuple):
+    """タブ変更イベントのペイロード。"""
+
+    # tuple.indexを隠さないよう、フィールド名はtab_indexとする。
+    tab_index: int
+    tab_count: int
+
+
+class FolderSelectedPayload(NamedTuple):
+    """フォルダ選択イベントのペイロード。"""
+
+    path: Optional[Path]
+
+
+# ファイル操作系ハンドラで想定する例外。モデル層のFileOperationErrorとOS由来のエラーのみを捕捉し、
+# それ以外はプログラム上の不具合として例外フックへ委ねる。
+_FILE_ACTION_ERRORS: tuple[type[Exception], ...] = (FileOperationError, OSError)
+
+
+# BOMの無いチャット添付ファイルに対して順に試すエンコーディング。
+_HEADERLESS_ENCODINGS: tuple[str, ...] = ("utf-8", "cp932", "utf-16-le", "utf-16-be")
+
+# AI応答中の最初のコードブロック(言語指定は任意)に一致するパターン。
+_CODE_BLOCK_RE = re.compile(r"```(?:[\w.+-]+)?\n(.*?)```", re.DOTALL)
+
+
+@lru_cache(maxsize=1024)
+def _resolve_path(raw: str) -> Path:
+    """パス文字列を展開・正規化し、同じ入力に対する再計算を避ける。"""
+    return Path(raw).expanduser().resolve(strict=False)
+
 
 class AppController:
     """アプリケーション全体の起動と終了を制御するコントローラ。"""
 
-    EVENT_TAB_CHANGED = "ui.tab.changed"
-    EVENT_FOLDER_SELECTED = "ui.folder.selected"
-    EVENT_FILE_SAVE_REQUESTED = "command.file.save"
-    EVENT_FILE_SAVED = "state.file.saved"
+    EVENT_TAB_CHANGED = sys.intern("ui.tab.changed")
+    EVENT_FOLDER_SELECTED = sys.intern("ui.folder.selected")
+    EVENT_FILE_SAVE_REQUESTED = sys.intern("command.file.save")
+    EVENT_FILE_SAVED = sys.intern("state.file.saved")
+
+    # ファイル読み込みとAI呼び出しに使うワーカースレッド数の上限。
+    _IO_POOL_MAX_THREADS = 2
+
+    # 引数付きDEBUGログの出力判定に使うレベル。
+    _DBG = logging.DEBUG
+
+    # 選択変更のたびに列挙体を辿らないよう、UserRoleを事前に解決しておく。
+    _USER_ROLE = Qt.ItemDataRole.UserRole
+
+    # 連続した選択変更でstatを繰り返さないよう、ファイル判定結果を保持する期間(秒)と上限件数。
+    _STAT_CACHE_TTL = 0.5
+    _STAT_CACHE_MAX_SIZE = 256
+
+    # 選択変更が連続した場合に1回の通知へまとめる待ち時間(ミリ秒)。
+    _FOLDER_SELECTION_DEBOUNCE_MS = 30
 
     def __init__(
         self,
@@ -58,6 +197,8 @@ class AppController:
         self._app = app
         self._logger = logger
         self._event_bus = event_bus or EventBus(logger)
+        # イベントバスは差し替えないため、発行メソッドを束縛済みで保持する。
+        self._publish: Callable[[str, Payload], None] = self._event_bus.publish
         self._window_factory = window_factory or MainWindow
         self._window: Optional[MainWindow] = None
         self._file_controller = file_controller
@@ -66,7 +207,22 @@ class AppController:
         self._tab_controller = tab_controller
         self._ai_controller = ai_controller
         self._tab_state: Optional[TabState] = None
-        self._pending_chat_attachments: list[tuple[Path, str]] = []
+        # 既定のFileControllerを生成した場合のみ、タブ数をTabStateから取得できる。
+        self._tab_count_from_state = False
+        # 添付は正規化済みパスをキーにして保持し、同じファイルの二重添付を防ぐ。
+        self._pending_chat_attachments: dict[Path, str] = {}
+        # AI応答を待っている間はTrueとし、次のチャット送信と編集要求を受け付けない。
+        self._chat_request_pending = False
+        # フォルダビューの選択パス取得処理。_wire_eventsでビューに合わせて一度だけ構築する。
+        self._resolve_strategy: Callable[[], Optional[Path]] = _resolve_nothing
+        self._stat_cache: dict[Path, tuple[float, bool]] = {}
+        self._folder_selection_timer: Optional[QTimer] = None
+        self._tab_changed_timer: Optional[QTimer] = None
+        self._pending_tab_index = -1
+        # ブロッキング処理用のスレッドプールと、完了通知を受けるまで保持する実行中タスク。
+        self._io_pool = QThreadPool()
+        self._io_pool.setMaxThreadCount(self._IO_POOL_MAX_THREADS)
+        self._background = BackgroundRunner(self._io_pool)
 
         # メインウィンドウを構築する。
         self._initialize_window()
@@ -77,6 +233,11 @@ class AppController:
         """メインウィンドウを生成して初期状態を整える。"""
         # ウィンドウを生成し、後続処理で利用できるように保持する。
         self._window = self._window_factory()
+        # スロット内で属性チェーンを辿らないよう、頻繁に使う子ウィジェットを保持する。
+        self._tab_widget = self._window.tab_widget
+        self._folder_view = self._window.folder_view
+        self._chat_panel = self._window.chat_panel
+        self._status_bar = self._window.statusBar()
         self._logger.info("メインウィンドウを初期化しました。")
 
     def _initialize_controllers(self) -> None:
@@ -84,14 +245,18 @@ class AppController:
         if self._window is None:
             raise RuntimeError("ウィンドウが初期化されていません。")
 
-        tab_view = self._window.tab_widget
-        folder_view: FolderTree = self._window.folder_view
+        tab_view = self._tab_widget
+        folder_view: FolderTree = self._folder_view
 
         # 既存の依存が無い場合は標準構成を生成する。
         if self._tab_state is None:
+            from models.tab_model import TabState
+
             self._tab_state = TabState(self._logger.getChild("tab_state"))
 
         if self._tab_controller is None:
+            from controllers.tab_controller import TabController
+
             self._tab_controller = TabController(
                 self._tab_state,
                 tab_view,
@@ -99,15 +264,23 @@ class AppController:
             )
 
         if self._file_controller is None:
+            from controllers.file_controller import FileController
+            from models.file_model import FileModel
+
             file_model = FileModel(self._logger.getChild("file_model"))
             self._file_controller = FileController(
                 file_model,
                 self._tab_state,
                 tab_view,
                 logger=self._logger.getChild("file_controller"),
+                thread_pool=self._io_pool,
             )
+            self._tab_count_from_state = True
 
         if self._folder_controller is None:
+            from controllers.folder_controller import FolderController
+            from models.folder_model import FolderModel
+
             folder_model = FolderModel(self._logger.getChild("folder_model"))
             self._folder_controller = FolderController(
                 folder_model,
@@ -116,6 +289,8 @@ class AppController:
             )
 
         if self._settings_controller is None:
+            from controllers.settings_controller import SettingsController
+
             self._settings_controller = SettingsController(
                 logger=self._logger.getChild("settings_controller")
             )
@@ -123,89 +298,125 @@ class AppController:
         settings_model = getattr(self._settings_controller, "model", None)
 
         if self._ai_controller is None:
+            from controllers.ai_controller import AIController
+
             self._ai_controller = AIController(
                 logger=self._logger.getChild("ai_controller"),
                 settings_model=settings_model,
             )
 
-        open_action = getattr(self._window, "action_open_file", None)
-        if open_action is not None:
-            open_action.triggered.connect(self._handle_open_file_action)
-
-        new_action = getattr(self._window, "action_new_file", None)
-        if new_action is not None:
-            new_action.triggered.connect(self._handle_new_file_action)
-
-        open_folder_action = getattr(self._window, "action_open_folder", None)
-        if open_folder_action is not None:
-            open_folder_action.triggered.connect(self._handle_open_folder_action)
-
-        save_action = getattr(self._window, "action_save_file", None)
-        if save_action is not None:
-            save_action.triggered.connect(self._emit_save_requested)
-
-        close_action = getattr(self._window, "action_close_tab", None)
-        if close_action is not None:
-            close_action.triggered.connect(self._handle_close_tab_action)
-
-        settings_action = getattr(self._window, "action_open_settings", None)
-        if settings_action is not None:
-            settings_action.triggered.connect(self._handle_open_settings_action)
-
-        chat_signal = getattr(self._window, "chat_submitted", None)
-        if chat_signal is not None:
-            chat_signal.connect(self._handle_chat_submitted)
-
-        edit_signal = getattr(self._window, "chat_edit_requested", None)
-        if edit_signal is not None:
-            edit_signal.connect(self._handle_chat_edit_requested)
-
-        attach_signal = getattr(self._window, "chat_attachment_requested", None)
-        if attach_signal is not None:
-            attach_signal.connect(self._handle_chat_attachment_request)
+        # 対応表に沿ってアクションのtriggeredやウィンドウのシグナルをハンドラへ接続する。
+        # 送信側と受信側は同じGUIスレッドのため、スレッド判定を省くDirectConnectionを使う。
+        window = self._window
+        direct = Qt.ConnectionType.DirectConnection
+        for attr, signal_name, handler_name in _WINDOW_WIRING:
+            source = getattr(window, attr, None)
+            if source is None:
+                continue
+            signal = source if signal_name is None else getattr(source, signal_name)
+            signal.connect(getattr(self, handler_name), direct)
 
     def _wire_events(self) -> None:
         """ビューシグナルとイベントバスの結線、およびハンドラ購読を設定する。"""
         if self._window is None:
             raise RuntimeError("ウィンドウが初期化されていません。")
 
-        tab_widget = self._window.tab_widget
-        folder_view = self._window.folder_view
-
-        # タブ切り替えイベントをイベントバス経由で通知する。
-        tab_widget.currentChanged.connect(self._emit_tab_changed)
-
-        # フォルダ選択変更をイベントバスへ送出する。
-        folder_view.itemSelectionChanged.connect(self._emit_folder_selected)
+        tab_widget = self._tab_widget
+        folder_view = self._folder_view
+
+        # タブ切り替えは次のイベントループ周回でまとめてイベントバスへ通知する。
+        tab_timer = QTimer(self._window)
+        tab_timer.setSingleShot(True)
+        tab_timer.setInterval(0)
+        tab_timer.timeout.connect(self._emit_tab_changed_now)
+        self._tab_changed_timer = tab_timer
+        tab_widget.currentChanged.connect(self._emit_tab_changed, Qt.ConnectionType.DirectConnection)
+
+        # 選択変更時に利用するパス解決処理をビューの実装に合わせて構築する。
+        self._resolve_strategy = _build_resolver(
+            getattr(folder_view, "current_path", None),
+            getattr(folder_view, "currentItem", None),
+            self._USER_ROLE,
+            self._logger,
+        )
+
+        # フォルダ選択変更は短時間の連続発火をまとめてからイベントバスへ送出する。
+        timer = QTimer(self._window)
+        timer.setSingleShot(True)
+        timer.setInterval(self._FOLDER_SELECTION_DEBOUNCE_MS)
+        timer.timeout.connect(self._emit_folder_selected_now)
+        self._folder_selection_timer = timer
+        folder_view.itemSelectionChanged.connect(
+            self._emit_folder_selected, Qt.ConnectionType.DirectConnection
+        )
 
         # 保存要求を購読しファイルコントローラへ委譲する。
         self._event_bus.subscribe(self.EVENT_FILE_SAVE_REQUESTED, self._handle_save_request)
 
     def _emit_tab_changed(self, index: int) -> None:
-        """タブ変更シグナルを受け取りイベントバスへ配信する。"""
-        payload: Payload = {"index": index, "tab_count": self._window.tab_widget.count() if self._window else 0}
-        self._event_bus.publish(self.EVENT_TAB_CHANGED, payload)
-        self._logger.debug("タブ変更イベントを発行しました: %s", payload)
+        """タブ変更シグナルを受け取り、同じイベントループ周回内の変更を1回の通知へまとめる。"""
+        self._pending_tab_index = index
+        timer = self._tab_changed_timer
+        if timer is None:
+            self._emit_tab_changed_now()
+            return
+
+        if not timer.isActive():
+            timer.start()
+
+    def _emit_tab_changed_now(self) -> None:
+        """最後に受け取ったタブ変更をイベントバスへ配信する。"""
+        # 購読者もDEBUGログも無い場合はペイロードを組み立てずに終了する。
+        debug_enabled = self._logger.isEnabledFor(self._DBG)
+        if not debug_enabled and not self._event_bus.has_subscribers(self.EVENT_TAB_CHANGED):
+            return
+
+        payload = TabChangedPayload(self._pending_tab_index, self._current_tab_count())
+        self._publish(self.EVENT_TAB_CHANGED, payload)
+        if debug_enabled:
+            self._logger.debug("タブ変更イベントを発行しました: %s", payload)
+
+    def _current_tab_count(self) -> int:
+        """開いているタブ数を返す。TabStateが同期している場合はQtへの問い合わせを省く。"""
+        if self._tab_count_from_state and self._tab_state is not None:
+            return self._tab_state.count
+        return self._tab_widget.count() if self._window else 0
 
     def _emit_folder_selected(self) -> None:
-        """フォルダ選択シグナルからイベントバスへ通知する。"""
+        """フォルダ選択シグナルを受け取り、タイマー満了後の通知を予約する。"""
+        timer = self._folder_selection_timer
+        if timer is None:
+            self._emit_folder_selected_now()
+            return
+
+        if not timer.isActive():
+            timer.start()
+
+    def _emit_folder_selected_now(self) -> None:
+        """現在の選択状態をイベントバスへ通知する。"""
         if self._window is None:
             return
 
+        # パスはファイルオープンにも使うため常に解決し、通知は購読者かDEBUGログがある場合のみ行う。
         path = self._resolve_selected_path()
-        payload: Payload = {"path": path}
-        self._event_bus.publish(self.EVENT_FOLDER_SELECTED, payload)
-        self._logger.debug("フォルダ選択イベントを発行しました: %s", payload)
+        debug_enabled = self._logger.isEnabledFor(self._DBG)
+        if debug_enabled or self._event_bus.has_subscribers(self.EVENT_FOLDER_SELECTED):
+            payload = FolderSelectedPayload(path)
+            self._publish(self.EVENT_FOLDER_SELECTED, payload)
+            if debug_enabled:
+                self._logger.debug("フォルダ選択イベントを発行しました: %s", payload)
         self._open_file_from_folder_selection(path)
 
     def _open_file_from_folder_selection(self, path: Optional[Path]) -> None:
-        """フォルダツリーで選択されたファイルを開く。"""
+        """フォルダツリーで選択されたファイルを開く。
+
+        Args:
+            path (Optional[Path]): 解決済みの選択パス。FolderTreeは構築時に正規化したパスを返す。
+        """
         if path is None:
             return
 
-        normalized = path.expanduser().resolve(strict=False)
-
-        if not normalized.is_file():
+        if not self._is_file_cached(path):
             return
 
         if self._file_controller is None:
@@ -213,9 +424,22 @@ class AppController:
             return
 
         try:
-            self._file_controller.open_file(normalized)
-        except Exception:  # noqa: BLE001
-            self._logger.exception("フォルダ選択からのファイルオープンに失敗しました。")
+            self._file_controller.open_file_async(path, on_failed=self._handle_open_failure)
+        except _FILE_ACTION_ERRORS:
+            self._logger.exception("フォルダ選択からのファイルオープンに失敗しました")
+
+    def _is_file_cached(self, path: Path) -> bool:
+        """短時間に同じパスが選択された場合はstat結果を再利用してファイル判定する。"""
+        now = time.monotonic()
+        cached = self._stat_cache.get(path)
+        if cached is not None and now - cached[0] < self._STAT_CACHE_TTL:
+            return cached[1]
+
+        is_file = path.is_file()
+        if len(self._stat_cache) >= self._STAT_CACHE_MAX_SIZE:
+            self._stat_cache.clear()
+        self._stat_cache[path] = (now, is_file)
+        return is_file
 
     def _handle_save_request(self, payload: Payload) -> None:
         """保存要求イベントを受け取りファイル保存を実行する。"""
@@ -224,30 +448,49 @@ class AppController:
             return
 
         try:
-            result = self._file_controller.save_current_file()
-        except Exception:  # noqa: BLE001
-            self._logger.exception("ファイル保存処理中に例外が発生しました。")
-            return
+            # 書き込みはI/O用スレッドプールで行い、完了後にGUIスレッドで保存完了を通知する。
+            self._file_controller.save_current_file_async(
+                self._handle_file_saved, on_failed=self._handle_save_failure
+            )
+        except _FILE_ACTION_ERRORS:
+            self._logger.exception("ファイル保存処理中に例外が発生しました")
 
+    def _handle_file_saved(self, result: Optional[Path]) -> None:
+        """保存完了を受け取り保存済みイベントを発行する。"""
         saved_payload: Payload = {"path": result} if result is not None else None
-        self._event_bus.publish(self.EVENT_FILE_SAVED, saved_payload)
+        self._publish(self.EVENT_FILE_SAVED, saved_payload)
         self._logger.info("ファイル保存が完了しました。%s", saved_payload)
 
+    def _handle_save_failure(self, exc: Exception) -> None:
+        """バックグラウンドでのファイル保存失敗を記録する。"""
+        self._logger.error("ファイル保存処理中に例外が発生しました: %s", exc, exc_info=exc)
+
     def _handle_open_file_action(self) -> None:
         """ファイルを開くアクションを処理する。"""
         if self._file_controller is None:
             self._logger.warning("ファイルコントローラが未設定のため開く操作を処理できません。")
             return
 
-        selected = self._prompt_file_to_open()
+        # ダイアログはイベントループを止めずに表示し、選択結果をコールバックで受け取る。
+        self._prompt_file_to_open(self._open_selected_file)
+
+    def _open_selected_file(self, selected: Optional[Path]) -> None:
+        """ファイル選択ダイアログで選ばれたファイルを開く。"""
         if selected is None:
             self._logger.debug("ファイル選択がキャンセルされました。")
             return
 
+        if self._file_controller is None:
+            return
+
         try:
-            self._file_controller.open_file(selected)
-        except Exception:  # noqa: BLE001
-            self._logger.exception("ファイルを開く処理中に例外が発生しました。")
+            self._file_controller.open_file_async(selected, on_failed=self._handle_open_failure)
+        except _FILE_ACTION_ERRORS:
+            self._logger.exception("ファイルを開く処理中に例外が発生しました")
+
+    def _handle_open_failure(self, exc: Exception) -> None:
+        """バックグラウンドでのファイル読み込み失敗を記録する。"""
+        self._logger.error("ファイルを開く処理中に例外が発生しました: %s", exc, exc_info=exc)
 
     def _handle_new_file_action(self) -> None:
         """新規ファイル作成アクションを処理する。"""
@@ -257,8 +500,8 @@ class AppController:
 
         try:
             self._file_controller.create_new_file()
-        except Exception:  # noqa: BLE001
-            self._logger.exception("新規ファイル作成中に例外が発生しました。")
+        except _FILE_ACTION_ERRORS:
+            self._logger.exception("新規ファイル作成中に例外が発生しました")
 
     def _handle_open_folder_action(self) -> None:
         """フォルダを開くアクションを処理する。"""
@@ -266,17 +509,24 @@ class AppController:
             self._logger.warning("フォルダコントローラが未設定のためフォルダを開けません。")
             return
 
-        selected = self._prompt_folder_to_open()
+        self._prompt_folder_to_open(self._load_selected_folder)
+
+    def _load_selected_folder(self, selected: Optional[Path]) -> None:
+        """フォルダ選択ダイアログで選ばれたフォルダをツリーへ読み込む。"""
         if selected is None:
             self._logger.debug("フォルダ選択がキャンセルされました。")
             return
 
+        if self._folder_controller is None:
+            return
+
+        # ルートが変わるとシンボリックリンクの解決結果も変わり得るため、キャッシュを破棄する。
+        _resolve_path.cache_clear()
+
         try:
             self._folder_controller.load_initial_tree(selected)
-        except FileOperationError:
-            self._logger.exception("フォルダツリーの初期化に失敗しました。")
-        except Exception:  # noqa: BLE001
-            self._logger.exception("フォルダ読み込み処理中に予期せぬエラーが発生しました。")
+        except _FILE_ACTION_ERRORS:
+            self._logger.exception("フォルダツリーの初期化に失敗しました")
 
     def _handle_close_tab_action(self) -> None:
         """タブを閉じるアクションを処理する。"""
@@ -286,8 +536,8 @@ class AppController:
 
         try:
             closed_path = self._file_controller.close_current_tab()
-        except Exception:  # noqa: BLE001
-            self._logger.exception("タブを閉じる処理中に例外が発生しました。")
+        except _FILE_ACTION_ERRORS:
+            self._logger.exception("タブを閉じる処理中に例外が発生しました")
             return
 
         if closed_path is None:
@@ -305,12 +555,14 @@ class AppController:
             self._logger.warning("ウィンドウが初期化されていないため設定を開けません。")
             return
 
+        # exec()で待たずにopen()で表示し、結果はfinishedシグナル経由で受け取る。
         try:
-            accepted = self._settings_controller.open_dialog(parent=self._window)
+            self._settings_controller.open_dialog_async(self._handle_settings_finished, parent=self._window)
         except Exception:  # noqa: BLE001
             self._logger.exception("設定ダイアログの表示中に例外が発生しました。")
-            return
 
+    def _handle_settings_finished(self, accepted: bool) -> None:
+        """設定ダイアログの終了結果を受け取り、保存時はAIクライアントを作り直す。"""
         if accepted:
             self._logger.info("設定ダイアログで変更が保存されました。")
             if self._ai_controller is not None:
@@ -319,94 +571,163 @@ class AppController:
             self._logger.debug("設定ダイアログはキャンセルされました。")
 
     def _handle_chat_submitted(self, message: str) -> None:
-        """チャット入力をAIコントローラへ委譲する。"""
-        trimmed = message.strip()
-
-        if not trimmed:
-            if self._window is not None:
-                self._window.show_chat_error("メッセージを入力してください。")
-            return
+        """チャット入力をAIコントローラへ委譲する。
 
+        メッセージはChatPanelで前後の空白除去と空入力の棄却が済んでいる前提とする。
+        """
         if self._ai_controller is None:
             self._logger.warning("AIコントローラが未設定のためチャットを処理できません。")
-            if self._window is not None:
-                self._window.show_chat_error("AI機能が利用できません。")
+            self._show_chat_error("AI機能が利用できません。")
             return
 
-        prompt = self._compose_chat_prompt(trimmed, self._pending_chat_attachments)
-
-        try:
-            response = self._ai_controller.handle_chat_submit(prompt)
-        except AIIntegrationError as exc:
-            self._logger.error("AI応答の取得に失敗しました。", exc_info=exc)
-            if self._window is not None:
-                self._window.show_chat_error(str(exc))
+        if self._chat_request_pending:
+            self._show_chat_error("前のAIリクエストを処理中です。", restore=message)
             return
-        except Exception:  # noqa: BLE001
-            self._logger.exception("チャット処理中に予期せぬ例外が発生しました。")
-            if self._window is not None:
-                self._window.show_chat_error("AI応答の取得中にエラーが発生しました。")
+
+        # 送信時点の添付をプロンプトへ含めて取り出す。応答待ちの間に追加された添付は次の送信で使う。
+        attachments = self._take_chat_attachments()
+        # 添付が無い通常のチャットではメッセージをそのままプロンプトとして使う。
+        prompt = self._compose_chat_prompt(message, attachments.items()) if attachments else message
+
+        # HTTP通信でイベントループを止めないよう、AI呼び出しはワーカースレッドで実行する。
+        ai_controller = self._ai_controller
+        self._set_chat_pending(True)
+        self._run_in_background(
+            lambda: ai_controller.handle_chat_submit(prompt),
+            self._handle_chat_response,
+            lambda exc: self._handle_chat_failure(attachments, exc),
+        )
+
+    def _take_chat_attachments(self) -> dict[Path, str]:
+        """保留中の添付を取り出し、保留一覧と表示を空にする。"""
+        attachments = self._pending_chat_attachments
+        self._pending_chat_attachments = {}
+        if self._window is not None:
+            self._chat_panel.set_attachments([])
+        return attachments
+
+    def _restore_chat_attachments(self, attachments: dict[Path, str]) -> None:
+        """失敗したリクエストの添付を保留一覧へ戻す。送信後に追加された添付も残す。"""
+        if not attachments:
             return
+        self._pending_chat_attachments = {**attachments, **self._pending_chat_attachments}
+        if self._window is not None:
+            self._chat_panel.set_attachments(self._pending_chat_attachments.keys())
 
-        self._pending_chat_attachments.clear()
+    def _set_chat_pending(self, pending: bool) -> None:
+        """AI応答待ちの状態を更新し、チャット欄の送信操作の可否へ反映する。"""
+        self._chat_request_pending = pending
         if self._window is not None:
-            self._window.chat_panel.set_attachments([])
+            self._chat_panel.set_busy(pending)
+
+    def _show_chat_error(self, message: str, restore: Optional[str] = None) -> None:
+        """チャット欄にエラーを表示する。ウィンドウ未生成の場合は何もしない。
+
+        Args:
+            message (str): 表示するエラーメッセージ。
+            restore (Optional[str]): 入力欄へ書き戻すテキスト。省略時は入力欄を変更しない。
+        """
+        window = self._window
+        if window is None:
+            return
+        if restore is not None:
+            self._chat_panel.set_input_text(restore)
+        window.show_chat_error(message)
+
+    def _handle_chat_response(self, response: str) -> None:
+        """ワーカーから受け取ったAI応答を表示する。"""
+        self._set_chat_pending(False)
         if self._window is not None:
             self._window.show_chat_response(response)
 
-    def _handle_chat_edit_requested(self, instruction: str) -> None:
-        """AIを利用したファイル編集リクエストを処理する。"""
-        trimmed = instruction.strip()
+    def _handle_chat_failure(self, attachments: dict[Path, str], exc: Exception) -> None:
+        """ワーカーで発生したエラーを記録してチャット欄へ表示し、送信した添付を戻す。"""
+        self._set_chat_pending(False)
+        self._restore_chat_attachments(attachments)
+        if isinstance(exc, AIIntegrationError):
+            self._logger.error("AI応答の取得に失敗しました。", exc_info=exc)
+            message = str(exc)
+        else:
+            self._logger.error("チャット処理中に予期せぬ例外が発生しました。", exc_info=exc)
+            message = "AI応答の取得中にエラーが発生しました。"
 
-        if not trimmed:
-            if self._window is not None:
-                self._window.show_chat_error("メッセージを入力してください。")
-            return
+        self._show_chat_error(message)
+
+    def _run_in_background(
+        self,
+        func: Callable[[], Any],
+        on_success: Callable[[Any], None],
+        on_failure: Callable[[Exception], None],
+    ) -> None:
+        """ブロッキング処理をI/O用スレッドプールで実行し、結果をGUIスレッドで受け取る。"""
+        self._background.run(func, on_success, on_failure)
 
+    def _handle_chat_edit_requested(self, instruction: str) -> None:
+        """AIを利用したファイル編集リクエストを処理する。
+
+        指示文はChatPanelで前後の空白除去と空入力の棄却が済んでいる前提とする。
+        """
         if self._ai_controller is None:
             self._logger.warning("AIコントローラが未設定のため編集を処理できません。")
-            if self._window is not None:
-                self._window.chat_panel.set_input_text(trimmed)
-                self._window.show_chat_error("AI機能が利用できません。")
+            self._show_chat_error("AI機能が利用できません。", restore=instruction)
             return
 
         if self._file_controller is None:
             self._logger.warning("ファイルコントローラが未設定のため編集結果を適用できません。")
-            if self._window is not None:
-                self._window.chat_panel.set_input_text(trimmed)
-                self._window.show_chat_error("ファイル編集機能が利用できません。")
+            self._show_chat_error("ファイル編集機能が利用できません。", restore=instruction)
             return
 
-        attachments = list(self._pending_chat_attachments)
-        if not attachments:
-            if self._window is not None:
-                self._window.chat_panel.set_input_text(trimmed)
-                self._window.show_chat_error("編集するファイルを添付してください。")
+        if self._chat_request_pending:
+            self._show_chat_error("前のAIリクエストを処理中です。", restore=instruction)
             return
 
-        if len(attachments) != 1:
-            if self._window is not None:
-                self._window.chat_panel.set_input_text(trimmed)
-                self._window.show_chat_error("編集には1件のファイルのみ添付してください。")
+        if not self._pending_chat_attachments:
+            self._show_chat_error("編集するファイルを添付してください。", restore=instruction)
             return
 
-        target_path, _original_content = attachments[0]
-        augmented_instruction = f"{trimmed}\nソースコードはコードブロックで出力してください。"
-        prompt = self._compose_chat_prompt(augmented_instruction, attachments)
+        if len(self._pending_chat_attachments) != 1:
+            self._show_chat_error("編集には1件のファイルのみ添付してください。", restore=instruction)
+            return
 
-        try:
-            new_content = self._ai_controller.handle_chat_submit(prompt)
-        except AIIntegrationError as exc:
+        attachments = self._take_chat_attachments()
+        target_path = next(iter(attachments))
+        augmented_instruction = f"{instruction}\nソースコードはコードブロックで出力してください。"
+        prompt = self._compose_chat_prompt(augmented_instruction, attachments.items())
+
+        ai_controller = self._ai_controller
+        self._set_chat_pending(True)
+        self._run_in_background(
+            lambda: ai_controller.handle_chat_submit(prompt),
+            lambda response: self._apply_chat_edit(instruction, attachments, target_path, response),
+            lambda exc: self._handle_chat_edit_failure(instruction, attachments, exc),
+        )
+
+    def _handle_chat_edit_failure(self, instruction: str, attachments: dict[Path, str], exc: Exception) -> None:
+        """AI編集の取得失敗を記録し、入力内容と添付を戻してエラーを表示する。"""
+        self._set_chat_pending(False)
+        self._restore_chat_attachments(attachments)
+        if isinstance(exc, AIIntegrationError):
             self._logger.error("AI編集の取得に失敗しました。", exc_info=exc)
-            if self._window is not None:
-                self._window.chat_panel.set_input_text(trimmed)
-                self._window.show_chat_error(str(exc))
-            return
-        except Exception:  # noqa: BLE001
-            self._logger.exception("AI編集処理中に予期せぬ例外が発生しました。")
-            if self._window is not None:
-                self._window.chat_panel.set_input_text(trimmed)
-                self._window.show_chat_error("AI応答の取得中にエラーが発生しました。")
+            message = str(exc)
+        else:
+            self._logger.error("AI編集処理中に予期せぬ例外が発生しました。", exc_info=exc)
+            message = "AI応答の取得中にエラーが発生しました。"
+
+        self._show_chat_error(message, restore=instruction)
+
+    def _apply_chat_edit(
+        self,
+        instruction: str,
+        attachments: dict[Path, str],
+        target_path: Path,
+        new_content: str,
+    ) -> None:
+        """AI応答から編集内容を取り出し、対象ファイルへ適用する。適用に失敗した場合は添付を戻す。"""
+        self._set_chat_pending(False)
+        if self._file_controller is None:
+            self._logger.warning("ファイルコントローラが未設定のため編集結果を適用できません。")
+            self._restore_chat_attachments(attachments)
+            self._show_chat_error("ファイル編集機能が利用できません。", restore=instruction)
             return
 
         extracted_content = self._extract_code_block(new_content)
@@ -420,22 +741,18 @@ class AppController:
             self._file_controller.apply_external_edit(target_path, new_content)
         except FileOperationError as exc:
             self._logger.error("AI編集結果の適用に失敗しました: %s", target_path, exc_info=exc)
-            if self._window is not None:
-                self._window.chat_panel.set_input_text(trimmed)
-                self._window.show_chat_error(str(exc))
+            self._restore_chat_attachments(attachments)
+            self._show_chat_error(str(exc), restore=instruction)
             return
         except Exception:  # noqa: BLE001
             self._logger.exception("AI編集結果の適用中に予期せぬ例外が発生しました。")
-            if self._window is not None:
-                self._window.chat_panel.set_input_text(trimmed)
-                self._window.show_chat_error("ファイルの更新中にエラーが発生しました。")
+            self._restore_chat_attachments(attachments)
+            self._show_chat_error("ファイルの更新中にエラーが発生しました。", restore=instruction)
             return
 
-        self._pending_chat_attachments.clear()
         if self._window is not None:
-            self._window.chat_panel.set_attachments([])
-            self._window.chat_panel.append_ai_message(f"AI: {target_path.name} を編集しました。")
-            self._window.statusBar().showMessage(f"AI編集: {target_path.name} を更新しました。", 5000)
+            self._chat_panel.append_ai_message(f"AI: {target_path.name} を編集しました。")
+            self._status_bar.showMessage(f"AI編集: {target_path.name} を更新しました。", 5000)
 
         self._logger.info("AI編集をファイルへ適用しました: %s", target_path)
 
@@ -443,42 +760,68 @@ class AppController:
         """チャットへのファイル添付リクエストを処理する。"""
         if self._ai_controller is None:
             self._logger.warning("AIコントローラが未設定のため添付を処理できません。")
-            if self._window is not None:
-                self._window.show_chat_error("AI機能が利用できません。")
+            self._show_chat_error("AI機能が利用できません。")
             return
 
-        selected = self._prompt_file_to_open()
+        self._prompt_file_to_open(self._attach_selected_file)
+
+    def _attach_selected_file(self, selected: Optional[Path]) -> None:
+        """ファイル選択ダイアログで選ばれたファイルをチャット添付として読み込む。"""
         if selected is None:
             self._logger.debug("チャット添付用のファイル選択がキャンセルされました。")
             if self._window is not None:
-                self._window.statusBar().showMessage("チャット: ファイル選択をキャンセルしました。", 3000)
+                self._status_bar.showMessage("チャット: ファイル選択をキャンセルしました。", 3000)
             return
 
         normalized = selected.expanduser().resolve(strict=False)
 
-        try:
-            content = self._read_text_for_chat(normalized)
-        except FileOperationError as exc:
-            self._logger.error("チャット添付ファイルの読み込みに失敗しました: %s", normalized, exc_info=exc)
-            if self._window is not None:
-                self._window.show_chat_error(str(exc))
-            return
+        # 大きなファイルでもGUIが固まらないよう、読み込みはワーカースレッドで行う。
+        self._run_in_background(
+            lambda: self._read_text_for_chat(normalized),
+            lambda content: self._add_chat_attachment(normalized, content),
+            lambda exc: self._handle_chat_attachment_failure(normalized, exc),
+        )
 
-        self._pending_chat_attachments.append((normalized, content))
+    def _add_chat_attachment(self, path: Path, content: str) -> None:
+        """読み込んだ添付ファイルを保留中の添付一覧へ追加する。"""
+        self._pending_chat_attachments[path] = content
         if self._window is not None:
-            self._window.chat_panel.set_attachments(path for path, _ in self._pending_chat_attachments)
-            self._window.statusBar().showMessage(
-                f"チャット: '{normalized.name}' を添付しました。",
+            self._chat_panel.set_attachments(self._pending_chat_attachments.keys())
+            self._status_bar.showMessage(
+                f"チャット: '{path.name}' を添付しました。",
                 3000,
             )
 
+    def _handle_chat_attachment_failure(self, path: Path, exc: Exception) -> None:
+        """添付ファイルの読み込み失敗を記録し、エラーを表示する。"""
+        self._logger.error("チャット添付ファイルの読み込みに失敗しました: %s", path, exc_info=exc)
+        message = str(exc) if isinstance(exc, FileOperationError) else f"ファイルの読み込みに失敗しました: {path}"
+        self._show_chat_error(message)
+
     def _read_text_for_chat(self, path: Path) -> str:
-        """チャット添付用にテキストファイルを読み込む。"""
-        candidates = ["utf-8", "utf-8-sig", "utf-16", "utf-16-le", "utf-16-be", "cp932"]
+        """チャット添付用にテキストファイルを読み込む。
+
+        ファイルは1回だけ読み込み、BOMがあればそのエンコーディングで、
+        無ければ候補を順に試してデコードする。
+        """
+        try:
+            # Path.read_bytesを経由せず、組み込みopenで1回だけ読み込む。
+            with open(os.fspath(path), "rb") as handle:
+                data = handle.read()
+        except OSError as exc:
+            self._logger.error("チャット添付ファイルの読み込みに失敗しました: %s", path, exc_info=exc)
+            raise FileOperationError(f"ファイルの読み込みに失敗しました: {path}") from exc
+
+        if data.startswith(b"\xef\xbb\xbf"):
+            candidates: tuple[str, ...] = ("utf-8-sig",)
+        elif data.startswith((b"\xff\xfe", b"\xfe\xff")):
+            candidates = ("utf-16",)
+        else:
+            candidates = _HEADERLESS_ENCODINGS
 
         for encoding in candidates:
             try:
-                return path.read_text(encoding=encoding)
+                return data.decode(encoding)
             except UnicodeDecodeError as exc:
                 self._logger.debug(
                     "チャット添付ファイルのデコードに失敗しました: path=%s encoding=%s",
@@ -486,95 +829,91 @@ class AppController:
                     encoding,
                     exc_info=exc,
                 )
-                continue
-            except OSError as exc:
-                self._logger.error("チャット添付ファイルの読み込みに失敗しました: %s", path, exc_info=exc)
-                raise FileOperationError(f"ファイルの読み込みに失敗しました: {path}") from exc
 
         self._logger.error("チャット添付ファイルの読み込みで利用可能なエンコーディングが見つかりません: %s", path)
         raise FileOperationError(f"ファイルの読み込みに失敗しました: {path}")
 
     def _compose_chat_prompt(self, message: str, attachments: Iterable[tuple[Path, str]]) -> str:
         """メッセージと添付ファイル内容をまとめたプロンプトを生成する。"""
-        segments = [message]
+        # 添付内容を中間文字列に埋め込まず、1つのバッファへ順に書き込む。
+        buffer = io.StringIO()
+        write = buffer.write
+        write(message)
 
         for path, content in attachments:
-            display_path = str(path)
-            divider = f"----- ファイル開始 ({path.name}) -----"
-            footer = f"----- ファイル終了 ({path.name}) -----"
-            segments.append(f"以下はファイル {display_path} の内容です。\n{divider}\n{content}\n{footer}")
-
-        return "\n\n".join(segments)
+            write("\n\n以下はファイル ")
+            write(str(path))
+            write(" の内容です。\n----- ファイル開始 (")
+            write(path.name)
+            write(") -----\n")
+            write(content)
+            write("\n----- ファイル終了 (")
+            write(path.name)
+            write(") -----")
+
+        return buffer.getvalue()
 
     def _extract_code_block(self, text: str) -> Optional[str]:
         """AI応答から最初のコードブロックを抽出する。"""
-        pattern = re.compile(r"```(?:[\w.+-]+)?\n(.*?)```", re.DOTALL)
-        match = pattern.search(text)
+        match = _CODE_BLOCK_RE.search(text)
         if match is None:
             return None
         return match.group(1).strip()
 
-    def _prompt_file_to_open(self) -> Optional[Path]:
-        """ファイルを開く際の選択ダイアログを表示する。"""
+    def _prompt_file_to_open(self, on_selected: Callable[[Optional[Path]], None]) -> None:
+        """ファイル選択ダイアログを非同期に表示し、選択結果をコールバックへ渡す。
+
+        Args:
+            on_selected (Callable[[Optional[Path]], None]): 選択されたパス、キャンセル時はNoneを受け取る関数。
+        """
         if self._window is None:
-            return None
+            on_selected(None)
+            return
 
-        file_path, _ = QFileDialog.getOpenFileName(self._window, "ファイルを開く")
-        if not file_path:
-            return None
+        # ネイティブダイアログを維持したまま、巨大なディレクトリでの列挙負荷を抑える。
+        dialog = QFileDialog(self._window, "ファイルを開く")
+        dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        dialog.setOptions(QFileDialog.Option.DontUseCustomDirectoryIcons | QFileDialog.Option.ReadOnly)
+        self._open_file_dialog(dialog, on_selected)
 
-        return Path(file_path).expanduser().resolve(strict=False)
+    def _prompt_folder_to_open(self, on_selected: Callable[[Optional[Path]], None]) -> None:
+        """フォルダ選択ダイアログを非同期に表示し、選択結果をコールバックへ渡す。
 
-    def _prompt_folder_to_open(self) -> Optional[Path]:
-        """フォルダ選択ダイアログを表示する。"""
+        Args:
+            on_selected (Callable[[Optional[Path]], None]): 選択されたパス、キャンセル時はNoneを受け取る関数。
+        """
         if self._window is None:
-            return None
-
-        directory = QFileDialog.getExistingDirectory(self._window, "フォルダを開く")
-        if not directory:
-            return None
-
-        return Path(directory).expanduser().resolve(strict=False)
+            on_selected(None)
+            return
+
+        # ディレクトリのみを表示し、エントリごとのシンボリックリンク解決を省く。
+        dialog = QFileDialog(self._window, "フォルダを開く")
+        dialog.setFileMode(QFileDialog.FileMode.Directory)
+        dialog.setOptions(QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks)
+        self._open_file_dialog(dialog, on_selected)
+
+    @staticmethod
+    def _open_file_dialog(dialog: QFileDialog, on_selected: Callable[[Optional[Path]], None]) -> None:
+        """ダイアログをウィンドウモーダルで開き、確定またはキャンセルを一度だけ通知する。"""
+        single_shot = Qt.ConnectionType.SingleShotConnection
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.fileSelected.connect(
+            lambda selected: on_selected(_resolve_path(selected) if selected else None),
+            single_shot,
+        )
+        dialog.rejected.connect(lambda: on_selected(None), single_shot)
+        # open()は即座に戻るため、ダイアログ表示中もイベントループは処理を続ける。
+        dialog.open()
 
     def _emit_save_requested(self) -> None:
         """保存要求イベントをイベントバスへ送出する。"""
-        self._event_bus.publish(self.EVENT_FILE_SAVE_REQUESTED, None)
+        self._publish(self.EVENT_FILE_SAVE_REQUESTED, None)
 
     def _resolve_selected_path(self) -> Optional[Path]:
         """フォルダビューの選択状態からパス情報を取得する。"""
         if self._window is None:
             return None
-
-        view = self._window.folder_view
-
-        # FolderTreeの場合は専用ヘルパーを利用する。
-        current_path = getattr(view, "current_path", None)
-        if callable(current_path):
-            try:
-                resolved = current_path()
-                if isinstance(resolved, Path):
-                    return resolved
-            except Exception:  # noqa: BLE001
-                self._logger.debug("フォルダパス取得中にエラーが発生しました。", exc_info=True)
-
-        item = getattr(view, "currentItem", None)
-        if callable(item):
-            current_item = item()
-            if current_item is not None:
-                # UserRoleデータが設定されていれば優先する。
-                data = current_item.data(Qt.ItemDataRole.UserRole)
-                if isinstance(data, Path):
-                    return data
-                if isinstance(data, str):
-                    return Path(data)
-
-                text_getter = getattr(current_item, "text", None)
-                if callable(text_getter):
-                    text = text_getter()
-                    if text:
-                        return Path(text)
-
-        return None
+        return self._resolve_strategy()
 
     def start(self) -> None:
         """アプリケーションを起動してウィンドウを表示する。"""
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal
+
+
+class BackgroundTaskSignals(QObject):
+    """バックグラウンド処理の結果をGUIスレッドへ通知するシグナル群。"""
+
+    succeeded = Signal(object)
+    failed = Signal(object)
+    finished = Signal()
+
+
+class BackgroundTask(QRunnable):
+    """ファイル読み書きやAI呼び出しなどのブロッキング処理をスレッドプール上で実行する。"""
+
+    def __init__(self, func: Callable[[], Any]) -> None:
+        super().__init__()
+        # 寿命はBackgroundRunner側の参照で管理するため、スレッドプールには破棄させない。
+        self.setAutoDelete(False)
+        self._func = func
+        self.signals = BackgroundTaskSignals()
+
+    def run(self) -> None:
+        """処理を実行し、戻り値または送出された例外をシグナルで通知する。"""
+        try:
+            result = self._func()
+        except Exception as exc:  # noqa: BLE001
+            self.signals.failed.emit(exc)
+        else:
+            self.signals.succeeded.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+
+class BackgroundRunner:
+    """スレッドプールへ処理を投入し、完了通知をGUIスレッドで受け取るためのヘルパー。"""
+
+    def __init__(self, thread_pool: Optional[QThreadPool] = None) -> None:
+        """投入先のスレッドプールを受け取り初期化する。
+
+        Args:
+            thread_pool (Optional[QThreadPool]): 処理を実行するスレッドプール。未指定時はグローバルプール。
+        """
+        self._pool = thread_pool or QThreadPool.globalInstance()
+        self._tasks: set[BackgroundTask] = set()
+
+    @property
+    def thread_pool(self) -> QThreadPool:
+        """処理の投入先スレッドプールを返す。"""
+        return self._pool
+
+    def run(
+        self,
+        func: Callable[[], Any],
+        on_success: Callable[[Any], None],
+        on_failure: Callable[[Exception], None],
+    ) -> None:
+        """ブロッキング処理をスレッドプールで実行し、結果をGUIスレッドのコールバックへ渡す。
+
+        Args:
+            func (Callable[[], Any]): ワーカースレッドで実行する処理。GUIオブジェクトに触れてはならない。
+            on_success (Callable[[Any], None]): 成功時に戻り値を受け取るコールバック。
+            on_failure (Callable[[Exception], None]): 失敗時に例外を受け取るコールバック。
+        """
+        task = BackgroundTask(func)
+        queued = Qt.ConnectionType.QueuedConnection
+        task.signals.succeeded.connect(on_success, queued)
+        task.signals.failed.connect(on_failure, queued)
+        task.signals.finished.connect(lambda: self._tasks.discard(task), queued)
+        self._tasks.add(task)
+        self._pool.start(task)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Callable, Dict, List
+import sys
+from typing import Any, Callable, Dict, Tuple
 
-Payload = Dict[str, Any] | None
+# 辞書に加え、頻繁に発行されるイベント向けの軽量なNamedTupleも受け付ける。
+Payload = Dict[str, Any] | Tuple[Any, ...] | None
 Handler = Callable[[Payload], None]
 
 
@@ -16,9 +18,16 @@ class EventBus:
         Args:
             logger (logging.Logger | None): ログ出力に使用するロガー。省略時は`my_editor`ロガー。
         """
-        # ロガーを保持し、購読者リストの辞書を整備する。
+        # ロガーを保持し、購読者タプルの辞書を整備する。
+        # タプルは不変のため、publish時にコピーせずそのままスナップショットとして扱える。
+        self._handlers: Dict[str, Tuple[Handler, ...]] = {}
+        # スコープ購読者("ui"や"ui.tab"など)と、イベント名ごとのスコープ一覧キャッシュ。
+        self._scoped: Dict[str, Tuple[Handler, ...]] = {}
+        self._prefix_cache: Dict[str, Tuple[str, ...]] = {}
+        # 重複判定用の登録簿。挿入順を保つdictをキーごとに持ち、O(1)で二重登録を検出する。
+        self._registry: Dict[str, Dict[Handler, None]] = {}
+        self._scoped_registry: Dict[str, Dict[Handler, None]] = {}
         self._logger = logger or logging.getLogger("my_editor")
-        self._subscriptions: Dict[str, List[Handler]] = {}
 
     def subscribe(self, event: str, handler: Handler) -> None:
         """イベントに対してハンドラを登録する。
@@ -27,28 +36,147 @@ class EventBus:
             event (str): 購読対象のイベント名。
             handler (Handler): イベント受信時に実行するコールバック。
         """
-        # イベントごとのリストを取得し、二重登録を避けつつ追加する。
-        handlers = self._subscriptions.setdefault(event, [])
-        if handler not in handlers:
-            handlers.append(handler)
+        # キーは intern して保持し、intern済みの定数で発行された場合の辞書検索を同一性比較で済ませる。
+        event = sys.intern(event)
+        # 登録簿で二重登録を判定し、新規の場合のみ配信用タプルを差し替える。
+        if _register(self._registry, self._handlers, event, handler) and self._debug_enabled():
             self._logger.debug("イベント'%s'にハンドラを登録しました。", event)
 
+    def unsubscribe(self, event: str, handler: Handler) -> None:
+        """イベントからハンドラの登録を解除する。
+
+        Args:
+            event (str): 購読を解除するイベント名。
+            handler (Handler): 解除するコールバック。未登録の場合は何もしない。
+        """
+        event = sys.intern(event)
+        if _unregister(self._registry, self._handlers, event, handler) and self._debug_enabled():
+            self._logger.debug("イベント'%s'のハンドラ登録を解除しました。", event)
+
+    def subscribe_scope(self, scope: str, handler: Handler) -> None:
+        """ドット区切りのスコープ配下の全イベントに対してハンドラを登録する。
+
+        例えば``"ui"``で登録すると``"ui.tab.changed"``や``"ui.folder.selected"``の発行時に呼ばれる。
+        空文字列を指定すると全イベントを受け取る。
+
+        Args:
+            scope (str): 購読対象のスコープ。
+            handler (Handler): イベント受信時に実行するコールバック。
+        """
+        scope = sys.intern(scope)
+        # 通常の購読と同様に二重登録を避け、新しいタプルへ差し替える。
+        if _register(self._scoped_registry, self._scoped, scope, handler) and self._debug_enabled():
+            self._logger.debug("スコープ'%s'にハンドラを登録しました。", scope)
+
+    def has_subscribers(self, event: str) -> bool:
+        """イベントを受け取るハンドラが登録されているかを返す。
+
+        Args:
+            event (str): 確認するイベント名。
+
+        Returns:
+            bool: 完全一致またはスコープ購読のハンドラが存在する場合はTrue。
+        """
+        if event in self._handlers:
+            return True
+        if not self._scoped:
+            return False
+        return any(scope in self._scoped for scope in self._scopes_for(event))
+
     def publish(self, event: str, payload: Payload = None) -> None:
         """イベントを発行して登録済みハンドラへ通知する。
 
+        イベント名に一致するハンドラに加え、イベント名を含むスコープの購読者へも通知する。
+
         Args:
             event (str): 発行するイベント名。
             payload (Payload): ハンドラへ渡すデータ。省略時はNone。
         """
-        # ハンドラが存在しない場合は何もせず終了する。
-        handlers = self._subscriptions.get(event, [])
+        # 発行ごとのinternは行わない。EVENT_*定数はintern済みのため、辞書検索は同一性比較で済む。
+        handlers = self._handlers.get(event, ())
+        if self._scoped:
+            # スコープ購読者が存在する場合のみ、キャッシュ済みのスコープ一覧から収集する。
+            for scope in self._scopes_for(event):
+                scoped_handlers = self._scoped.get(scope)
+                if scoped_handlers:
+                    handlers = handlers + scoped_handlers
+
+        # ハンドラが存在しない場合は何もせず終了する。ログはDEBUG有効時のみ組み立てる。
         if not handlers:
-            self._logger.debug("イベント'%s'に登録されたハンドラはありません。", event)
+            if self._debug_enabled():
+                self._logger.debug("イベント'%s'に登録されたハンドラはありません。", event)
             return
 
-        # ハンドラをコピーし、例外発生時も後続が実行されるよう保護する。
-        for handler in list(handlers):
+        # 例外の無い通常時は1つのtryで全ハンドラを呼び出す。
+        # 例外発生時はログを残し、同じイテレータから後続のハンドラを再開する。
+        remaining = iter(handlers)
+        while True:
             try:
-                handler(payload)
+                for handler in remaining:
+                    handler(payload)
+                return
             except Exception:  # noqa: BLE001
                 self._logger.exception("イベント'%s'のハンドラ実行中に例外が発生しました。", event)
+
+    def _debug_enabled(self) -> bool:
+        """DEBUGログが有効かを返す。
+
+        レベルの判定結果はloggingモジュール側でキャッシュされるため、
+        実行中のレベル変更にも追従しつつ、無効時はログ呼び出し自体を省ける。
+        """
+        return self._logger.isEnabledFor(logging.DEBUG)
+
+    def _scopes_for(self, event: str) -> Tuple[str, ...]:
+        """イベント名を含むスコープを浅い順に返す。結果はイベント名ごとにキャッシュする。"""
+        scopes = self._prefix_cache.get(event)
+        if scopes is None:
+            parts = event.split(".")
+            # 分割で生成した文字列も intern し、スコープ辞書の検索を同一性比較で済ませる。
+            scopes = ("",) + tuple(
+                sys.intern(".".join(parts[:depth])) for depth in range(1, len(parts) + 1)
+            )
+            self._prefix_cache[event] = scopes
+        return scopes
+
+
+def _register(
+    registry: Dict[str, Dict[Handler, None]],
+    snapshots: Dict[str, Tuple[Handler, ...]],
+    key: str,
+    handler: Handler,
+) -> bool:
+    """登録簿へハンドラを追加し、配信用タプルを更新する。
+
+    Returns:
+        bool: 新たに登録された場合はTrue。登録済みの場合はFalse。
+    """
+    handlers = registry.setdefault(key, {})
+    if handler in handlers:
+        return False
+    handlers[handler] = None
+    snapshots[key] = tuple(handlers)
+    return True
+
+
+def _unregister(
+    registry: Dict[str, Dict[Handler, None]],
+    snapshots: Dict[str, Tuple[Handler, ...]],
+    key: str,
+    handler: Handler,
+) -> bool:
+    """登録簿からハンドラを除去し、配信用タプルを更新する。
+
+    Returns:
+        bool: 登録が解除された場合はTrue。未登録の場合はFalse。
+    """
+    handlers = registry.get(key)
+    if handlers is None or handler not in handlers:
+        return False
+    del handlers[handler]
+    if handlers:
+        snapshots[key] = tuple(handlers)
+    else:
+        # 空になったキーは残さず、has_subscribersの判定を正しく保つ。
+        del registry[key]
+        del snapshots[key]
+    return True
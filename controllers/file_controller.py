@@ -2,14 +2,32 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Callable, NamedTuple, Optional
 
+from PySide6.QtCore import QSignalBlocker, QThreadPool
+from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import QPlainTextEdit
 
+from controllers.background import BackgroundRunner
 from models.file_model import FileModel
 from models.tab_model import TabState
 from views.editor_tab_widget import EditorTabWidget
 
+# エディタウィジェットにタブIDを保持させる動的プロパティ名。
+_TAB_ID_PROPERTY = "tab_id"
+
+
+class _SaveRequest(NamedTuple):
+    """バックグラウンド保存1回分の内容と完了時の通知先。"""
+
+    tab_id: str
+    editor: QPlainTextEdit
+    path: Path
+    text: str
+    revision: int
+    on_saved: Callable[[Optional[Path]], None]
+    on_failed: Optional[Callable[[Exception], None]]
+
 
 class FileController:
     """ファイル操作とエディタタブの連携を担うコントローラ。"""
@@ -21,6 +39,7 @@ class FileController:
         tab_view: EditorTabWidget,
         *,
         logger: Optional[logging.Logger] = None,
+        thread_pool: Optional[QThreadPool] = None,
     ) -> None:
         """必要な依存を受け取り内部状態を初期化する。
 
@@ -29,14 +48,18 @@ class FileController:
             tab_state (TabState): タブの状態管理を行うモデル。
             tab_view (EditorTabWidget): エディタタブのビュー。
             logger (Optional[logging.Logger]): ログ出力に使用するロガー。
+            thread_pool (Optional[QThreadPool]): 非同期の読み書きに使用するスレッドプール。
         """
         self._file_model = file_model
         self._tab_state = tab_state
         self._tab_view = tab_view
         self._logger = logger or logging.getLogger("my_editor.file_controller")
+        self._background = BackgroundRunner(thread_pool)
+        # 書き込み中のパスと、その完了後に書き込む最新の保存要求。キーが存在する間は書き込み中を表す。
+        self._queued_saves: dict[Path, Optional[_SaveRequest]] = {}
 
-        # エディタウィジェットとタブIDの対応関係を追跡する。
-        self._tab_id_by_editor: dict[QPlainTextEdit, str] = {}
+        # タブIDはエディタ自身のプロパティに持たせ、逆引き用にIDからエディタへの辞書を保持する。
+        self._editor_by_tab_id: dict[str, QPlainTextEdit] = {}
         self._untitled_counter = 1
         self._tab_view.set_close_request_handler(self._handle_tab_close_requested)
 
@@ -52,35 +75,102 @@ class FileController:
         self._logger.info("ファイルを開きます: %s", path)
         content = self._file_model.load_file(path)
 
-        tab_id = self._tab_state.add_tab(path)
-        tab_index = self._tab_view.add_editor_tab(path, content)
+        tab_index, _ = self._add_file_tab(path, content)
+        return tab_index
+
+    def open_file_async(
+        self,
+        path: Path,
+        *,
+        on_failed: Optional[Callable[[Exception], None]] = None,
+    ) -> int:
+        """タブを先に生成し、ファイル内容はスレッドプール上で読み込んでから表示する。
+
+        読み込み中のエディタは読み取り専用とし、完了後に内容を設定して編集可能にする。
+        読み込みに失敗した場合はタブを閉じ、on_failedへ例外を渡す。
 
-        editor_widget = self._tab_view.widget(tab_index)
-        if not isinstance(editor_widget, QPlainTextEdit):
-            self._logger.error("エディタウィジェットの生成に失敗しました: index=%s", tab_index)
-            raise RuntimeError("エディタウィジェットの生成に失敗しました。")
+        Args:
+            path (Path): 開くファイルのパス。
+            on_failed (Optional[Callable[[Exception], None]]): 読み込み失敗時に例外を受け取るコールバック。
 
-        self._tab_id_by_editor[editor_widget] = tab_id
-        editor_widget.textChanged.connect(lambda editor=editor_widget: self.on_editor_text_changed(editor))
-        self._tab_view.setCurrentIndex(tab_index)
+        Returns:
+            int: 追加されたタブのインデックス。
+        """
+        self._logger.info("ファイルをバックグラウンドで開きます: %s", path)
+        tab_index, editor = self._add_file_tab(path, "")
+        tab_id = self._require_tab_id(editor)
+        editor.setReadOnly(True)
+        editor.setPlaceholderText("読み込み中…")
+
+        self._background.run(
+            lambda: self._file_model.load_file(path),
+            lambda content: self._finish_loading(tab_id, editor, content),
+            lambda exc: self._fail_loading(tab_id, editor, path, exc, on_failed),
+        )
         return tab_index
 
+    def _add_file_tab(self, path: Path, content: str) -> tuple[int, QPlainTextEdit]:
+        """ファイル用のタブを追加してアクティブにし、エディタを登録する。
+
+        追加とアクティブ化の間に発生するcurrentChangedは抑止し、変化があった場合のみ最後に1回通知する。
+        """
+        previous_index = self._tab_view.currentIndex()
+        with QSignalBlocker(self._tab_view):
+            tab_id = self._tab_state.add_tab(path)
+            tab_index = self._tab_view.add_editor_tab(path, content)
+
+            editor_widget = self._tab_view.widget(tab_index)
+            if not isinstance(editor_widget, QPlainTextEdit):
+                self._logger.error("エディタウィジェットの生成に失敗しました: index=%s", tab_index)
+                raise RuntimeError("エディタウィジェットの生成に失敗しました。")
+
+            self._register_editor(editor_widget, tab_id)
+            self._tab_view.setCurrentIndex(tab_index)
+
+        if tab_index != previous_index:
+            self._tab_view.currentChanged.emit(tab_index)
+        return tab_index, editor_widget
+
+    def _finish_loading(self, tab_id: str, editor: QPlainTextEdit, content: object) -> None:
+        """読み込み完了後にエディタへ内容を設定する。読み込み中に閉じられたタブは無視する。"""
+        if self._editor_by_tab_id.get(tab_id) is not editor:
+            self._logger.debug("読み込み完了前にタブが閉じられました: id=%s", tab_id)
+            return
+
+        # setPlainTextは変更済みフラグを最後に戻すが、途中でmodificationChangedが発火してダーティ扱いになる。
+        # 読み込んだ内容は保存済みと同じため、外部編集の反映と同様に未変更へ戻す。
+        editor.setPlainText(str(content))
+        editor.setPlaceholderText("")
+        editor.setReadOnly(False)
+        self._tab_state.mark_dirty(tab_id, False)
+
+        tab_index = self._tab_view.indexOf(editor)
+        if tab_index != -1:
+            self._tab_view.set_dirty(tab_index, False)
+
+    def _fail_loading(
+        self,
+        tab_id: str,
+        editor: QPlainTextEdit,
+        path: Path,
+        exc: Exception,
+        on_failed: Optional[Callable[[Exception], None]],
+    ) -> None:
+        """読み込み失敗時にタブを閉じて呼び出し元へ通知する。"""
+        self._logger.warning("読み込みに失敗したためタブを閉じます: %s (%s)", path, exc)
+        if self._editor_by_tab_id.get(tab_id) is editor:
+            self._close_editor(editor)
+
+        if on_failed is not None:
+            on_failed(exc)
+
     def create_new_file(self) -> Path:
         """空のエディタタブを生成して編集を開始する。"""
         placeholder_path = self._generate_untitled_path()
-        tab_id = self._tab_state.add_tab(placeholder_path)
-        tab_index = self._tab_view.add_editor_tab(placeholder_path, "")
-
-        editor_widget = self._tab_view.widget(tab_index)
-        if not isinstance(editor_widget, QPlainTextEdit):
-            self._logger.error("新規タブのエディタウィジェット生成に失敗しました: index=%s", tab_index)
-            raise RuntimeError("新規タブのエディタウィジェット生成に失敗しました。")
-
-        self._tab_id_by_editor[editor_widget] = tab_id
-        editor_widget.textChanged.connect(lambda editor=editor_widget: self.on_editor_text_changed(editor))
+        tab_index, editor_widget = self._add_file_tab(placeholder_path, "")
+        tab_id = self._require_tab_id(editor_widget)
         self._tab_state.mark_dirty(tab_id, True)
         self._tab_view.set_dirty(tab_index, True)
-        self._tab_view.setCurrentIndex(tab_index)
         self._logger.info("空のエディタタブを生成しました: id=%s path=%s", tab_id, placeholder_path)
         return placeholder_path
 
@@ -98,15 +188,94 @@ class FileController:
         target_path = self._tab_state.get_file_path(tab_id)
         self._logger.info("ファイルを保存します: %s", target_path)
 
-        self._file_model.save_file(target_path, editor.toPlainText())
+        self._file_model.save_document(target_path, editor.document())
         self._tab_state.mark_dirty(tab_id, False)
-
-        tab_index = self._tab_view.indexOf(editor)
-        if tab_index != -1:
-            self._tab_view.set_dirty(tab_index, False)
+        self._refresh_saved_tab(editor)
 
         return target_path
 
+    def save_current_file_async(
+        self,
+        on_saved: Callable[[Optional[Path]], None],
+        on_failed: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """アクティブなタブの内容をスレッドプール上で保存する。
+
+        QTextDocumentはGUIスレッド外から参照できないため、保存する文字列はGUIスレッドで確定させ、
+        書き込みのみをワーカーで行う。このためFileModel.save_documentのブロック単位の書き出しは使えず、
+        保存時にはtoPlainTextによる全文の一時コピーが残る。同じパスへの保存は順に1件ずつ書き込み、書き込み中に重ねて
+        要求された場合は最新の1件だけを待機させる(破棄された要求のコールバックは呼ばれない)。
+        書き込み中にさらに編集された場合はダーティ状態を維持する。
+
+        Args:
+            on_saved (Callable[[Optional[Path]], None]): 保存完了時に保存先パスを受け取るコールバック。
+                保存対象が無い場合はNoneを受け取る。
+            on_failed (Optional[Callable[[Exception], None]]): 保存失敗時に例外を受け取るコールバック。
+        """
+        editor = self._extract_current_editor()
+        if editor is None:
+            on_saved(None)
+            return
+
+        tab_id = self._require_tab_id(editor)
+        target_path = self._tab_state.get_file_path(tab_id)
+        self._logger.info("ファイルをバックグラウンドで保存します: %s", target_path)
+
+        request = _SaveRequest(
+            tab_id=tab_id,
+            editor=editor,
+            path=target_path,
+            # 書き込み中も編集を続けられるよう全文のスナップショットを取る。ドキュメントの複製でも
+            # 同じ量のコピーが必要なため、ブロック単位の書き出しは同期保存の経路に限られる。
+            text=editor.toPlainText(),
+            revision=editor.document().revision(),
+            on_saved=on_saved,
+            on_failed=on_failed,
+        )
+        self._submit_save(request)
+
+    def _submit_save(self, request: _SaveRequest) -> None:
+        """保存要求をワーカーへ渡す。同じパスへの書き込み中は完了まで待たせる。
+
+        待機中の要求は最新の1件のみを保持し、古い内容の書き込みは破棄する。
+        """
+        if request.path in self._queued_saves:
+            self._logger.debug("書き込み中のため保存を待機させます: %s", request.path)
+            self._queued_saves[request.path] = request
+            return
+
+        self._queued_saves[request.path] = None
+        self._background.run(
+            lambda: self._file_model.save_file(request.path, request.text),
+            lambda _result: self._finish_save(request),
+            lambda exc: self._fail_save(request, exc),
+        )
+
+    def _finish_save(self, request: _SaveRequest) -> None:
+        """保存完了を反映する。書き込み中に編集された場合はダーティ状態を維持する。"""
+        pending = self._queued_saves.pop(request.path, None)
+        editor = request.editor
+        if (
+            self._editor_by_tab_id.get(request.tab_id) is editor
+            and editor.document().revision() == request.revision
+        ):
+            self._tab_state.mark_dirty(request.tab_id, False)
+            self._refresh_saved_tab(editor)
+        request.on_saved(request.path)
+
+        if pending is not None:
+            self._submit_save(pending)
+
+    def _fail_save(self, request: _SaveRequest, exc: Exception) -> None:
+        """保存失敗を通知し、待機中の保存があれば続けて実行する。"""
+        pending = self._queued_saves.pop(request.path, None)
+        self._logger.warning("バックグラウンド保存に失敗しました: %s (%s)", request.path, exc)
+        if request.on_failed is not None:
+            request.on_failed(exc)
+
+        if pending is not None:
+            self._submit_save(pending)
+
     def save_file_as(self, path: Path) -> Optional[Path]:
         """アクティブなタブの内容を別名で保存する。
 
@@ -124,16 +293,25 @@ class FileController:
         resolved = path.expanduser().resolve(strict=False)
         self._logger.info("別名でファイルを保存します: %s", resolved)
 
-        self._file_model.save_file(resolved, editor.toPlainText())
-        self._tab_state.update_path(tab_id, resolved)
-        self._tab_state.mark_dirty(tab_id, False)
+        self._file_model.save_document(resolved, editor.document())
+        self._tab_state.apply_saved(tab_id, resolved)
+        self._refresh_saved_tab(editor, resolved)
 
+        return resolved
+
+    def _refresh_saved_tab(self, editor: QPlainTextEdit, new_path: Optional[Path] = None) -> None:
+        """保存後のタブ表示を更新する。複数の変更を1回の再描画へまとめる。"""
         tab_index = self._tab_view.indexOf(editor)
-        if tab_index != -1:
-            self._tab_view.update_tab_path(tab_index, resolved)
-            self._tab_view.set_dirty(tab_index, False)
+        if tab_index == -1:
+            return
 
-        return resolved
+        self._tab_view.setUpdatesEnabled(False)
+        try:
+            if new_path is not None:
+                self._tab_view.update_tab_path(tab_index, new_path)
+            self._tab_view.set_dirty(tab_index, False)
+        finally:
+            self._tab_view.setUpdatesEnabled(True)
 
     def apply_external_edit(self, path: Path, new_content: str) -> None:
         """外部から提供された内容でファイルを上書きし、タブを更新する。"""
@@ -152,10 +330,18 @@ class FileController:
             self._logger.warning("編集対象タブに対応するエディタが見つかりません: id=%s", tab_id)
             return
 
+        # ドキュメントを作り直さず1つの編集ブロックで置き換え、取り消し履歴とスクロール位置を保つ。
+        scroll_bar = editor.verticalScrollBar()
+        scroll_value = scroll_bar.value()
         previous_state = editor.blockSignals(True)
-        editor.setPlainText(new_content)
+        cursor = QTextCursor(editor.document())
+        cursor.beginEditBlock()
+        cursor.select(QTextCursor.SelectionType.Document)
+        cursor.insertText(new_content)
+        cursor.endEditBlock()
         editor.document().setModified(False)
         editor.blockSignals(previous_state)
+        scroll_bar.setValue(scroll_value)
 
         self._tab_state.mark_dirty(tab_id, False)
 
@@ -200,7 +386,7 @@ class FileController:
         closed_path = self._tab_view.close_tab(tab_index)
 
         self._tab_state.close_tab(tab_id)
-        self._tab_id_by_editor.pop(editor, None)
+        self._editor_by_tab_id.pop(tab_id, None)
         self._logger.info("タブを閉じました: id=%s path=%s", tab_id, target_path)
         return closed_path
 
@@ -233,15 +419,30 @@ class FileController:
         if tab_index != -1:
             self._tab_view.set_dirty(tab_index, True)
 
-        self._logger.info("タブをダーティ状態へ更新しました: id=%s", tab_id)
+        self._logger.debug("タブをダーティ状態へ更新しました: id=%s", tab_id)
+
+    def _register_editor(self, editor: QPlainTextEdit, tab_id: str) -> None:
+        """エディタへタブIDを設定し、IDからの逆引きと変更検知を登録する。"""
+        editor.setProperty(_TAB_ID_PROPERTY, tab_id)
+        self._editor_by_tab_id[tab_id] = editor
+        # textChangedは打鍵ごとに発火するため、未変更と変更済みの切り替わり時のみ発火する
+        # modificationChangedで検知する。保存時はset_dirty(False)で未変更へ戻る。
+        editor.document().modificationChanged.connect(
+            lambda modified, target=editor: self._handle_modification_changed(target, modified)
+        )
+
+    def _handle_modification_changed(self, editor: QPlainTextEdit, modified: bool) -> None:
+        """ドキュメントが変更済みへ切り替わった時にダーティ状態を更新する。"""
+        if modified:
+            self.on_editor_text_changed(editor)
 
     def _require_tab_id(self, editor: QPlainTextEdit) -> str:
         """エディタに紐づくタブIDを取得する。存在しない場合は例外を送出する。"""
-        try:
-            return self._tab_id_by_editor[editor]
-        except KeyError as exc:
-            self._logger.error("タブIDの特定に失敗しました。", exc_info=exc)
-            raise KeyError("タブIDが関連付けられていません。") from exc
+        tab_id = editor.property(_TAB_ID_PROPERTY)
+        if not isinstance(tab_id, str) or self._editor_by_tab_id.get(tab_id) is not editor:
+            self._logger.error("タブIDの特定に失敗しました。")
+            raise KeyError("タブIDが関連付けられていません。")
+        return tab_id
 
     def _generate_untitled_path(self) -> Path:
         """未保存ファイル用の一時パスを生成する。"""
@@ -251,7 +452,4 @@ class FileController:
 
     def _find_editor_by_tab_id(self, tab_id: str) -> Optional[QPlainTextEdit]:
         """タブIDに対応するエディタウィジェットを取得する。"""
-        for editor, current_id in self._tab_id_by_editor.items():
-            if current_id == tab_id:
-                return editor
-        return None
+        return self._editor_by_tab_id.get(tab_id)
@@ -2,19 +2,75 @@ from __future__ import annotations
 
 import itertools
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Optional
 
+from PySide6.QtCore import QCoreApplication, QObject, QSignalBlocker, Qt, QThread, Signal, Slot
 from PySide6.QtWidgets import QInputDialog
 
 from exceptions import FileOperationError
-from models.folder_model import FolderModel
+from models.folder_model import DirectoryEntry, FolderModel
 from views.folder_tree import FolderNode, FolderTree
 
 
+@lru_cache(maxsize=4096)
+def _normalize_cached(raw: str) -> Path:
+    """パス文字列を展開・正規化する。同じ入力に対するresolveのシステムコールを繰り返さない。"""
+    return Path(raw).expanduser().resolve(strict=False)
+
+
+class _ScanCancelled(Exception):
+    """新しい走査の開始により、実行中の走査が不要になったことを表す。"""
+
+
+class FolderScanResults(QObject):
+    """走査結果をGUIスレッドで再送出する中継オブジェクト。"""
+
+    finished = Signal(object)
+    failed = Signal(object)
+
+
+class FolderScanWorker(QObject):
+    """フォルダ走査をワーカースレッドで実行し、結果をシグナルで通知する。"""
+
+    finished = Signal(object)
+    failed = Signal(object)
+    done = Signal()
+
+    def __init__(self, scan: Callable[[], FolderNode]) -> None:
+        """走査処理を受け取り初期化する。
+
+        Args:
+            scan (Callable[[], FolderNode]): ワーカースレッドで実行する走査処理。
+        """
+        super().__init__()
+        self._scan = scan
+        # ワーカー自身はスレッドへ移動するため、結果は生成元(GUI)スレッドに残る中継オブジェクトで受け取る。
+        # 移動済みのオブジェクトに接続した関数はワーカースレッドで呼ばれてしまうため、直接接続しない。
+        self.results = FolderScanResults()
+        self.finished.connect(self.results.finished)
+        self.failed.connect(self.results.failed)
+
+    @Slot()
+    def run(self) -> None:
+        """走査を実行し、完成したルートノードまたは例外を通知する。"""
+        try:
+            node = self._scan()
+        except Exception as exc:  # noqa: BLE001
+            self.failed.emit(exc)
+        else:
+            self.finished.emit(node)
+        finally:
+            self.done.emit()
+
+
 class FolderController:
     """フォルダモデルとビューを調停するコントローラ。"""
 
+    # 終了時や中断時に走査スレッドの停止を待つ上限(ミリ秒)。
+    _SCAN_WAIT_MS = 2000
+
     def __init__(
         self,
         folder_model: FolderModel,
@@ -27,10 +83,19 @@ class FolderController:
         self._folder_view = folder_view
         self._logger = logger or logging.getLogger("my_editor.folder_controller")
         self._current_root: Optional[Path] = None
+        # 走査の世代番号。新しい走査を開始すると古い走査の結果は破棄される。
+        self._scan_generation = 0
+        # 実行中の走査スレッドとワーカー。終了まで参照を保持してGCによる破棄を防ぐ。
+        self._active_scans: set[tuple[QThread, FolderScanWorker]] = set()
+        # 走査中のみaboutToQuitへ接続し、待機中のコントローラをアプリケーションから参照させない。
+        self._watching_quit = False
         self._folder_view.set_context_action_handler(self._apply_context_action)
+        self._folder_view.set_expand_handler(self.expand)
 
     def load_initial_tree(self, path: Path) -> None:
         """ルートディレクトリを読み込みツリービューを構築する。"""
+        # ルートが変わるとシンボリックリンクの解決結果も変わり得るため、正規化キャッシュを破棄する。
+        _normalize_cached.cache_clear()
         resolved = self._normalize(path)
         if not resolved.exists():
             self._logger.error("ルートディレクトリが存在しません: %s", resolved)
@@ -40,10 +105,109 @@ class FolderController:
             raise FileOperationError(f"ルートがディレクトリではありません: {resolved}")
 
         self._current_root = resolved
-        root_node = self._build_node(resolved)
-        self._folder_view.populate([root_node])
-        self._attempt_select(resolved)
-        self._logger.info("フォルダツリーを初期化しました: %s", resolved)
+        # ルート直下の列挙はワーカースレッドで行い、GUIスレッドではビューの構築のみを行う。
+        self._start_scan(resolved, select_path=resolved)
+        self._logger.info("フォルダツリーの読み込みを開始しました: %s", resolved)
+
+    def expand(self, path: Path) -> list[FolderNode]:
+        """指定ディレクトリ直下の子ノードを1階層分だけ生成する。
+
+        Args:
+            path (Path): 展開するディレクトリ。
+
+        Returns:
+            list[FolderNode]: 並び替え済みの子ノード。サブディレクトリは未読込として返す。
+        """
+        node = self._build_node(path)
+        return list(node.children or [])
+
+    def refresh_path(self, path: Path) -> None:
+        """指定ディレクトリ直下だけを読み込み直してビューへ反映する。
+
+        Raises:
+            FileOperationError: ディレクトリがツリーに存在しない、または列挙に失敗した場合。
+        """
+        self._folder_view.replace_children(path, self.expand(path))
+
+    def cancel_scan(self) -> None:
+        """実行中のフォルダ走査を中断し、一定時間までスレッドの終了を待つ。"""
+        self._scan_generation += 1
+        for entry in list(self._active_scans):
+            thread = entry[0]
+            thread.quit()
+            # 走査は次のエントリで中断を検知するため通常はすぐ終わる。応答しない場合もGUIを止め続けない。
+            if thread.wait(self._SCAN_WAIT_MS):
+                self._active_scans.discard(entry)
+            else:
+                # 実行中のQThreadを破棄しないよう、終了しなかった走査は参照を保持したままにする。
+                self._logger.warning("フォルダ走査スレッドが時間内に終了しませんでした。")
+        if not self._active_scans:
+            self._watch_app_quit(False)
+
+    def _start_scan(self, root: Path, *, select_path: Optional[Path]) -> None:
+        """ルート配下の走査をワーカースレッドで開始する。実行中の走査は中断扱いとする。"""
+        self._scan_generation += 1
+        generation = self._scan_generation
+
+        def is_cancelled() -> bool:
+            return generation != self._scan_generation
+
+        worker = FolderScanWorker(lambda: self._build_node(root, is_cancelled=is_cancelled))
+        thread = QThread()
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.results.finished.connect(lambda node: self._apply_scan_result(generation, node, select_path))
+        worker.results.failed.connect(lambda exc: self._handle_scan_failure(generation, root, exc))
+        # quitはスレッドセーフなため、GUIスレッドがwait中でも終了できるようワーカースレッドから直接呼ぶ。
+        worker.done.connect(thread.quit, Qt.ConnectionType.DirectConnection)
+
+        entry = (thread, worker)
+        thread.finished.connect(lambda: self._forget_scan(entry), Qt.ConnectionType.QueuedConnection)
+        self._active_scans.add(entry)
+        self._watch_app_quit(True)
+        thread.start()
+
+    def _forget_scan(self, entry: tuple[QThread, FolderScanWorker]) -> None:
+        """終了した走査の参照を破棄し、走査が無くなればaboutToQuitとの接続を解除する。"""
+        self._active_scans.discard(entry)
+        if not self._active_scans:
+            self._watch_app_quit(False)
+
+    def _watch_app_quit(self, watch: bool) -> None:
+        """アプリケーション終了時に走査を中断するための接続を切り替える。"""
+        app = QCoreApplication.instance()
+        if app is None or watch == self._watching_quit:
+            return
+        if watch:
+            app.aboutToQuit.connect(self.cancel_scan)
+        else:
+            app.aboutToQuit.disconnect(self.cancel_scan)
+        self._watching_quit = watch
+
+    def _apply_scan_result(self, generation: int, root_node: FolderNode, select_path: Optional[Path]) -> None:
+        """走査結果をビューへ反映する。古い世代の結果は破棄する。"""
+        if generation != self._scan_generation:
+            return
+
+        # 再構築中の選択解除や展開のシグナルは抑止し、再描画も最後の1回にまとめる。
+        # ルートは子要素を読み込み済みのため、展開シグナルを止めても遅延読み込みは発生しない。
+        view = self._folder_view
+        view.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(view):
+                view.populate([root_node])
+            if select_path is not None and select_path.exists():
+                self._attempt_select(select_path)
+        finally:
+            view.setUpdatesEnabled(True)
+        self._logger.info("フォルダツリーを初期化しました: %s", root_node.path)
+
+    def _handle_scan_failure(self, generation: int, root: Path, exc: Exception) -> None:
+        """走査中の例外を記録する。中断された古い走査の例外は無視する。"""
+        if generation != self._scan_generation:
+            return
+        self._logger.error("フォルダツリーの走査に失敗しました: %s", root, exc_info=exc)
 
     def handle_create(self, path: Path, is_dir: bool) -> None:
         """新しいファイルまたはディレクトリを作成しツリーを更新する。"""
@@ -55,8 +219,8 @@ class FolderController:
         try:
             self._insert_into_view(target, is_dir=is_dir)
         except FileOperationError as exc:
-            self._logger.warning("部分更新に失敗したため全体更新を実施します。", exc_info=exc)
-            self._rebuild_tree(select_path=target)
+            self._logger.warning("部分更新に失敗したため親ディレクトリを再読み込みします。", exc_info=exc)
+            self._refresh_parent(self._normalize(target.parent), select_path=target)
         else:
             self._attempt_select(target)
         self._logger.info("項目を作成しツリーを更新しました: %s", target)
@@ -75,8 +239,8 @@ class FolderController:
         try:
             self._remove_from_view(target)
         except FileOperationError as exc:
-            self._logger.warning("部分更新に失敗したため全体更新を実施します。", exc_info=exc)
-            self._rebuild_tree(select_path=parent)
+            self._logger.warning("部分更新に失敗したため親ディレクトリを再読み込みします。", exc_info=exc)
+            self._refresh_parent(parent, select_path=parent)
         else:
             self._attempt_select(parent)
         self._logger.info("項目を削除しツリーを更新しました: %s", target)
@@ -127,7 +291,7 @@ class FolderController:
             raise FileOperationError(f"親ディレクトリがルート配下にありません: {parent_path}")
 
         resolved = self._normalize(path)
-        node_children: Iterable[FolderNode] | None = [] if is_dir else None
+        node_children: tuple[FolderNode, ...] | None = () if is_dir else None
         node = FolderNode(
             name=resolved.name or str(resolved),
             path=resolved,
@@ -143,28 +307,77 @@ class FolderController:
             raise FileOperationError(f"削除対象がルート配下にありません: {resolved}")
         self._folder_view.remove_path(resolved)
 
+    def _refresh_parent(self, parent: Path, *, select_path: Optional[Path]) -> None:
+        """親ディレクトリ直下を再読み込みし、失敗した場合は全体を再構築する。"""
+        try:
+            self.refresh_path(parent)
+        except FileOperationError as exc:
+            self._logger.warning("親ディレクトリの再読み込みに失敗したため全体更新を実施します。", exc_info=exc)
+            self._rebuild_tree(select_path=select_path)
+            return
+
+        if select_path is not None and select_path.exists():
+            self._attempt_select(select_path)
+
     def _rebuild_tree(self, select_path: Optional[Path]) -> None:
         """ルート配下全体を再構築するフォールバック。"""
         root = self._require_root()
-        root_node = self._build_node(root)
-        self._folder_view.populate([root_node])
+        self._start_scan(root, select_path=select_path)
 
-        if select_path is not None and select_path.exists():
-            self._attempt_select(select_path)
+    def _build_node(
+        self,
+        path: Path,
+        *,
+        depth: int = 1,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> FolderNode:
+        """指定パスを起点に、指定階層までのフォルダノードを生成する。
 
-    def _build_node(self, path: Path) -> FolderNode:
-        """指定パスを起点にフォルダノードを再帰的に生成する。"""
+        より深いディレクトリは子要素を未読込のノードとし、展開時に読み込む。
+
+        Args:
+            path (Path): 走査の起点。
+            depth (int): 子要素を読み込む階層数。0の場合は起点自体を未読込とする。
+            is_cancelled (Optional[Callable[[], bool]]): 走査の中断要否を返す関数。
+
+        Raises:
+            _ScanCancelled: 走査が中断された場合。
+        """
         resolved = self._normalize(path)
-        is_directory = resolved.is_dir()
-        children: Iterable[FolderNode] | None = None
+        return self._make_node(resolved, resolved.is_dir(), depth, is_cancelled)
 
-        if is_directory:
-            entries = self._folder_model.list_directory(resolved)
-            ordered_entries = self._sort_entries(entries)
-            children = [self._build_node(entry) for entry in ordered_entries]
+    def _make_node(
+        self,
+        resolved: Path,
+        is_directory: bool,
+        depth: int,
+        is_cancelled: Optional[Callable[[], bool]],
+    ) -> FolderNode:
+        """種別が判明している正規化済みパスからノードを生成する。
+
+        子エントリの種別は走査結果から取得し、エントリごとのstatやresolveを行わない。
+        """
+        if is_cancelled is not None and is_cancelled():
+            raise _ScanCancelled(str(resolved))
 
         name = resolved.name or str(resolved)
-        return FolderNode(name=name, path=resolved, is_directory=is_directory, children=children)
+        if not is_directory:
+            return FolderNode(name=name, path=resolved, is_directory=False)
+        if depth <= 0:
+            return FolderNode(name=name, path=resolved, is_directory=True, is_lazy=True)
+
+        entries = self._sort_entries(self._folder_model.scan_directory(resolved))
+        children = tuple(
+            self._make_node(
+                # 親は正規化済みのため、リンク先の解決が必要なシンボリックリンクのみresolveする。
+                self._normalize(entry.path) if entry.is_symlink else entry.path,
+                entry.is_directory,
+                depth - 1,
+                is_cancelled,
+            )
+            for entry in entries
+        )
+        return FolderNode(name=name, path=resolved, is_directory=True, children=children)
 
     def _attempt_select(self, path: Path) -> None:
         """ツリー内のパスを選択し、存在しない場合は警告ログを残す。"""
@@ -193,14 +406,14 @@ class FolderController:
 
     @staticmethod
     def _normalize(path: Path) -> Path:
-        """パスを正規化して返す。"""
-        return path.expanduser().resolve(strict=False)
+        """パスを正規化して返す。結果は文字列表現をキーにキャッシュする。"""
+        return _normalize_cached(str(path))
 
-    def _sort_entries(self, entries: Iterable[Path]) -> list[Path]:
+    def _sort_entries(self, entries: Iterable[DirectoryEntry]) -> list[DirectoryEntry]:
         """ディレクトリを優先して名前順にエントリを並べ替える。"""
         sorted_entries = sorted(
             entries,
-            key=lambda entry: (0 if entry.is_dir() else 1, entry.name.casefold()),
+            key=lambda entry: (0 if entry.is_directory else 1, entry.path.name.casefold()),
         )
         return sorted_entries
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from typing import Callable, Optional
 
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QWidget
 
 from settings.model import SettingsModel
@@ -26,6 +27,9 @@ class SettingsController:
         self._logger = logger or logging.getLogger("my_editor.settings_controller")
         self._settings_model = settings_model or SettingsModel()
         self._dialog_factory: DialogFactory = dialog_factory or self._default_dialog_factory
+        # 非同期表示用のダイアログは初回に生成し、同じ親からの再表示では使い回す。
+        self._dialog: Optional[SettingsDialog] = None
+        self._dialog_parent: Optional[QWidget] = None
 
     def open_dialog(self, parent: QWidget | None = None) -> bool:
         """設定ダイアログを開き操作結果を返す。"""
@@ -33,6 +37,39 @@ class SettingsController:
         result = dialog.exec()
         return result == dialog.DialogCode.Accepted
 
+    def open_dialog_async(
+        self,
+        on_finished: Callable[[bool], None],
+        parent: QWidget | None = None,
+    ) -> None:
+        """設定ダイアログをイベントループを止めずに表示し、閉じた時点で結果を通知する。
+
+        Args:
+            on_finished (Callable[[bool], None]): ダイアログ終了時に保存されたかどうかを受け取る関数。
+            parent (QWidget | None): 親ウィジェット。
+        """
+        dialog = self._dialog
+        if dialog is not None and dialog.isVisible():
+            # 表示中の場合は前面へ出すだけにし、終了通知の重複登録を避ける。
+            dialog.raise_()
+            dialog.activateWindow()
+            return
+
+        if dialog is None or self._dialog_parent is not parent:
+            dialog = self._dialog_factory(self._settings_model, parent, self._logger)
+            self._dialog = dialog
+            self._dialog_parent = parent
+        else:
+            # 前回キャンセル時の入力が残らないよう、再表示前にモデルの値を読み直す。
+            self.load_settings_into_dialog(dialog)
+
+        accepted_code = dialog.DialogCode.Accepted
+        dialog.finished.connect(
+            lambda result: on_finished(result == accepted_code),
+            Qt.ConnectionType.SingleShotConnection,
+        )
+        dialog.open()
+
     def _default_dialog_factory(
         self,
         model: SettingsModel,
@@ -48,10 +85,10 @@ class SettingsController:
             api_key = self._settings_model.get_api_key()
         except Exception:  # noqa: BLE001
             self._logger.exception("設定読み込みに失敗しました。")
-            return
+            api_key = None
 
-        if api_key is not None:
-            dialog.api_key_input.setText(api_key)
+        # ダイアログは再利用されるため、未保存の場合も入力欄を空にして前回の入力を残さない。
+        dialog.api_key_input.setText(api_key or "")
 
     def save_settings_from_dialog(self, dialog: SettingsDialog) -> None:
         """ダイアログの値をモデルへ保存する。"""
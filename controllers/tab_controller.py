@@ -9,6 +9,9 @@ from PySide6.QtWidgets import QPlainTextEdit
 from models.tab_model import TabState
 from views.editor_tab_widget import EditorTabWidget
 
+# エディタウィジェットにタブIDを保持させる動的プロパティ名。
+_TAB_ID_PROPERTY = "tab_id"
+
 
 class TabController:
     """タブ状態モデルとエディタビューを連携させるコントローラ。"""
@@ -24,7 +27,8 @@ class TabController:
         self._tab_state = tab_state
         self._tab_view = tab_view
         self._logger = logger or logging.getLogger("my_editor.tab_controller")
-        self._tab_id_by_editor: dict[QPlainTextEdit, str] = {}
+        # タブIDはエディタ自身のプロパティに持たせ、閉じる際はIDからエディタを直接引く。
+        self._editor_by_tab_id: dict[str, QPlainTextEdit] = {}
 
     def create_tab(self, path: Path, content: str) -> str:
         """新しいエディタタブを作成してタブIDを返す。"""
@@ -34,7 +38,8 @@ class TabController:
         self._tab_view.set_dirty(index, False)
         editor = self._tab_view.widget(index)
         if isinstance(editor, QPlainTextEdit):
-            self._tab_id_by_editor[editor] = tab_id
+            editor.setProperty(_TAB_ID_PROPERTY, tab_id)
+            self._editor_by_tab_id[tab_id] = editor
         self._logger.info("タブを生成しました: id=%s index=%s", tab_id, index)
         return tab_id
 
@@ -57,18 +62,15 @@ class TabController:
 
     def close_tab(self, tab_id: str) -> None:
         """指定されたタブを閉じ、ビュー上でも除去する。"""
-        for index in range(self._tab_view.count()):
-            widget = self._tab_view.widget(index)
-            if not isinstance(widget, QPlainTextEdit):
-                continue
-            if self._resolve_tab_id(widget) == tab_id:
-                self._tab_id_by_editor.pop(widget, None)
-                self._tab_view.close_tab(index)
-                break
-        else:
+        editor = self._editor_by_tab_id.get(tab_id)
+        index = self._tab_view.indexOf(editor) if editor is not None else -1
+        if index == -1:
             self._logger.error("指定されたタブIDがビュー内に見つかりません: %s", tab_id)
             raise KeyError(f"タブIDが存在しません: {tab_id}")
 
+        del self._editor_by_tab_id[tab_id]
+        self._tab_view.close_tab(index)
+
         self._tab_state.close_tab(tab_id)
         self._logger.info("タブを閉じました: id=%s", tab_id)
 
@@ -79,7 +81,8 @@ class TabController:
 
     def _resolve_tab_id(self, editor: QPlainTextEdit) -> str:
         """エディタウィジェットからタブIDを推定する。"""
-        if editor not in self._tab_id_by_editor:
+        tab_id = editor.property(_TAB_ID_PROPERTY)
+        if not isinstance(tab_id, str) or self._editor_by_tab_id.get(tab_id) is not editor:
             self._logger.error("タブIDがマッピングされていません。")
             raise KeyError("タブIDがマッピングされていません。")
-        return self._tab_id_by_editor[editor]
+        return tab_id
@@ -1,16 +1,42 @@
 from __future__ import annotations
 
 import logging
-from logging import Logger
+import time
+from logging import Logger, LogRecord
 from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
 
+from app_logging import start_queue_handler
+
 DEFAULT_RETENTION_DAYS = 30
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """秒単位の時刻文字列をキャッシュし、同一秒内のレコードでstrftimeを繰り返さないFormatter。"""
+
+    def __init__(self, fmt: str, datefmt: str) -> None:
+        super().__init__(fmt=fmt, datefmt=datefmt)
+        self._cached_second = -1
+        self._cached_text = ""
+
+    def formatTime(self, record: LogRecord, datefmt: str | None = None) -> str:
+        """レコードの生成時刻を秒単位で整形する。書式はコンストラクタで指定したものを使う。"""
+        # 整形はQueueListenerの単一スレッドで行われるため、キャッシュの更新に排他は不要。
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_text = time.strftime(self.datefmt or LOG_DATE_FORMAT, self.converter(second))
+            self._cached_second = second
+        return self._cached_text
 
 
 def setup_logging(log_path: Path, retention_days: int = DEFAULT_RETENTION_DAYS) -> Logger:
     """指定されたパスで日次ローテーション付きのロガーを構築する。
 
+    ファイルとコンソールへの出力はQueueListenerのスレッドで行い、
+    呼び出し元のスレッドはキューへの投入のみで戻る。
+
     Args:
         log_path (Path): ログを書き出すファイルパス。
         retention_days (int): 保持するログファイル数。デフォルトは30日分。
@@ -27,7 +53,8 @@ def setup_logging(log_path: Path, retention_days: int = DEFAULT_RETENTION_DAYS)
 
     # ログファイルパスをPath化し、ディレクトリを準備する。
     resolved_path = Path(log_path).expanduser().resolve()
-    resolved_path.parent.mkdir(parents=True, exist_ok=True)
+    if not resolved_path.parent.is_dir():
+        resolved_path.parent.mkdir(parents=True, exist_ok=True)
 
     # アプリケーションロガーを取得し、重複ハンドラを防ぐために初期化する。
     logger = logging.getLogger("my_editor")
@@ -39,31 +66,29 @@ def setup_logging(log_path: Path, retention_days: int = DEFAULT_RETENTION_DAYS)
         logger.removeHandler(handler)
         handler.close()
 
-    # 日次ローテーションするファイルハンドラを準備する。
+    # 日次ローテーションするファイルハンドラを準備する。ファイルは最初の書き込み時に開く。
     file_handler = TimedRotatingFileHandler(
         filename=str(resolved_path),
         when="midnight",
         interval=1,
         backupCount=retention_days,
         encoding="utf-8",
+        delay=True,
         utc=False,
     )
     file_handler.setLevel(logging.INFO)
 
-    # ログメッセージのフォーマットを設定する。
-    formatter = logging.Formatter(
-        fmt="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    # ログメッセージのフォーマットを設定する。時刻文字列は秒単位で使い回す。
+    formatter = _CachedTimeFormatter(fmt=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
     file_handler.setFormatter(formatter)
 
-    # ファイルハンドラをロガーへ追加する。
-    logger.addHandler(file_handler)
-
     # コンソール出力を追加してデバッグしやすくする。
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    # 両ハンドラはバックグラウンドスレッドで処理し、ロガーにはキューへの投入口のみを追加する。
+    # 終了時はloggingのshutdownがキューハンドラをクローズし、滞留分を書き出してから停止する。
+    logger.addHandler(start_queue_handler(file_handler, console_handler))
 
     return logger
@@ -2,19 +2,27 @@ from __future__ import annotations
 
 import logging
 import sys
+import weakref
+from functools import cache
 from pathlib import Path
 from types import TracebackType
-from typing import Callable, Sequence, cast
+from typing import TYPE_CHECKING, Callable, Sequence, cast
+
+from logging_config import setup_logging
+
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QApplication
 
-from PySide6.QtWidgets import QApplication, QMessageBox
 ExceptionHook = Callable[[type[BaseException], BaseException, TracebackType | None], None]
 
 
-def install_exception_hook(logger: logging.Logger) -> ExceptionHook:
+def install_exception_hook(logger: logging.Logger, app: QApplication | None = None) -> ExceptionHook:
     """グローバル例外ハンドラを登録してログ出力とユーザー通知を行う。
 
     Args:
         logger (logging.Logger): 例外発生時に利用するアプリケーションロガー。
+        app (QApplication | None): 通知に利用するアプリケーション。弱参照で保持し、
+            未指定の場合は例外発生時にQApplication.instance()から取得する。
 
     Returns:
         ExceptionHook: 置き換え前の例外ハンドラ。
@@ -22,18 +30,22 @@ def install_exception_hook(logger: logging.Logger) -> ExceptionHook:
 
     # 既存の例外ハンドラを保持し、必要に応じて委譲できるようにする。
     previous_hook = sys.excepthook
+    # 終了処理中のアプリケーションを延命しないよう弱参照で保持する。
+    app_ref = weakref.ref(app) if app is not None else None
 
     def _show_error_dialog(message: str) -> None:
         """ユーザーへエラーダイアログを表示する。"""
-        app = QApplication.instance()
-        if app is None:
-            # QApplicationが未初期化の場合は標準エラー出力で通知する。
+        # 例外経路は頻度が低いため、Qtクラスはここで初めて読み込む。
+        from PySide6.QtWidgets import QApplication, QMessageBox
+
+        current_app = app_ref() if app_ref is not None else QApplication.instance()
+        if current_app is None:
+            # QApplicationが未初期化または破棄済みの場合は標準エラー出力で通知する。
             sys.stderr.write("予期しないエラーが発生しました。ログを確認してください。\n")
             sys.stderr.write(f"詳細: {message}\n")
             return
 
-        parent = QApplication.activeWindow()
-        dialog = QMessageBox(parent=parent)
+        dialog = QMessageBox(parent=QApplication.activeWindow())
         dialog.setIcon(QMessageBox.Icon.Critical)
         dialog.setWindowTitle("エラー")
         dialog.setText("予期しないエラーが発生しました。")
@@ -57,9 +69,6 @@ def install_exception_hook(logger: logging.Logger) -> ExceptionHook:
     sys.excepthook = _handle_exception
     return previous_hook
 
-from controllers.app_controller import AppController
-from logging_config import setup_logging
-
 
 def _create_application(argv: Sequence[str] | None) -> tuple[QApplication, bool]:
     """QApplicationを取得または生成する。
@@ -70,16 +79,31 @@ def _create_application(argv: Sequence[str] | None) -> tuple[QApplication, bool]
     Returns:
         tuple[QApplication, bool]: アプリインスタンスと新規生成したかどうかのフラグ。
     """
+    from PySide6.QtWidgets import QApplication
+
     # 既存インスタンスがあれば再利用する。
     existing = QApplication.instance()
     if existing is not None:
-        return cast(QApplication, existing), False
+        return cast("QApplication", existing), False
 
     # 新規にアプリケーションを生成する。
     app = QApplication(list(argv) if argv is not None else sys.argv)
     return app, True
 
 
+@cache
+def _load_dark_stylesheet() -> str:
+    """qdarkstyleのPySide6用スタイルシートを読み込む。内容は不変のためプロセス内で使い回す。
+
+    Raises:
+        ImportError: qdarkstyleが利用できない場合。
+    """
+    import qdarkstyle
+
+    stylesheet: str = qdarkstyle.load_stylesheet(qt_api="pyside6")
+    return stylesheet
+
+
 def _apply_dark_theme(app: QApplication, logger: logging.Logger) -> None:
     """qdarkstyleを適用してダークテーマを有効にする。
 
@@ -88,14 +112,14 @@ def _apply_dark_theme(app: QApplication, logger: logging.Logger) -> None:
         logger (logging.Logger): ログ出力用ロガー。
     """
     try:
-        import qdarkstyle
+        stylesheet = _load_dark_stylesheet()
     except ImportError:
         # qdarkstyleが見つからない場合は警告を出して処理を継続する。
         logger.warning("qdarkstyleを読み込めなかったため、デフォルトテーマを使用します。")
         return
 
     # PySide6用のスタイルシートを適用する。
-    app.setStyleSheet(qdarkstyle.load_stylesheet(qt_api="pyside6"))
+    app.setStyleSheet(stylesheet)
 
 
 def main(argv: Sequence[str] | None = None, *, execute: bool = True, log_path: Path | None = None) -> int:
@@ -117,12 +141,14 @@ def main(argv: Sequence[str] | None = None, *, execute: bool = True, log_path: P
     app, owns_app = _create_application(argv)
 
     # グローバル例外ハンドラを設定する。
-    install_exception_hook(logger)
+    install_exception_hook(logger, app)
 
     # ダークテーマを適用して見た目を整える。
     _apply_dark_theme(app, logger)
 
-    # コントローラを生成してアプリの起動準備を行う。
+    # コントローラを生成してアプリの起動準備を行う。Qtに依存する構成はここで初めて読み込む。
+    from controllers.app_controller import AppController
+
     controller = AppController(app, logger)
     controller.start()
     logger.info("アプリケーションの初期化が完了しました。")
@@ -1,10 +1,30 @@
 from __future__ import annotations
 
 import logging
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from exceptions import FileOperationError
 
+if TYPE_CHECKING:
+    from PySide6.QtGui import QTextDocument
+
+# ドキュメントをブロック単位で書き出す際の書き込みバッファサイズ。
+_DOCUMENT_WRITE_BUFFER = 1 << 20
+
+# QTextDocument.toPlainTextと同じ文字置換。行区切り(Shift+Enter)・段落区切り・フレーム境界は改行へ、
+# ノーブレークスペースは空白へ変換する。
+_PLAIN_TEXT_TABLE = str.maketrans(
+    {
+        "\u2028": "\n",
+        "\u2029": "\n",
+        "\ufdd0": "\n",
+        "\ufdd1": "\n",
+        "\u00a0": " ",
+    }
+)
+
 
 class FileModel:
     """ファイルの読み書きと開いているファイル一覧を管理するモデル。"""
@@ -18,6 +38,8 @@ class FileModel:
         # ロガーと開いているファイル集合を準備する。
         self._logger = logger or logging.getLogger("my_editor.file_model")
         self._open_files: set[Path] = set()
+        # 読み書きはワーカースレッドからも呼ばれるため、開いているファイル集合の更新は排他する。
+        self._open_files_lock = threading.Lock()
 
     def load_file(self, path: Path, *, encoding: str = "utf-8") -> str:
         """指定パスのファイルを読み込んで内容を返す。
@@ -75,14 +97,53 @@ class FileModel:
         self._register_open_file(resolved_path)
         self._logger.info("ファイルを保存しました: %s", resolved_path)
 
+    def save_document(self, path: Path, document: QTextDocument, *, encoding: str = "utf-8") -> None:
+        """QTextDocumentの内容をブロック単位でファイルへ書き出す。
+
+        toPlainTextで全文の文字列を生成せずに保存するため、巨大なドキュメントでもピークメモリを抑えられる。
+        書き出す内容はtoPlainTextと同じ文字置換を適用したものとなる。
+        ドキュメントはGUIスレッドに属するため、GUIスレッドから呼び出すこと。
+        FileController.save_current_file_asyncはワーカーで書き込むためこのメソッドを使わず、
+        toPlainTextのスナップショットを保存する。
+
+        Args:
+            path (Path): 書き込み先のファイルパス。
+            document (QTextDocument): 保存するドキュメント。
+            encoding (str): ファイルのエンコーディング。デフォルトはUTF-8。
+
+        Raises:
+            FileOperationError: 保存処理に失敗した場合。
+        """
+        normalized_path = path.expanduser()
+        resolved_path = normalized_path.resolve(strict=False)
+
+        # ブロック間にのみ改行を挟み、toPlainTextと同じく末尾へ改行を付け足さない。
+        try:
+            with open(resolved_path, "w", encoding=encoding, buffering=_DOCUMENT_WRITE_BUFFER) as stream:
+                block = document.firstBlock()
+                separator = ""
+                while block.isValid():
+                    stream.write(separator)
+                    stream.write(block.text().translate(_PLAIN_TEXT_TABLE))
+                    separator = "\n"
+                    block = block.next()
+        except OSError as exc:
+            self._logger.error("ファイルの保存に失敗しました: %s", resolved_path, exc_info=exc)
+            raise FileOperationError(f"ファイルの保存に失敗しました: {resolved_path}") from exc
+
+        self._register_open_file(resolved_path)
+        self._logger.info("ファイルを保存しました: %s", resolved_path)
+
     def list_open_files(self) -> list[Path]:
         """現在開いているファイルパス一覧を返す。"""
         # ソートしたリストで返し、テストしやすい決定的な順序を保証する。
-        return sorted(self._open_files)
+        with self._open_files_lock:
+            return sorted(self._open_files)
 
     def _register_open_file(self, path: Path) -> None:
         """開いているファイル集合へパスを登録する。"""
-        self._open_files.add(path)
+        with self._open_files_lock:
+            self._open_files.add(path)
 
     def _read_text_with_fallback(self, path: Path, primary_encoding: str) -> str:
         """可能なエンコーディングを順に試してテキストを読み込む。"""
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
+from typing import NamedTuple
 
 from exceptions import FileOperationError
 
 
+class DirectoryEntry(NamedTuple):
+    """ディレクトリ走査で得たエントリ情報。"""
+
+    path: Path
+    is_directory: bool
+    is_symlink: bool
+
+
 class FolderModel:
     """フォルダ操作を抽象化するモデル。"""
 
@@ -51,6 +61,41 @@ class FolderModel:
         self._logger.info("ディレクトリを列挙しました: %s", resolved_path)
         return entries
 
+    def scan_directory(self, path: Path) -> list[DirectoryEntry]:
+        """指定ディレクトリ直下のエントリを種別情報付きで返す。
+
+        ``os.scandir``がディレクトリ読み出し時に得る種別情報を使うため、
+        シンボリックリンク以外のエントリでは個別のstat呼び出しが発生しない。
+
+        Args:
+            path (Path): 列挙対象のフォルダパス。
+
+        Returns:
+            list[DirectoryEntry]: 発見したエントリ。順序はファイルシステムに依存する。
+
+        Raises:
+            FileOperationError: フォルダが存在しない、または列挙に失敗した場合。
+        """
+        resolved_path = path.expanduser().resolve(strict=False)
+
+        try:
+            with os.scandir(resolved_path) as iterator:
+                entries = [
+                    DirectoryEntry(Path(entry.path), _entry_is_dir(entry), entry.is_symlink()) for entry in iterator
+                ]
+        except FileNotFoundError as exc:
+            self._logger.error("ディレクトリが存在しません: %s", resolved_path)
+            raise FileOperationError(f"ディレクトリが存在しません: {resolved_path}") from exc
+        except NotADirectoryError as exc:
+            self._logger.error("ディレクトリではありません: %s", resolved_path)
+            raise FileOperationError(f"ディレクトリではありません: {resolved_path}") from exc
+        except OSError as exc:
+            self._logger.error("ディレクトリの列挙に失敗しました: %s", resolved_path, exc_info=exc)
+            raise FileOperationError(f"ディレクトリの列挙に失敗しました: {resolved_path}") from exc
+
+        self._logger.info("ディレクトリを列挙しました: %s", resolved_path)
+        return entries
+
     def create_item(self, path: Path, *, is_dir: bool) -> None:
         """ファイルまたはフォルダを作成する。
 
@@ -149,3 +194,11 @@ class FolderModel:
             raise FileOperationError(f"名称変更に失敗しました: {src} -> {dst}") from exc
 
         self._logger.info("項目の名称を変更しました: %s -> %s", src, dst)
+
+
+def _entry_is_dir(entry: os.DirEntry[str]) -> bool:
+    """エントリがディレクトリかを判定する。リンク切れなどで判定できない場合はFalseとする。"""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
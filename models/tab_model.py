@@ -24,6 +24,11 @@ class TabState:
         self._logger = logger or logging.getLogger("my_editor.tab_state")
         self._tabs: dict[str, TabEntry] = {}
 
+    @property
+    def count(self) -> int:
+        """管理中のタブ数を返す。"""
+        return len(self._tabs)
+
     def add_tab(self, file_path: Path) -> str:
         """タブを追加し、その識別子を返す。"""
         normalized_path = file_path.expanduser()
@@ -64,6 +69,14 @@ class TabState:
         entry.file_path = resolved
         self._logger.info("タブのパスを更新しました: id=%s path=%s", tab_id, resolved)
 
+    def apply_saved(self, tab_id: str, path: Path) -> None:
+        """保存完了時のパス更新とダーティ解除をまとめて反映する。"""
+        entry = self._get_entry(tab_id)
+        resolved = path.expanduser().resolve(strict=False)
+        entry.file_path = resolved
+        entry.is_dirty = False
+        self._logger.info("タブを保存済みへ更新しました: id=%s path=%s", tab_id, resolved)
+
     def find_tab_id_by_path(self, path: Path) -> Optional[str]:
         """ファイルパスに一致するタブIDを検索する。"""
         resolved = path.expanduser().resolve(strict=False)
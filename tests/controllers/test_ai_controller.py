@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from types import SimpleNamespace
 from typing import Generator, Iterable
 
 import pytest
 
-from controllers.ai_controller import AIController, AIClientProtocol
+from controllers import ai_controller
+from controllers.ai_controller import AIController, AIClientProtocol, _extract_stream_text, _extract_text
 from exceptions import AIIntegrationError
 
 
@@ -81,4 +83,84 @@ def test_stream_chat_yields_chunks() -> None:
 
     chunks = list(controller.stream_chat("prompt"))
 
-    assert chunks == ["a", "b", "c"]
\ No newline at end of file
+    assert chunks == ["a", "b", "c"]
+
+
+def test_extract_text_flattens_nested_content() -> None:
+    """入れ子のレスポンス構造からテキストが順序通りに連結されることを検証する。"""
+
+    class _Part:
+        def __init__(self, text: str) -> None:
+            self.text = text
+
+    class _Message:
+        def __init__(self, content: list[object]) -> None:
+            self.content = content
+
+    class _Response:
+        def __init__(self, output: list[object]) -> None:
+            self.output = output
+
+    response = _Response(
+        [
+            _Message([_Part("a"), {"text": "b", "content": [{"text": "c"}]}]),
+            _Message(["d"]),
+        ]
+    )
+
+    assert _extract_text(response) == "abcd"
+
+
+def test_extract_stream_text_handles_mixed_event_shapes() -> None:
+    """同じクラスで属性の形が異なるイベントが混在しても順序に関わらず抽出できることを検証する。"""
+    text_event = SimpleNamespace(text="a")
+    delta_event = SimpleNamespace(type="response.output_text.delta", delta={"text": "b"})
+
+    assert [_extract_stream_text(event) for event in (text_event, delta_event)] == ["a", "b"]
+    assert [_extract_stream_text(event) for event in (delta_event, text_event)] == ["b", "a"]
+
+
+def test_missing_api_key_is_reported(monkeypatch: pytest.MonkeyPatch) -> None:
+    """APIキーが無い場合のみ未設定エラーとなることを検証する。"""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    controller = AIController()
+
+    with pytest.raises(AIIntegrationError) as exc_info:
+        controller.handle_chat_submit("hello")
+    assert "APIキーが設定されていません" in str(exc_info.value.__cause__)
+
+
+def test_client_construction_failure_is_not_reported_as_missing_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    """クライアント生成の失敗がAPIキー未設定として通知されないことを検証する。"""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    def fail(api_key: str | None) -> None:
+        raise ValueError("proxy misconfigured")
+
+    monkeypatch.setattr("controllers.ai_controller._get_shared_openai_client", fail)
+    controller = AIController()
+
+    with pytest.raises(AIIntegrationError) as exc_info:
+        controller.handle_chat_submit("hello")
+    cause = exc_info.value.__cause__
+    assert cause is not None
+    assert "初期化に失敗しました" in str(cause)
+    assert isinstance(cause.__cause__, ValueError)
+
+
+def test_shared_client_keeps_only_current_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    """共有クライアントは現在のAPIキーの1件のみを保持し、キー変更時に置き換わることを検証する。"""
+
+    class _FakeOpenAI:
+        def __init__(self, api_key: str | None = None) -> None:
+            self.api_key = api_key
+
+    monkeypatch.setattr(ai_controller, "_load_openai_cls", lambda: _FakeOpenAI)
+    monkeypatch.setattr(ai_controller, "_shared_client", None)
+
+    first = ai_controller._get_shared_openai_client("key-a")
+    assert ai_controller._get_shared_openai_client("key-a") is first
+
+    second = ai_controller._get_shared_openai_client("key-b")
+    assert second is not first
+    assert ai_controller._shared_client == ("key-b", second)
@@ -3,18 +3,19 @@ from __future__ import annotations
 import logging
 from collections.abc import Generator
 from pathlib import Path
-from typing import cast
+from typing import Callable, cast
 
 import pytest
 
 pytest.importorskip("PySide6")
 
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication, QPlainTextEdit, QTreeWidgetItem, QWidget
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication, QPlainTextEdit, QPushButton, QTreeWidgetItem, QWidget
 
-from controllers.app_controller import AppController
+from controllers.app_controller import AppController, FolderSelectedPayload, TabChangedPayload
 from controllers.ai_controller import AIController
-from controllers.event_bus import EventBus
+from controllers.event_bus import EventBus, Payload
 from controllers.file_controller import FileController
 from controllers.settings_controller import SettingsController
 from settings.model import SettingsModel
@@ -87,10 +88,22 @@ class _StubFileController:
         self.invoked = True
         return self._save_result
 
+    def save_current_file_async(
+        self,
+        on_saved: Callable[[Path | None], None],
+        on_failed: Callable[[Exception], None] | None = None,
+    ) -> None:
+        on_saved(self.save_current_file())
+
     def open_file(self, path: Path) -> int:
         self.opened.append(path)
         return 0
 
+    def open_file_async(
+        self, path: Path, *, on_failed: Callable[[Exception], None] | None = None
+    ) -> int:
+        return self.open_file(path)
+
     def close_current_tab(self) -> Path | None:
         self.closed = True
         return None
@@ -108,9 +121,13 @@ class _StubSettingsController:
         self.parent: QWidget | None = None
         self._settings_model = _StubSettingsModel()
 
-    def open_dialog(self, parent: QWidget | None = None) -> bool:
+    def open_dialog_async(
+        self,
+        on_finished: Callable[[bool], None],
+        parent: QWidget | None = None,
+    ) -> None:
         self.parent = parent
-        return self.result
+        on_finished(self.result)
 
     @property
     def model(self) -> SettingsModel:
@@ -141,20 +158,32 @@ def _build_controller(
     )
 
 
+def _wait_for_folder_selection() -> None:
+    """フォルダ選択通知のデバウンス時間が経過するまでイベントを処理する。"""
+    QTest.qWait(AppController._FOLDER_SELECTION_DEBOUNCE_MS * 3)
+
+
+def _wait_for_background(qt_app: QApplication, controller: AppController) -> None:
+    """バックグラウンド処理の完了を待ち、GUIスレッドへの通知を処理する。"""
+    controller._io_pool.waitForDone()
+    qt_app.processEvents()
+
+
 def test_wire_events_emits_tab_change(
     qt_app: QApplication, main_window: MainWindow
 ) -> None:
     """タブ変更時にイベントバスへ通知されることを検証する。"""
     bus = EventBus()
     _build_controller(qt_app, main_window, event_bus=bus)
-    received: list[dict[str, object] | None] = []
+    received: list[object] = []
     bus.subscribe(AppController.EVENT_TAB_CHANGED, lambda payload: received.append(payload))
 
+    main_window.tab_widget.currentChanged.emit(5)
     main_window.tab_widget.currentChanged.emit(3)
-    qt_app.processEvents()
+    QTest.qWait(10)
 
-    assert received
-    assert received[0] == {"index": 3, "tab_count": main_window.tab_widget.count()}
+    assert len(received) == 1
+    assert received[0] == TabChangedPayload(tab_index=3, tab_count=main_window.tab_widget.count())
 
 
 def test_new_action_triggers_blank_file(
@@ -181,7 +210,7 @@ def test_wire_events_emits_folder_selection(
     """フォルダ選択変更がイベントバスに反映されることを検証する。"""
     bus = EventBus()
     _build_controller(qt_app, main_window, event_bus=bus)
-    captured: list[dict[str, object] | None] = []
+    captured: list[object] = []
     bus.subscribe(AppController.EVENT_FOLDER_SELECTED, lambda payload: captured.append(payload))
 
     item = QTreeWidgetItem(["dummy"])
@@ -189,12 +218,12 @@ def test_wire_events_emits_folder_selection(
     target = tmp_path / "sample"
     item.setData(0, Qt.ItemDataRole.UserRole, str(target))
     main_window.folder_view.setCurrentItem(item)
-    qt_app.processEvents()
+    _wait_for_folder_selection()
 
     assert captured
     payload = captured[0]
-    assert payload is not None
-    assert payload["path"] == target
+    assert isinstance(payload, FolderSelectedPayload)
+    assert payload.path == target
 
 
 def test_folder_selection_opens_file(
@@ -216,7 +245,7 @@ def test_folder_selection_opens_file(
     item.setData(0, Qt.ItemDataRole.UserRole, str(target))
     main_window.folder_view.addTopLevelItem(item)
     main_window.folder_view.setCurrentItem(item)
-    qt_app.processEvents()
+    _wait_for_folder_selection()
 
     assert stub_controller.opened == [target]
 
@@ -252,7 +281,7 @@ def test_wire_events_handles_save_request(
         event_bus=bus,
         file_controller=cast(FileController, stub_controller),
     )
-    saved_events: list[dict[str, object] | None] = []
+    saved_events: list[Payload] = []
     bus.subscribe(AppController.EVENT_FILE_SAVED, lambda payload: saved_events.append(payload))
 
     bus.publish(AppController.EVENT_FILE_SAVE_REQUESTED)
@@ -261,7 +290,7 @@ def test_wire_events_handles_save_request(
     assert stub_controller.invoked is True
     assert saved_events
     payload = saved_events[0]
-    assert payload is not None
+    assert isinstance(payload, dict)
     assert payload["path"] == save_path
 
 
@@ -299,7 +328,7 @@ def test_open_action_triggers_file_controller(
         file_controller=cast(FileController, stub_controller),
     )
 
-    monkeypatch.setattr(controller, "_prompt_file_to_open", lambda: target)
+    monkeypatch.setattr(controller, "_prompt_file_to_open", lambda on_selected: on_selected(target))
 
     main_window.action_open_file.trigger()
     qt_app.processEvents()
@@ -313,14 +342,14 @@ def test_chat_submission_delegates_to_ai_controller(
 ) -> None:
     """チャット送信がAIコントローラへ委譲されることを検証する。"""
     ai_stub = _StubAIController()
-    _build_controller(
+    controller = _build_controller(
         qt_app,
         main_window,
         ai_controller=cast(AIController, ai_stub),
     )
 
     main_window.chat_submitted.emit("こんにちは")
-    qt_app.processEvents()
+    _wait_for_background(qt_app, controller)
 
     assert ai_stub.received == ["こんにちは"]
     assert main_window.statusBar().currentMessage() == "AI応答: stub-response"
@@ -333,18 +362,87 @@ def test_chat_error_displays_status_message(
     """AI呼び出しで例外が発生した場合にエラーメッセージが表示されることを検証する。"""
     ai_stub = _StubAIController()
     ai_stub.raise_error = AIIntegrationError("APIキーが未設定です。")
-    _build_controller(
+    controller = _build_controller(
         qt_app,
         main_window,
         ai_controller=cast(AIController, ai_stub),
     )
 
     main_window.chat_submitted.emit("テスト")
-    qt_app.processEvents()
+    _wait_for_background(qt_app, controller)
 
     assert main_window.statusBar().currentMessage() == "チャットエラー: APIキーが未設定です。"
 
 
+def test_chat_attachments_added_while_pending_are_kept(
+    qt_app: QApplication,
+    main_window: MainWindow,
+    tmp_path: Path,
+) -> None:
+    """送信時点の添付のみが使われ、応答待ちの間に追加した添付は次の送信へ残ることを検証する。"""
+    ai_stub = _StubAIController()
+    controller = _build_controller(
+        qt_app,
+        main_window,
+        ai_controller=cast(AIController, ai_stub),
+    )
+    first = (tmp_path / "first.py").resolve()
+    second = (tmp_path / "second.py").resolve()
+    controller._add_chat_attachment(first, "first-content")
+
+    main_window.chat_submitted.emit("1回目")
+    assert main_window.chat_panel.attachment_summary() == ""
+    controller._add_chat_attachment(second, "second-content")
+    _wait_for_background(qt_app, controller)
+
+    assert "first-content" in ai_stub.received[0]
+    assert main_window.chat_panel.attachment_summary() == "添付ファイル: second.py"
+
+
+def test_chat_submit_is_rejected_while_pending(
+    qt_app: QApplication,
+    main_window: MainWindow,
+) -> None:
+    """応答待ちの間の送信は受け付けず、送信ボタンを無効化することを検証する。"""
+    ai_stub = _StubAIController()
+    controller = _build_controller(
+        qt_app,
+        main_window,
+        ai_controller=cast(AIController, ai_stub),
+    )
+    send_button = main_window.chat_panel.findChild(QPushButton, "chatRequestButton")
+    assert send_button is not None
+
+    main_window.chat_submitted.emit("1回目")
+    assert send_button.isEnabled() is False
+    main_window.chat_submitted.emit("2回目")
+    _wait_for_background(qt_app, controller)
+
+    assert ai_stub.received == ["1回目"]
+    assert send_button.isEnabled() is True
+
+
+def test_chat_failure_restores_attachments(
+    qt_app: QApplication,
+    main_window: MainWindow,
+    tmp_path: Path,
+) -> None:
+    """AI呼び出しに失敗した場合は送信した添付を戻すことを検証する。"""
+    ai_stub = _StubAIController()
+    ai_stub.raise_error = AIIntegrationError("失敗しました。")
+    controller = _build_controller(
+        qt_app,
+        main_window,
+        ai_controller=cast(AIController, ai_stub),
+    )
+    controller._add_chat_attachment((tmp_path / "snippet.py").resolve(), "content")
+
+    main_window.chat_submitted.emit("テスト")
+    _wait_for_background(qt_app, controller)
+
+    assert main_window.chat_panel.attachment_summary() == "添付ファイル: snippet.py"
+
+
 def test_settings_acceptation_resets_ai_client(
     qt_app: QApplication,
     main_window: MainWindow,
@@ -402,10 +500,10 @@ def test_chat_attachment_delegates_to_ai_controller(
     target = (tmp_path / "snippet.py").resolve()
     target.write_text("print('ok')\n", encoding="utf-8")
 
-    monkeypatch.setattr(controller, "_prompt_file_to_open", lambda: target)
+    monkeypatch.setattr(controller, "_prompt_file_to_open", lambda on_selected: on_selected(target))
 
     main_window.chat_attachment_requested.emit()
-    qt_app.processEvents()
+    _wait_for_background(qt_app, controller)
 
     assert ai_stub.received == []
     assert main_window.chat_panel.attachment_summary() == "添付ファイル: snippet.py"
@@ -416,7 +514,7 @@ def test_chat_attachment_delegates_to_ai_controller(
 
     result = main_window.chat_panel.request_ai_completion()
     assert result == "解析をお願いします。"
-    qt_app.processEvents()
+    _wait_for_background(qt_app, controller)
 
     assert ai_stub.received
     prompt = ai_stub.received[0]
@@ -434,6 +532,42 @@ def test_chat_attachment_delegates_to_ai_controller(
     assert main_window.chat_panel.attachment_summary() == ""
 
 
+def test_chat_attachment_same_file_is_not_duplicated(
+    qt_app: QApplication,
+    main_window: MainWindow,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """同じファイルを2回添付してもプロンプトへの埋め込みが1回に留まることを検証する。"""
+    ai_stub = _StubAIController()
+    controller = _build_controller(
+        qt_app,
+        main_window,
+        ai_controller=cast(AIController, ai_stub),
+    )
+
+    target = (tmp_path / "snippet.py").resolve()
+    target.write_text("print('ok')\n", encoding="utf-8")
+
+    monkeypatch.setattr(controller, "_prompt_file_to_open", lambda on_selected: on_selected(target))
+
+    main_window.chat_attachment_requested.emit()
+    _wait_for_background(qt_app, controller)
+    main_window.chat_attachment_requested.emit()
+    _wait_for_background(qt_app, controller)
+
+    assert main_window.chat_panel.attachment_summary() == "添付ファイル: snippet.py"
+
+    input_field = main_window.chat_panel.findChild(QPlainTextEdit, "chatInput")
+    assert input_field is not None
+    input_field.setPlainText("解析をお願いします。")
+    main_window.chat_panel.request_ai_completion()
+    _wait_for_background(qt_app, controller)
+
+    assert ai_stub.received
+    assert ai_stub.received[0].count("print('ok')") == 1
+
+
 def test_chat_attachment_cancelled_does_not_call_ai(
     qt_app: QApplication,
     main_window: MainWindow,
@@ -447,10 +581,10 @@ def test_chat_attachment_cancelled_does_not_call_ai(
         ai_controller=cast(AIController, ai_stub),
     )
 
-    monkeypatch.setattr(controller, "_prompt_file_to_open", lambda: None)
+    monkeypatch.setattr(controller, "_prompt_file_to_open", lambda on_selected: on_selected(None))
 
     main_window.chat_attachment_requested.emit()
-    qt_app.processEvents()
+    _wait_for_background(qt_app, controller)
 
     assert ai_stub.received == []
     assert main_window.statusBar().currentMessage() == "チャット: ファイル選択をキャンセルしました。"
@@ -474,7 +608,7 @@ def test_chat_attachment_read_error_displays_status(
     target = (tmp_path / "broken.txt").resolve()
     target.write_text("dummy", encoding="utf-8")
 
-    monkeypatch.setattr(controller, "_prompt_file_to_open", lambda: target)
+    monkeypatch.setattr(controller, "_prompt_file_to_open", lambda on_selected: on_selected(target))
 
     def _raise_error(_: Path) -> str:
         raise FileOperationError("読み込みエラー")
@@ -482,8 +616,28 @@ def test_chat_attachment_read_error_displays_status(
     monkeypatch.setattr(controller, "_read_text_for_chat", _raise_error)
 
     main_window.chat_attachment_requested.emit()
-    qt_app.processEvents()
+    _wait_for_background(qt_app, controller)
 
     assert ai_stub.received == []
     assert main_window.statusBar().currentMessage() == "チャットエラー: 読み込みエラー"
     assert main_window.chat_panel.attachment_summary() == ""
+
+
+def test_read_text_for_chat_detects_bom_and_cp932(
+    qt_app: QApplication,
+    main_window: MainWindow,
+    tmp_path: Path,
+) -> None:
+    """BOM付きUTF-8/UTF-16とBOM無しcp932の添付ファイルを読み込めることを検証する。"""
+    controller = _build_controller(qt_app, main_window)
+
+    utf8_bom = tmp_path / "bom.txt"
+    utf8_bom.write_bytes("テキスト".encode("utf-8-sig"))
+    utf16 = tmp_path / "utf16.txt"
+    utf16.write_bytes("テキスト".encode("utf-16"))
+    sjis = tmp_path / "sjis.txt"
+    sjis.write_bytes("テキスト".encode("cp932"))
+
+    assert controller._read_text_for_chat(utf8_bom) == "テキスト"
+    assert controller._read_text_for_chat(utf16) == "テキスト"
+    assert controller._read_text_for_chat(sjis) == "テキスト"
@@ -1,20 +1,20 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import List
 
 import pytest
 
-from controllers.event_bus import EventBus
+from controllers.event_bus import EventBus, Payload
 
 
 def test_publish_triggers_handler() -> None:
     """publishが購読済みハンドラを呼び出すことを検証する。"""
     # イベントバスを生成し、呼び出し結果を格納するリストを用意する。
     bus = EventBus()
-    received: List[Dict[str, Any] | None] = []
+    received: List[Payload] = []
 
     # テスト用ハンドラを登録する。
-    def handler(payload: Dict[str, Any] | None) -> None:
+    def handler(payload: Payload) -> None:
         received.append(payload)
 
     bus.subscribe("sample", handler)
@@ -39,3 +39,122 @@ def test_publish_handles_missing_subscribers(caplog: pytest.LogCaptureFixture) -
     # 例外が発生しないことと、情報がログに残ることを検証する。
     assert caplog.records  # ログ出力が行われたことを確認する。
     assert any("登録されたハンドラはありません" in record.message for record in caplog.records)
+
+
+def test_publish_without_subscribers_is_silent_above_debug(caplog: pytest.LogCaptureFixture) -> None:
+    """DEBUG無効時に購読者のいないイベントを発行してもログが出力されないことを確認する。"""
+    caplog.set_level("INFO")
+    bus = EventBus()
+
+    bus.publish("no_listeners")
+
+    assert not caplog.records
+
+
+def test_subscribe_during_publish_does_not_affect_current_dispatch() -> None:
+    """配信中に追加されたハンドラが同じ配信では呼ばれないことを確認する。"""
+    # イベントバスと呼び出し記録を用意する。
+    bus = EventBus()
+    calls: List[str] = []
+
+    def late_handler(payload: Payload) -> None:
+        calls.append("late")
+
+    def first_handler(payload: Payload) -> None:
+        calls.append("first")
+        bus.subscribe("sample", late_handler)
+
+    bus.subscribe("sample", first_handler)
+    bus.subscribe("sample", first_handler)
+
+    # 1回目は登録済みハンドラのみ、2回目は追加分も呼ばれることを検証する。
+    bus.publish("sample")
+    assert calls == ["first"]
+
+    bus.publish("sample")
+    assert calls == ["first", "first", "late"]
+
+
+def test_scope_subscriber_receives_nested_events() -> None:
+    """スコープ購読者が配下のイベントのみを受け取ることを確認する。"""
+    # スコープ単位でハンドラを登録する。
+    bus = EventBus()
+    received: List[str] = []
+
+    bus.subscribe_scope("", lambda payload: received.append("all"))
+    bus.subscribe_scope("ui", lambda payload: received.append("ui"))
+    bus.subscribe_scope("ui.tab", lambda payload: received.append("ui.tab"))
+    bus.subscribe("ui.tab.changed", lambda payload: received.append("exact"))
+
+    # 完全一致・スコープの順に呼ばれ、無関係なスコープは除外されることを検証する。
+    bus.publish("ui.tab.changed")
+    assert received == ["exact", "all", "ui", "ui.tab"]
+
+    received.clear()
+    bus.publish("ui.tabs")
+    assert received == ["all", "ui"]
+
+
+def test_has_subscribers_reflects_exact_and_scoped_handlers() -> None:
+    """完全一致・スコープ購読の双方が購読有無の判定に反映されることを確認する。"""
+    bus = EventBus()
+    assert not bus.has_subscribers("ui.tab.changed")
+
+    bus.subscribe("ui.tab.changed", lambda payload: None)
+    assert bus.has_subscribers("ui.tab.changed")
+    assert not bus.has_subscribers("ui.folder.selected")
+
+    bus.subscribe_scope("ui", lambda payload: None)
+    assert bus.has_subscribers("ui.folder.selected")
+    assert not bus.has_subscribers("command.file.save")
+
+
+def test_publish_continues_after_handler_error(caplog: pytest.LogCaptureFixture) -> None:
+    """ハンドラで例外が発生しても後続のハンドラが呼ばれることを確認する。"""
+    bus = EventBus()
+    calls: List[str] = []
+
+    def failing_handler(payload: Payload) -> None:
+        calls.append("failing")
+        raise RuntimeError("boom")
+
+    bus.subscribe("sample", failing_handler)
+    bus.subscribe("sample", lambda payload: calls.append("next"))
+
+    # 例外は外へ伝播せず、ログに記録されることを検証する。
+    bus.publish("sample")
+
+    assert calls == ["failing", "next"]
+    assert any("例外が発生しました" in record.message for record in caplog.records)
+
+
+def test_unsubscribe_removes_handler() -> None:
+    """unsubscribeで解除したハンドラが呼ばれなくなることを確認する。"""
+    bus = EventBus()
+    received: List[Payload] = []
+
+    def handler(payload: Payload) -> None:
+        received.append(payload)
+
+    bus.subscribe("sample", handler)
+    bus.unsubscribe("sample", handler)
+    bus.unsubscribe("sample", handler)
+
+    # 解除後は配信されず、購読者なしとして扱われることを検証する。
+    bus.publish("sample", {"value": 1})
+    assert received == []
+    assert not bus.has_subscribers("sample")
+
+
+def test_publish_with_dynamically_built_event_name() -> None:
+    """実行時に組み立てたイベント名でも登録済みハンドラへ配信されることを確認する。"""
+    bus = EventBus()
+    received: List[Payload] = []
+
+    bus.subscribe("ui.tab.changed", received.append)
+    bus.subscribe_scope("ui.tab", received.append)
+
+    # 定数と同一オブジェクトではない文字列で発行しても配信されることを検証する。
+    event = ".".join(["ui", "tab", "changed"])
+    bus.publish(event, {"index": 1})
+    assert received == [{"index": 1}, {"index": 1}]
@@ -7,6 +7,7 @@ import pytest
 
 pytest.importorskip("PySide6")
 
+from PySide6.QtCore import QThreadPool
 from PySide6.QtWidgets import QApplication, QPlainTextEdit
 
 from controllers.file_controller import FileController
@@ -44,6 +45,63 @@ def test_open_file_updates_tab(qt_app: QApplication, tmp_path: Path) -> None:
     assert file_path.resolve() in model.list_open_files()
 
 
+def test_open_file_emits_current_changed_once(qt_app: QApplication, tmp_path: Path) -> None:
+    """open_fileがタブ追加時のcurrentChangedを1回にまとめて通知することを検証する。"""
+    file_path = tmp_path / "sample.txt"
+    file_path.write_text("hello", encoding="utf-8")
+
+    tab_widget = EditorTabWidget()
+    controller = FileController(FileModel(), TabState(), tab_widget)
+    controller.create_new_file()
+    emitted: list[int] = []
+    tab_widget.currentChanged.connect(emitted.append)
+
+    index = controller.open_file(file_path)
+
+    assert emitted == [index]
+
+
+def _wait_for_pool(qt_app: QApplication, pool: QThreadPool) -> None:
+    """スレッドプールの処理完了を待ち、キューされた完了通知を処理する。"""
+    pool.waitForDone()
+    qt_app.processEvents()
+
+
+def test_open_file_async_populates_tab_after_loading(qt_app: QApplication, tmp_path: Path) -> None:
+    """open_file_asyncが読み込み完了後にタブへ内容を設定し編集可能にすることを検証する。"""
+    file_path = tmp_path / "large.txt"
+    file_path.write_text("loaded", encoding="utf-8")
+
+    pool = QThreadPool()
+    state = TabState()
+    tab_widget = EditorTabWidget()
+    controller = FileController(FileModel(), state, tab_widget, thread_pool=pool)
+
+    index = controller.open_file_async(file_path)
+    editor = tab_widget.widget(index)
+    assert isinstance(editor, QPlainTextEdit)
+
+    _wait_for_pool(qt_app, pool)
+
+    assert editor.toPlainText() == "loaded"
+    assert editor.isReadOnly() is False
+    assert state.is_dirty(controller._require_tab_id(editor)) is False
+
+
+def test_open_file_async_closes_tab_on_failure(qt_app: QApplication, tmp_path: Path) -> None:
+    """読み込みに失敗した場合にタブを閉じてコールバックへ例外を渡すことを検証する。"""
+    pool = QThreadPool()
+    tab_widget = EditorTabWidget()
+    controller = FileController(FileModel(), TabState(), tab_widget, thread_pool=pool)
+    failures: list[Exception] = []
+
+    controller.open_file_async(tmp_path / "missing.txt", on_failed=failures.append)
+    _wait_for_pool(qt_app, pool)
+
+    assert tab_widget.count() == 0
+    assert len(failures) == 1
+
+
 def test_create_new_file_adds_blank_tab(qt_app: QApplication) -> None:
     """create_new_fileが空のタブを作成しダーティ状態にすることを検証する。"""
     model = FileModel()
@@ -59,7 +117,7 @@ def test_create_new_file_adds_blank_tab(qt_app: QApplication) -> None:
 
     editor = tab_widget.get_current_editor()
     assert isinstance(editor, QPlainTextEdit)
-    tab_id = controller._tab_id_by_editor[editor]
+    tab_id = controller._require_tab_id(editor)
     assert state.is_dirty(tab_id) is True
     assert tab_widget.tabText(tab_widget.currentIndex()).endswith("*")
     assert editor.toPlainText() == ""
@@ -80,7 +138,7 @@ def test_save_current_file_writes_changes(qt_app: QApplication, tmp_path: Path)
     assert editor is not None
 
     editor.setPlainText("updated")
-    tab_id = controller._tab_id_by_editor[editor]  # テスト対象の状態を確認するため内部辞書を参照
+    tab_id = controller._require_tab_id(editor)  # テスト対象の状態を確認するため内部のタブIDを参照
     state.mark_dirty(tab_id, True)
     tab_widget.set_dirty(index, True)
 
@@ -92,6 +150,81 @@ def test_save_current_file_writes_changes(qt_app: QApplication, tmp_path: Path)
     assert tab_widget.tabText(index) == file_path.name
 
 
+def test_save_current_file_async_writes_changes(qt_app: QApplication, tmp_path: Path) -> None:
+    """save_current_file_asyncがワーカーで保存し完了後にダーティ状態を解除することを検証する。"""
+    file_path = tmp_path / "document.txt"
+    file_path.write_text("initial", encoding="utf-8")
+
+    pool = QThreadPool()
+    state = TabState()
+    tab_widget = EditorTabWidget()
+    controller = FileController(FileModel(), state, tab_widget, thread_pool=pool)
+
+    controller.open_file(file_path)
+    editor = tab_widget.get_current_editor()
+    assert editor is not None
+    editor.setPlainText("updated")
+    editor.document().setModified(True)
+    tab_id = controller._require_tab_id(editor)
+    saved: list[Path | None] = []
+
+    controller.save_current_file_async(saved.append)
+    _wait_for_pool(qt_app, pool)
+
+    assert saved == [file_path.resolve()]
+    assert file_path.read_text(encoding="utf-8") == "updated"
+    assert state.is_dirty(tab_id) is False
+
+
+def test_save_current_file_async_serializes_same_path(qt_app: QApplication, tmp_path: Path) -> None:
+    """同じファイルへの連続保存が順に書き込まれ、最新の内容が残ることを検証する。"""
+    file_path = tmp_path / "document.txt"
+    file_path.write_text("initial", encoding="utf-8")
+
+    pool = QThreadPool()
+    state = TabState()
+    tab_widget = EditorTabWidget()
+    controller = FileController(FileModel(), state, tab_widget, thread_pool=pool)
+
+    controller.open_file(file_path)
+    editor = tab_widget.get_current_editor()
+    assert editor is not None
+    saved: list[Path | None] = []
+
+    for text in ("first", "second", "third"):
+        editor.setPlainText(text)
+        controller.save_current_file_async(saved.append)
+    while controller._queued_saves:
+        _wait_for_pool(qt_app, pool)
+
+    # 2件目は3件目に置き換えられて破棄されるため、完了通知は2回となる。
+    assert saved == [file_path.resolve(), file_path.resolve()]
+    assert file_path.read_text(encoding="utf-8") == "third"
+    assert state.is_dirty(controller._require_tab_id(editor)) is False
+
+
+def test_apply_external_edit_keeps_undo_history(qt_app: QApplication, tmp_path: Path) -> None:
+    """apply_external_editが1回の取り消しで元に戻せる形で内容を置き換えることを検証する。"""
+    file_path = tmp_path / "target.txt"
+    file_path.write_text("before", encoding="utf-8")
+
+    state = TabState()
+    tab_widget = EditorTabWidget()
+    controller = FileController(FileModel(), state, tab_widget)
+    controller.open_file(file_path)
+    editor = tab_widget.get_current_editor()
+    assert editor is not None
+
+    controller.apply_external_edit(file_path, "after")
+
+    assert editor.toPlainText() == "after"
+    assert file_path.read_text(encoding="utf-8") == "after"
+    assert state.is_dirty(controller._require_tab_id(editor)) is False
+
+    editor.undo()
+    assert editor.toPlainText() == "before"
+
+
 def test_save_file_as_updates_tab_state(qt_app: QApplication, tmp_path: Path) -> None:
     """save_file_asが新しいパスへ保存しタブ情報を更新することを検証する。"""
     original = tmp_path / "original.txt"
@@ -108,7 +241,7 @@ def test_save_file_as_updates_tab_state(qt_app: QApplication, tmp_path: Path) ->
     assert editor is not None
     editor.setPlainText("after")
 
-    tab_id = controller._tab_id_by_editor[editor]
+    tab_id = controller._require_tab_id(editor)
     saved_path = controller.save_file_as(destination)
 
     assert saved_path == destination.resolve()
@@ -131,7 +264,7 @@ def test_on_editor_text_changed_sets_dirty(qt_app: QApplication, tmp_path: Path)
     index = controller.open_file(file_path)
     editor = tab_widget.widget(index)
     assert isinstance(editor, QPlainTextEdit)
-    tab_id = controller._tab_id_by_editor[editor]
+    tab_id = controller._require_tab_id(editor)
 
     assert state.is_dirty(tab_id) is False
     assert tab_widget.tabText(index) == file_path.name
@@ -156,13 +289,13 @@ def test_close_current_tab_removes_state(qt_app: QApplication, tmp_path: Path) -
     index = controller.open_file(file_path)
     editor = tab_widget.widget(index)
     assert isinstance(editor, QPlainTextEdit)
-    tab_id = controller._tab_id_by_editor[editor]
+    tab_id = controller._require_tab_id(editor)
 
     closed_path = controller.close_current_tab()
 
     assert closed_path == file_path.resolve()
     assert tab_widget.count() == 0
-    assert editor not in controller._tab_id_by_editor
+    assert editor not in controller._editor_by_tab_id.values()
     with pytest.raises(KeyError):
         state.get_file_path(tab_id)
 
@@ -184,4 +317,30 @@ def test_tab_close_signal_invokes_controller(qt_app: QApplication, tmp_path: Pat
     tab_widget.tabCloseRequested.emit(index)
 
     assert tab_widget.count() == 0
-    assert editor not in controller._tab_id_by_editor
\ No newline at end of file
+    assert editor not in controller._editor_by_tab_id.values()
+
+
+def test_editing_after_save_marks_dirty_again(qt_app: QApplication, tmp_path: Path) -> None:
+    """保存後に再度編集するとタブが再びダーティ状態になることを検証する。"""
+    file_path = tmp_path / "sample.txt"
+    file_path.write_text("before", encoding="utf-8")
+
+    model = FileModel()
+    state = TabState()
+    tab_widget = EditorTabWidget()
+    controller = FileController(model, state, tab_widget)
+
+    index = controller.open_file(file_path)
+    editor = tab_widget.widget(index)
+    assert isinstance(editor, QPlainTextEdit)
+    tab_id = controller._require_tab_id(editor)
+
+    editor.insertPlainText(" first")
+    controller.save_current_file()
+    assert state.is_dirty(tab_id) is False
+
+    editor.insertPlainText(" second")
+    qt_app.processEvents()
+
+    assert state.is_dirty(tab_id) is True
+    assert tab_widget.tabText(index) == f"{file_path.name}*"
@@ -26,9 +26,29 @@ def fixture_qt_app() -> Generator[QApplication, None, None]:
     yield app
 
 
+def _child_at(item: QTreeWidgetItem, index: int) -> QTreeWidgetItem:
+    """指定位置の子アイテムを取得し、存在することを保証する。"""
+    child = item.child(index)
+    assert child is not None
+    return child
+
+
 def _collect_child_names(item: QTreeWidgetItem) -> set[str]:
     """指定アイテム直下の子要素名を集合で取得する。"""
-    return {item.child(index).text(0) for index in range(item.childCount())}
+    return {_child_at(item, index).text(0) for index in range(item.childCount())}
+
+
+def _load_tree(qt_app: QApplication, controller: FolderController, root: Path) -> None:
+    """ツリーの読み込みを開始し、ワーカースレッドでの走査結果が反映されるまで待機する。"""
+    controller.load_initial_tree(root)
+    _wait_for_scan(qt_app, controller)
+
+
+def _wait_for_scan(qt_app: QApplication, controller: FolderController) -> None:
+    """実行中の走査スレッドの終了を待ち、キューに積まれた結果を処理する。"""
+    for thread, _worker in list(controller._active_scans):
+        thread.wait()
+    qt_app.processEvents()
 
 
 def test_load_initial_tree_populates_view(qt_app: QApplication, tmp_path: Path) -> None:
@@ -42,7 +62,7 @@ def test_load_initial_tree_populates_view(qt_app: QApplication, tmp_path: Path)
     tree = FolderTree()
     controller = FolderController(FolderModel(), tree)
 
-    controller.load_initial_tree(root)
+    _load_tree(qt_app, controller, root)
 
     assert tree.topLevelItemCount() == 1
     root_item = tree.topLevelItem(0)
@@ -52,10 +72,13 @@ def test_load_initial_tree_populates_view(qt_app: QApplication, tmp_path: Path)
     assert {"src", "README.md"} <= child_names
 
     src_item = next(
-        (root_item.child(i) for i in range(root_item.childCount()) if root_item.child(i).text(0) == "src"),
+        (_child_at(root_item, i) for i in range(root_item.childCount()) if _child_at(root_item, i).text(0) == "src"),
         None,
     )
     assert src_item is not None
+    # サブディレクトリの子要素は展開時に読み込まれる。
+    assert src_item.childCount() == 0
+    src_item.setExpanded(True)
     assert _collect_child_names(src_item) == {"main.py"}
 
 
@@ -71,11 +94,11 @@ def test_load_initial_tree_sorts_directories_first(qt_app: QApplication, tmp_pat
     tree = FolderTree()
     controller = FolderController(FolderModel(), tree)
 
-    controller.load_initial_tree(root)
+    _load_tree(qt_app, controller, root)
 
     root_item = tree.topLevelItem(0)
     assert root_item is not None
-    child_order = [root_item.child(index).text(0) for index in range(root_item.childCount())]
+    child_order = [_child_at(root_item, index).text(0) for index in range(root_item.childCount())]
     assert child_order == ["docs", "src", "a.txt", "b.txt"]
 
 
@@ -86,7 +109,7 @@ def test_handle_create(qt_app: QApplication, tmp_path: Path) -> None:
 
     tree = FolderTree()
     controller = FolderController(FolderModel(), tree)
-    controller.load_initial_tree(root)
+    _load_tree(qt_app, controller, root)
 
     new_dir = root / "new_dir"
     controller.handle_create(new_dir, is_dir=True)
@@ -108,7 +131,7 @@ def test_handle_delete_removes_entry(qt_app: QApplication, tmp_path: Path) -> No
 
     tree = FolderTree()
     controller = FolderController(FolderModel(), tree)
-    controller.load_initial_tree(root)
+    _load_tree(qt_app, controller, root)
 
     controller.handle_delete(target)
 
@@ -127,7 +150,7 @@ def test_apply_context_action(qt_app: QApplication, tmp_path: Path) -> None:
 
     tree = FolderTree()
     controller = FolderController(FolderModel(), tree)
-    controller.load_initial_tree(root)
+    _load_tree(qt_app, controller, root)
 
     created_file = controller._apply_context_action("create_file", root)
     assert created_file is not None
@@ -163,7 +186,7 @@ def test_handle_rename_file_updates_view(qt_app: QApplication, tmp_path: Path) -
 
     tree = FolderTree()
     controller = FolderController(FolderModel(), tree)
-    controller.load_initial_tree(root)
+    _load_tree(qt_app, controller, root)
 
     controller._prompt_new_name = lambda _: "renamed.txt"  # type: ignore[assignment]
 
@@ -191,7 +214,7 @@ def test_handle_rename_directory_updates_children(qt_app: QApplication, tmp_path
 
     tree = FolderTree()
     controller = FolderController(FolderModel(), tree)
-    controller.load_initial_tree(root)
+    _load_tree(qt_app, controller, root)
 
     controller._prompt_new_name = lambda _: "package"  # type: ignore[assignment]
 
@@ -207,3 +230,61 @@ def test_handle_rename_directory_updates_children(qt_app: QApplication, tmp_path
     current = tree.currentItem()
     assert current is not None
     assert current.text(0) == "main.py"
+
+
+def test_load_initial_tree_discards_superseded_scan(qt_app: QApplication, tmp_path: Path) -> None:
+    """連続して読み込んだ場合に最後のルートだけがツリーへ反映されることを検証する。"""
+    first = tmp_path / "first"
+    first.mkdir()
+    second = tmp_path / "second"
+    second.mkdir()
+
+    tree = FolderTree()
+    controller = FolderController(FolderModel(), tree)
+
+    controller.load_initial_tree(first)
+    controller.load_initial_tree(second)
+    _wait_for_scan(qt_app, controller)
+
+    assert tree.topLevelItemCount() == 1
+    root_item = tree.topLevelItem(0)
+    assert root_item is not None
+    assert root_item.text(0) == "second"
+
+
+def test_scan_releases_about_to_quit_connection(qt_app: QApplication, tmp_path: Path) -> None:
+    """走査中のみaboutToQuitへ接続し、完了後や中断後は接続を解除することを検証する。"""
+    root = tmp_path / "workspace"
+    root.mkdir()
+
+    controller = FolderController(FolderModel(), FolderTree())
+    watching: list[bool] = [controller._watching_quit]
+
+    controller.load_initial_tree(root)
+    watching.append(controller._watching_quit)
+    _wait_for_scan(qt_app, controller)
+    watching.append(controller._watching_quit)
+
+    controller.load_initial_tree(root)
+    controller.cancel_scan()
+    watching.append(controller._watching_quit)
+
+    assert watching == [False, True, False, False]
+    assert not controller._active_scans
+
+
+def test_expand_returns_one_level(qt_app: QApplication, tmp_path: Path) -> None:
+    """expandが直下の子要素のみを返し、サブディレクトリを未読込として扱うことを検証する。"""
+    root = tmp_path / "workspace"
+    (root / "pkg" / "sub").mkdir(parents=True)
+    (root / "pkg" / "sub" / "deep.py").write_text("", encoding="utf-8")
+    (root / "pkg" / "mod.py").write_text("", encoding="utf-8")
+
+    controller = FolderController(FolderModel(), FolderTree())
+
+    nodes = controller.expand(root / "pkg")
+
+    assert [node.name for node in nodes] == ["sub", "mod.py"]
+    assert nodes[0].is_lazy is True
+    assert nodes[0].children is None
+    assert nodes[1].is_lazy is False
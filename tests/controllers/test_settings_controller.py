@@ -27,11 +27,16 @@ class _StubDialog(SettingsDialog):
     ) -> None:
         super().__init__(model, parent=parent, logger=logger)
         self._executed = False
+        self.open_count = 0
 
     def exec(self) -> int:
         self._executed = True
         return SettingsDialog.DialogCode.Accepted
 
+    def open(self) -> None:
+        self.open_count += 1
+        self.done(SettingsDialog.DialogCode.Accepted)
+
     @property
     def executed(self) -> bool:
         return self._executed
@@ -103,3 +108,41 @@ def test_open_dialog_uses_factory(qt_app: QApplication) -> None:
 
     assert result is True
     assert created and created[0].executed is True
+
+
+def test_open_dialog_async_reuses_dialog(qt_app: QApplication) -> None:
+    model = _StubSettingsModel()
+
+    created: list[_StubDialog] = []
+
+    def factory(
+        settings_model: SettingsModel,
+        parent: QWidget | None = None,
+        logger: logging.Logger | None = None,
+    ) -> SettingsDialog:
+        dialog = _StubDialog(settings_model, parent=parent, logger=logger)
+        created.append(dialog)
+        return dialog
+
+    controller = SettingsController(settings_model=model, dialog_factory=factory)
+    results: list[bool] = []
+
+    controller.open_dialog_async(results.append)
+    controller.open_dialog_async(results.append)
+
+    assert results == [True, True]
+    assert len(created) == 1
+    assert created[0].open_count == 2
+
+
+def test_load_settings_clears_discarded_input(qt_app: QApplication) -> None:
+    """APIキー未保存時はキャンセル前の入力を再表示時に残さないことを確認する。"""
+    model = _StubSettingsModel()
+    model._api_key = None
+    controller = SettingsController(settings_model=model)
+    dialog = SettingsDialog(model)
+    dialog.api_key_input.setText("discarded")
+
+    controller.load_settings_into_dialog(dialog)
+
+    assert dialog.api_key_input.text() == ""
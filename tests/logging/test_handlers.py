@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import io
+import json
 import logging
 from typing import Any
 
 import pytest
 
-from app_logging.handlers import attach_gui_handler, log_user_action
+from app_logging.handlers import attach_gui_handler, log_user_action, start_queue_handler
 
 
 class DummyStatusBar:
@@ -52,7 +53,7 @@ def test_attach_gui_handler_emits_to_status_bar() -> None:
 
     assert status_bar.messages
     message, timeout = status_bar.messages[-1]
-    assert "テストメッセージ" in message
+    assert message == "INFO: テストメッセージ"
     assert timeout == 3000
 
 
@@ -75,6 +76,78 @@ def test_log_user_action_outputs_structured_json() -> None:
         logger.removeHandler(stream_handler)
         stream_handler.close()
 
-    assert '"action": "open_file"' in output
-    assert '"path": "sample.py"' in output
-    assert '"success": true' in output
+    assert json.loads(output) == {"action": "open_file", "detail": {"path": "sample.py", "success": True}}
+    assert '"action":"open_file"' in output
+
+
+def test_log_user_action_without_detail_matches_json() -> None:
+    logger = logging.getLogger("my_editor.user_action")
+    _clear_logger(logger)
+
+    stream = io.StringIO()
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(stream_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    try:
+        log_user_action("file_open")
+        log_user_action('quote"action')
+        stream_handler.flush()
+        lines = stream.getvalue().splitlines()
+    finally:
+        logger.removeHandler(stream_handler)
+        stream_handler.close()
+
+    assert lines[0] == '{"action":"file_open","detail":{}}'
+    assert json.loads(lines[1]) == {"action": 'quote"action', "detail": {}}
+
+
+def test_log_user_action_text_format() -> None:
+    logger = logging.getLogger("my_editor.user_action")
+    _clear_logger(logger)
+
+    stream = io.StringIO()
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(stream_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    try:
+        log_user_action("open_file", {"file": "a.py", "title": "my file", "success": True}, fmt="text")
+        stream_handler.flush()
+        output = stream.getvalue().strip()
+    finally:
+        logger.removeHandler(stream_handler)
+        stream_handler.close()
+
+    assert output == 'action=open_file file=a.py title="my file" success=true'
+
+
+def test_log_user_action_rejects_unknown_format() -> None:
+    with pytest.raises(ValueError):
+        log_user_action("open_file", fmt="xml")
+
+
+def test_queue_handler_flush_waits_without_restarting_listener() -> None:
+    """flushがリスナースレッドを再起動せずに滞留レコードの出力完了を待つことを検証する。"""
+    stream = io.StringIO()
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    handler = start_queue_handler(stream_handler)
+    logger = logging.getLogger("my_editor.test.queue_flush")
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        thread = handler._listener._thread  # type: ignore[attr-defined]
+        logger.warning("1件目")
+        logger.warning("2件目")
+        handler.flush()
+
+        assert stream.getvalue().splitlines() == ["1件目", "2件目"]
+        assert handler._listener._thread is thread  # type: ignore[attr-defined]
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
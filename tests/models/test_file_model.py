@@ -60,3 +60,38 @@ def test_load_file_fallback_encoding(tmp_path: Path) -> None:
 
     assert content == "fallback text"
     assert target.resolve() in set(model.list_open_files())
+
+
+def test_save_file_overwrites_in_place(tmp_path: Path) -> None:
+    """保存が既存ファイルをその場で上書きし、権限とハードリンクを保つことを確認する。"""
+    target_file = tmp_path / "existing.txt"
+    target_file.write_text("before", encoding="utf-8")
+    target_file.chmod(0o640)
+    linked_file = tmp_path / "linked.txt"
+    linked_file.hardlink_to(target_file)
+    expected_mode = target_file.stat().st_mode
+
+    FileModel().save_file(target_file, "after")
+
+    assert linked_file.read_text(encoding="utf-8") == "after"
+    assert target_file.stat().st_mode == expected_mode
+    assert sorted(entry.name for entry in tmp_path.iterdir()) == ["existing.txt", "linked.txt"]
+
+
+def test_save_document_streams_blocks(tmp_path: Path) -> None:
+    """save_documentがブロック単位でtoPlainTextと同じ内容を書き出すことを確認する。"""
+    QtGui = pytest.importorskip("PySide6.QtGui")
+    document = QtGui.QTextDocument()
+    document.setPlainText("first\nsecond\n\nlast")
+    # Shift+Enterの行区切りとノーブレークスペースもtoPlainTextと同じく変換されることを確認する。
+    cursor = QtGui.QTextCursor(document)
+    cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+    cursor.insertText("\u2028tail\u00a0end")
+
+    target_file = tmp_path / "document.txt"
+    model = FileModel()
+    model.save_document(target_file, document)
+
+    assert target_file.read_text(encoding="utf-8") == document.toPlainText()
+    assert target_file.read_text(encoding="utf-8").endswith("last\ntail end")
+    assert target_file.resolve() in model.list_open_files()
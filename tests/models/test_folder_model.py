@@ -83,3 +83,25 @@ def test_list_directory_missing_path_raises(tmp_path: Path) -> None:
 
     with pytest.raises(FileOperationError):
         model.list_directory(tmp_path / "missing")
+
+
+def test_scan_directory_reports_entry_types(tmp_path: Path) -> None:
+    """scan_directoryがエントリごとのディレクトリ判定を返すことを検証する。"""
+    (tmp_path / "a_dir").mkdir()
+    (tmp_path / "b_file.txt").write_text("b", encoding="utf-8")
+
+    model = FolderModel()
+
+    entries = {entry.path.name: entry for entry in model.scan_directory(tmp_path)}
+    assert set(entries) == {"a_dir", "b_file.txt"}
+    assert entries["a_dir"].is_directory is True
+    assert entries["b_file.txt"].is_directory is False
+    assert entries["b_file.txt"].is_symlink is False
+
+
+def test_scan_directory_missing_path_raises(tmp_path: Path) -> None:
+    """存在しないディレクトリを走査するとFileOperationErrorになることを検証する。"""
+    model = FolderModel()
+
+    with pytest.raises(FileOperationError):
+        model.scan_directory(tmp_path / "missing")
@@ -71,3 +71,28 @@ def test_update_path_changes_file_path(tmp_path: Path) -> None:
     state.update_path(tab_id, new_path)
 
     assert state.get_file_path(tab_id) == new_path.resolve()
+
+
+def test_count_tracks_open_tabs(tmp_path: Path) -> None:
+    """countがタブの追加とクローズに追従することを検証する。"""
+    state = TabState()
+    assert state.count == 0
+
+    first = state.add_tab(tmp_path / "a.txt")
+    state.add_tab(tmp_path / "b.txt")
+    assert state.count == 2
+
+    state.close_tab(first)
+    assert state.count == 1
+
+
+def test_apply_saved_updates_path_and_clears_dirty(tmp_path: Path) -> None:
+    """apply_savedでパス更新とダーティ解除がまとめて行われることを検証する。"""
+    state = TabState()
+    tab_id = state.add_tab(tmp_path / "before.txt")
+    state.mark_dirty(tab_id, True)
+
+    state.apply_saved(tab_id, tmp_path / "after.txt")
+
+    assert state.get_file_path(tab_id) == (tmp_path / "after.txt").resolve()
+    assert state.is_dirty(tab_id) is False
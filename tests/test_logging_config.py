@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+import re
+from logging.handlers import QueueHandler
 from pathlib import Path
 
 import pytest
@@ -42,6 +44,24 @@ def test_setup_logging_creates_file(tmp_path: Path) -> None:
     _cleanup_logger_handlers("my_editor")
 
 
+def test_setup_logging_uses_queue_handler(tmp_path: Path) -> None:
+    """ロガーにはキューハンドラのみが追加され、クローズ時に滞留分が書き出されることを検証する。
+
+    Args:
+        tmp_path (Path): Pytestの一時ディレクトリ。
+    """
+    log_file = tmp_path / "queued.log"
+    logger = setup_logging(log_path=log_file)
+
+    assert len(logger.handlers) == 1
+    assert isinstance(logger.handlers[0], QueueHandler)
+
+    logger.info("キュー経由のメッセージ")
+    _cleanup_logger_handlers("my_editor")
+
+    assert "キュー経由のメッセージ" in log_file.read_text(encoding="utf-8")
+
+
 def test_setup_logging_rejects_invalid_retention(tmp_path: Path) -> None:
     """不正な保持日数を指定した場合に例外が発生することを検証する。
 
@@ -57,3 +77,37 @@ def test_setup_logging_rejects_invalid_retention(tmp_path: Path) -> None:
 
     # 副作用を防ぐためにロガーハンドラを後処理する。
     _cleanup_logger_handlers("my_editor")
+
+
+def test_setup_logging_formats_timestamp(tmp_path: Path) -> None:
+    """同一秒内の複数レコードでも時刻が既定の書式で出力されることを検証する。
+
+    Args:
+        tmp_path (Path): Pytestの一時ディレクトリ。
+    """
+    log_file = tmp_path / "timestamp.log"
+    logger = setup_logging(log_path=log_file)
+
+    logger.info("1件目")
+    logger.info("2件目")
+    _cleanup_logger_handlers("my_editor")
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    for line in lines:
+        assert re.match(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} \[INFO\] my_editor - ", line)
+
+
+def test_setup_logging_delays_file_creation(tmp_path: Path) -> None:
+    """ログを出力するまではファイルを作成しないことを検証する。
+
+    Args:
+        tmp_path (Path): Pytestの一時ディレクトリ。
+    """
+    log_file = tmp_path / "nested" / "delayed.log"
+    setup_logging(log_path=log_file)
+
+    assert log_file.parent.is_dir()
+    assert not log_file.exists()
+
+    _cleanup_logger_handlers("my_editor")
@@ -53,7 +53,9 @@ def test_main_creates_app(tmp_path: Path) -> None:
     # 正常終了コードを確認する。
     assert exit_code == 0
 
-    # ログファイルが作成されていることを確認する。
+    # ファイルは最初の書き込み時に開かれるため、滞留したログを書き出してから確認する。
+    for handler in logging.getLogger("my_editor").handlers:
+        handler.flush()
     assert log_file.exists()
 
     # QApplicationインスタンスが生成されていることを確認する。
@@ -106,14 +108,15 @@ def test_exception_hook_logs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) ->
             captured["shown"] = True
             return 0
 
-    monkeypatch.setattr("main.QMessageBox", DummyMessageBox)
+    # mainは例外発生時にPySide6から読み込むため、読み込み元のモジュールを差し替える。
+    monkeypatch.setattr("PySide6.QtWidgets.QMessageBox", DummyMessageBox)
 
     # QApplicationインスタンスを確実に用意する。
-    if QApplication.instance() is None:
-        QApplication([])
+    app = QApplication.instance() or QApplication([])
+    assert isinstance(app, QApplication)
 
     # 例外ハンドラをインストールしてテスト用に実行する。
-    previous_hook = install_exception_hook(logger)
+    previous_hook = install_exception_hook(logger, app)
     try:
         raise RuntimeError("テスト例外")
     except RuntimeError:
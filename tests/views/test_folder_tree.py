@@ -29,10 +29,10 @@ def _build_nodes(base: Path) -> Iterable[FolderNode]:
             name="src",
             path=base / "src",
             is_directory=True,
-            children=[
+            children=(
                 FolderNode(name="main.py", path=base / "src" / "main.py", is_directory=False),
                 FolderNode(name="utils", path=base / "src" / "utils", is_directory=True),
-            ],
+            ),
         ),
         FolderNode(name="README.md", path=base / "README.md", is_directory=False),
     ]
@@ -96,3 +96,33 @@ def test_rename_path_updates_tree(qt_app: QApplication, tmp_path: Path) -> None:
     assert second_item.text(0) == "CHANGELOG.md"
 
     tree.select_path(renamed)
+
+
+def test_current_path_returns_resolved_path(qt_app: QApplication, tmp_path: Path) -> None:
+    """current_pathが構築時に格納した正規化済みパスを返すことを検証する。"""
+    tree = FolderTree()
+    tree.populate(_build_nodes(tmp_path / "src" / ".."))
+
+    tree.select_path(tmp_path / "README.md")
+
+    assert tree.current_path() == (tmp_path / "README.md").resolve()
+
+
+def test_lazy_node_loads_children_on_select(qt_app: QApplication, tmp_path: Path) -> None:
+    """未読込ノード配下のパスを選択すると展開ハンドラから子要素が読み込まれることを検証する。"""
+    tree = FolderTree()
+    requested: list[Path] = []
+
+    def expand_handler(path: Path) -> list[FolderNode]:
+        requested.append(path)
+        return [FolderNode(name="main.py", path=path / "main.py", is_directory=False)]
+
+    tree.set_expand_handler(expand_handler)
+    tree.populate([FolderNode(name="src", path=tmp_path / "src", is_directory=True, is_lazy=True)])
+
+    tree.select_path(tmp_path / "src" / "main.py")
+
+    assert requested == [(tmp_path / "src").resolve()]
+    current = tree.currentItem()
+    assert current is not None
+    assert current.text(0) == "main.py"
@@ -37,9 +37,11 @@ def fixture_main_window(qt_app: QApplication) -> Generator[MainWindow, None, Non
 
 def test_main_window_builds_layout(main_window: MainWindow) -> None:
     """レイアウトが構築され主要ウィジェットが存在することを検証する。"""
-    splitter = main_window.centralWidget().findChild(QSplitter, "mainSplitter")
+    central_widget = main_window.centralWidget()
+    assert central_widget is not None
+    splitter = central_widget.findChild(QSplitter, "mainSplitter")
     assert splitter is not None
-    editor_splitter = main_window.centralWidget().findChild(QSplitter, "editorSplitter")
+    editor_splitter = central_widget.findChild(QSplitter, "editorSplitter")
     assert editor_splitter is not None
 
     folder = main_window.folder_view
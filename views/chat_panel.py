@@ -137,6 +137,11 @@ class ChatPanel(QWidget):
         joined = ", ".join(path.name for path in self._attachment_paths)
         return f"添付ファイル: {joined}"
 
+    def set_busy(self, busy: bool) -> None:
+        """AI応答を待つ間は送信と編集のボタンを無効化し、リクエストの重複を防ぐ。"""
+        self._request_button.setEnabled(not busy)
+        self._edit_button.setEnabled(not busy)
+
     def set_input_text(self, text: str) -> None:
         """入力欄の内容を指定テキストに更新する。"""
         self._input_field.setPlainText(text)
@@ -12,19 +12,29 @@ from PySide6.QtWidgets import QAbstractItemView, QMenu, QTreeWidget, QTreeWidget
 from exceptions import FileOperationError
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FolderNode:
-    """フォルダ構造を表すノード情報。"""
+    """フォルダ構造を表すノード情報。
+
+    走査結果として大量に生成されるため、スロット化した不変オブジェクトとし子要素もタプルで保持する。
+    """
 
     name: str
     path: Path
     is_directory: bool
-    children: Iterable["FolderNode"] | None = None
+    children: tuple["FolderNode", ...] | None = None
+    # Trueの場合は子要素が未読込で、展開時に読み込むディレクトリであることを表す。
+    is_lazy: bool = False
 
 
 class FolderTree(QTreeWidget):
     """フォルダ階層を表示するツリービュー。"""
 
+    # 正規化済みのPathを保持するデータロール。選択のたびにresolve()しないよう構築時に格納する。
+    RESOLVED_PATH_ROLE = Qt.ItemDataRole.UserRole + 2
+    # 子要素を未読込のディレクトリであることを示すデータロール。
+    LAZY_ROLE = Qt.ItemDataRole.UserRole + 3
+
     def __init__(self, parent: Optional[QWidget] = None, *, logger: Optional[logging.Logger] = None) -> None:
         super().__init__(parent)
         self._logger = logger or logging.getLogger("my_editor.folder_tree")
@@ -34,9 +44,11 @@ class FolderTree(QTreeWidget):
         self.setIndentation(18)
         self._path_item_map: dict[Path, QTreeWidgetItem] = {}
         self._context_handler: Callable[[str, Path], Optional[Path]] | None = None
+        self._expand_handler: Callable[[Path], Iterable[FolderNode]] | None = None
 
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
+        self.itemExpanded.connect(self._handle_item_expanded)
 
     def populate(self, nodes: Iterable[FolderNode]) -> None:
         """与えられたノード情報からツリーデータを構築する。"""
@@ -53,6 +65,7 @@ class FolderTree(QTreeWidget):
     def select_path(self, path: Path) -> None:
         """指定パスのアイテムを選択状態にする。"""
         normalized = path.expanduser().resolve(strict=False)
+        self._reveal(normalized)
         if normalized not in self._path_item_map:
             raise FileOperationError(f"パスがツリー内に存在しません: {normalized}")
 
@@ -68,26 +81,99 @@ class FolderTree(QTreeWidget):
         item.setData(0, Qt.ItemDataRole.UserRole, str(node.path))
         item.setData(0, Qt.ItemDataRole.UserRole + 1, node.is_directory)
 
-        self._path_item_map[node.path.resolve(strict=False)] = item
+        resolved = node.path.resolve(strict=False)
+        item.setData(0, self.RESOLVED_PATH_ROLE, resolved)
+        self._path_item_map[resolved] = item
 
-        for child in node.children or []:
+        if node.is_lazy:
+            # 子要素は展開時に読み込むため、展開矢印だけを表示しておく。
+            item.setData(0, self.LAZY_ROLE, True)
+            item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+            return item
+
+        for child in node.children or ():
             item.addChild(self._create_item(child))
 
         return item
 
+    def set_expand_handler(self, handler: Callable[[Path], Iterable[FolderNode]]) -> None:
+        """未読込のディレクトリを展開した際に子ノードを返すハンドラを登録する。"""
+        self._expand_handler = handler
+
+    def replace_children(self, path: Path, nodes: Iterable[FolderNode]) -> None:
+        """指定ディレクトリ直下の子ノードを差し替える。"""
+        normalized = path.expanduser().resolve(strict=False)
+        item = self._path_item_map.get(normalized)
+        if item is None:
+            raise FileOperationError(f"再読み込み対象がツリーに存在しません: {normalized}")
+
+        while item.childCount() > 0:
+            child = item.takeChild(0)
+            if child is not None:
+                self._remove_item_recursive(child)
+
+        self._attach_children(item, nodes)
+
+    def _handle_item_expanded(self, item: QTreeWidgetItem) -> None:
+        """展開されたアイテムが未読込であれば子要素を読み込む。"""
+        if item.data(0, self.LAZY_ROLE):
+            self._load_children(item)
+
+    def _load_children(self, item: QTreeWidgetItem) -> None:
+        """展開ハンドラから子ノードを取得し、未読込のアイテムへ追加する。"""
+        handler = self._expand_handler
+        path = self._resolved_path_of(item)
+        if handler is None or path is None:
+            return
+
+        try:
+            nodes = handler(path)
+        except FileOperationError as exc:
+            self._logger.warning("子要素の読み込みに失敗しました: %s", path, exc_info=exc)
+            return
+
+        self._attach_children(item, nodes)
+
+    def _attach_children(self, item: QTreeWidgetItem, nodes: Iterable[FolderNode]) -> None:
+        """読み込み済みとして子ノードを追加する。ノードは並び替え済みである前提とする。"""
+        item.setData(0, self.LAZY_ROLE, False)
+        item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicatorWhenChildless)
+        for node in nodes:
+            item.addChild(self._create_item(node))
+
+    def _reveal(self, path: Path) -> None:
+        """パスの祖先のうち未読込のディレクトリを上から順に読み込む。"""
+        if path in self._path_item_map:
+            return
+
+        for ancestor in reversed(path.parents):
+            item = self._path_item_map.get(ancestor)
+            if item is not None and item.data(0, self.LAZY_ROLE):
+                self._load_children(item)
+
     def add_node(self, parent_path: Path, node: FolderNode) -> None:
         """指定パス配下にノードを追加する。"""
         normalized_parent = parent_path.expanduser().resolve(strict=False)
+        self._reveal(normalized_parent)
         parent_item = self._path_item_map.get(normalized_parent)
         if parent_item is None:
             raise FileOperationError(f"親ノードが存在しません: {normalized_parent}")
 
+        if parent_item.data(0, self.LAZY_ROLE):
+            # 親が未読込の場合は展開時にファイルシステムから読み込まれるため追加しない。
+            return
+        if node.path.resolve(strict=False) in self._path_item_map:
+            # 親の読み込みで既に取り込まれている場合は二重に追加しない。
+            return
+
         new_item = self._create_item(node)
         new_key = self._sort_key(node.is_directory, node.name)
 
         insert_index = parent_item.childCount()
         for index in range(parent_item.childCount()):
             child = parent_item.child(index)
+            if child is None:
+                continue
             child_is_dir = bool(child.data(0, Qt.ItemDataRole.UserRole + 1))
             child_key = self._sort_key(child_is_dir, child.text(0))
             if new_key < child_key:
@@ -99,6 +185,7 @@ class FolderTree(QTreeWidget):
     def remove_path(self, path: Path) -> None:
         """指定パスのノードをツリーから削除する。"""
         normalized = path.expanduser().resolve(strict=False)
+        self._reveal(normalized)
         target_item = self._path_item_map.get(normalized)
         if target_item is None:
             raise FileOperationError(f"削除対象がツリーに存在しません: {normalized}")
@@ -118,15 +205,25 @@ class FolderTree(QTreeWidget):
 
     def _remove_item_recursive(self, item: QTreeWidgetItem) -> None:
         """ノードとその子孫をマップから再帰的に削除する。"""
-        data = item.data(0, Qt.ItemDataRole.UserRole)
-        if isinstance(data, str):
-            normalized = Path(data).expanduser().resolve(strict=False)
+        normalized = self._resolved_path_of(item)
+        if normalized is not None:
             self._path_item_map.pop(normalized, None)
 
         while item.childCount() > 0:
-            child = item.child(0)
-            item.takeChild(0)
-            self._remove_item_recursive(child)
+            child = item.takeChild(0)
+            if child is not None:
+                self._remove_item_recursive(child)
+
+    def _resolved_path_of(self, item: QTreeWidgetItem) -> Optional[Path]:
+        """アイテムに格納済みの正規化パスを返す。未格納の場合は文字列データから解決する。"""
+        resolved = item.data(0, self.RESOLVED_PATH_ROLE)
+        if isinstance(resolved, Path):
+            return resolved
+
+        data = item.data(0, Qt.ItemDataRole.UserRole)
+        if isinstance(data, str):
+            return Path(data).expanduser().resolve(strict=False)
+        return None
 
     @staticmethod
     def _sort_key(is_directory: bool, name: str) -> tuple[int, str]:
@@ -139,10 +236,14 @@ class FolderTree(QTreeWidget):
 
     def current_path(self) -> Optional[Path]:
         """現在選択されているアイテムのパスを返す。"""
-        item = cast(Optional[QTreeWidgetItem], self.currentItem())
+        item = self.currentItem()
         if item is None:
             return None
 
+        resolved = item.data(0, self.RESOLVED_PATH_ROLE)
+        if isinstance(resolved, Path):
+            return resolved
+
         data = item.data(0, Qt.ItemDataRole.UserRole)
         if isinstance(data, str):
             return Path(data)
@@ -155,9 +256,9 @@ class FolderTree(QTreeWidget):
             self._logger.debug("コンテキストメニューのハンドラが未設定です。")
             return
 
-        item = cast(Optional[QTreeWidgetItem], self.itemAt(position))
+        item = self.itemAt(position)
         if item is None:
-            current_item = cast(Optional[QTreeWidgetItem], self.currentItem())
+            current_item = self.currentItem()
             if current_item is None:
                 self._logger.debug("コンテキストメニューを表示できる項目が選択されていません。")
                 return
@@ -201,6 +302,7 @@ class FolderTree(QTreeWidget):
     def rename_path(self, old_path: Path, new_path: Path) -> None:
         """既存ノードのパスと表示名を更新する。"""
         normalized_old = old_path.expanduser().resolve(strict=False)
+        self._reveal(normalized_old)
         item = self._path_item_map.get(normalized_old)
         if item is None:
             raise FileOperationError(f"リネーム対象がツリーに存在しません: {normalized_old}")
@@ -209,6 +311,7 @@ class FolderTree(QTreeWidget):
         display_name = normalized_new.name or str(normalized_new)
         item.setText(0, display_name)
         item.setData(0, Qt.ItemDataRole.UserRole, str(normalized_new))
+        item.setData(0, self.RESOLVED_PATH_ROLE, normalized_new)
         self._path_item_map.pop(normalized_old, None)
         self._path_item_map[normalized_new] = item
 
@@ -222,11 +325,12 @@ class FolderTree(QTreeWidget):
         """子要素のパス情報を再帰的に更新する。"""
         for index in range(item.childCount()):
             child = item.child(index)
-            data = child.data(0, Qt.ItemDataRole.UserRole)
-            if not isinstance(data, str):
+            if child is None:
+                continue
+            old_child_path = self._resolved_path_of(child)
+            if old_child_path is None:
                 continue
 
-            old_child_path = Path(data).expanduser().resolve(strict=False)
             try:
                 relative = old_child_path.relative_to(old_base)
             except ValueError:
@@ -234,6 +338,7 @@ class FolderTree(QTreeWidget):
 
             new_child_path = new_base / relative
             child.setData(0, Qt.ItemDataRole.UserRole, str(new_child_path))
+            child.setData(0, self.RESOLVED_PATH_ROLE, new_child_path)
             self._path_item_map.pop(old_child_path, None)
             self._path_item_map[new_child_path] = child
 
@@ -242,7 +347,7 @@ class FolderTree(QTreeWidget):
 
     def _reinsert_sorted(self, item: QTreeWidgetItem) -> None:
         """リネーム後にノードをソート順へ差し戻す。"""
-        parent_item = cast(Optional[QTreeWidgetItem], item.parent())
+        parent_item = item.parent()
         if parent_item is None:
             index = self.indexOfTopLevelItem(item)
             if index >= 0:
@@ -278,7 +383,7 @@ class FolderTree(QTreeWidget):
 
         insert_index = parent_item.childCount()
         for current_index in range(parent_item.childCount()):
-            current_item = cast(Optional[QTreeWidgetItem], parent_item.child(current_index))
+            current_item = parent_item.child(current_index)
             if current_item is None:
                 continue
             current_is_dir = bool(current_item.data(0, Qt.ItemDataRole.UserRole + 1))
@@ -12,6 +12,7 @@ from views.chat_panel import ChatPanel
 class MainWindow(QMainWindow):
     """アプリケーションのメインウィンドウ。"""
 
+    # チャット系シグナルは前後の空白を除去した非空の文字列のみを通知する。
     chat_submitted = Signal(str)
     chat_edit_requested = Signal(str)
     chat_attachment_requested = Signal()
@@ -108,21 +109,16 @@ class MainWindow(QMainWindow):
         file_menu.addAction(self._action_open_settings)
 
     def _handle_chat_submit(self, message: str) -> None:
-        """チャット入力の送信要求を処理する。"""
-        text = message.strip()
-        if not text:
-            self.statusBar().showMessage("チャットエラー: メッセージを入力してください。", 3000)
-            return
-
+        """チャット入力の送信要求を処理する。ChatPanelは空白除去済みの非空文字列のみ通知する。"""
         summary = self._chat_panel.attachment_summary()
-        display_text = f"{text}\n{summary}" if summary else text
+        display_text = f"{message}\n{summary}" if summary else message
 
         self._chat_panel.append_user_message(display_text)
-        status = f"チャット送信: {text}"
+        status = f"チャット送信: {message}"
         if summary:
             status = f"{status} ({summary})"
         self.statusBar().showMessage(status, 2000)
-        self.chat_submitted.emit(text)
+        self.chat_submitted.emit(message)
 
     def show_chat_response(self, response: str) -> None:
         """AIからの応答メッセージを表示する。"""
@@ -140,24 +136,19 @@ class MainWindow(QMainWindow):
         self.chat_attachment_requested.emit()
 
     def _handle_chat_edit_request(self, message: str) -> None:
-        """チャット編集リクエストを処理する。"""
-        text = message.strip()
-        if not text:
-            self.statusBar().showMessage("チャットエラー: メッセージを入力してください。", 3000)
-            return
-
+        """チャット編集リクエストを処理する。ChatPanelは空白除去済みの非空文字列のみ通知する。"""
         summary = self._chat_panel.attachment_summary()
         if not summary:
-            self._chat_panel.set_input_text(text)
+            self._chat_panel.set_input_text(message)
             self.statusBar().showMessage("チャットエラー: 添付ファイルを選択してください。", 5000)
             return
 
-        display_text = f"{text}\n{summary}"
+        display_text = f"{message}\n{summary}"
         self._chat_panel.append_user_message(display_text)
 
-        status = f"チャット編集送信: {text} ({summary})"
+        status = f"チャット編集送信: {message} ({summary})"
         self.statusBar().showMessage(status, 2000)
-        self.chat_edit_requested.emit(text)
+        self.chat_edit_requested.emit(message)
 
     @property
     def folder_view(self) -> FolderTree: